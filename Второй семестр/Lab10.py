@@ -1,11 +1,113 @@
-from typing import List
+from typing import Generator, Iterable, List, Optional, Tuple
+
+
+def floors_covered(eggs: int, throws: int, cap: Optional[int] = None) -> int:
+    """
+    Сколько этажей можно гарантированно проверить с eggs яйцами за throws бросков.
+
+    Из рекуррентности f(k, m) = f(k - 1, m - 1) + f(k, m - 1) + 1 следует
+    f(k, m) = C(m, 1) + C(m, 2) + ... + C(m, k): сумма считается за O(k) умножений,
+    каждое следующее биномиальное число — из предыдущего.
+
+    Аргументы:
+        eggs (int): Количество яиц.
+        throws (int): Количество бросков.
+        cap (Optional[int]): Если сумма достигла cap, счёт прекращается (числа не растут зря).
+
+    Возвращает:
+        int: Число этажей (не меньше cap, если cap достигнут).
+    """
+    total, term = 0, 1
+    for i in range(1, min(eggs, throws) + 1):
+        term = term * (throws - i + 1) // i  # C(throws, i)
+        total += term
+        if cap is not None and total >= cap:
+            break
+    return total
+
+
+def min_throws(eggs: int, floors: int) -> int:
+    """
+    Минимальное число бросков в худшем случае — двоичным поиском по числу бросков m.
+
+    При eggs >= floors.bit_length() яиц хватает на обычный двоичный поиск, и дополнительные
+    яйца ответ не меняют, поэтому k ограничивается этим числом: проверка стоит
+    O(min(k, log n)), весь поиск — O(min(k, log n) · log n) операций с числами.
+
+    Возвращает:
+        int: Число бросков; -1, если яиц нет, а этажи есть.
+    """
+    if floors <= 0:
+        return 0
+    if eggs <= 0:
+        return -1
+    eggs = min(eggs, floors.bit_length())
+    if eggs == 1:
+        return floors
+
+    # Экспоненциальный поиск верхней границы, затем двоичный
+    low, high = 0, 1
+    while floors_covered(eggs, high, floors) < floors:
+        low, high = high, high * 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        if floors_covered(eggs, middle, floors) >= floors:
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def min_throws_many(queries: Iterable[Tuple[int, int]]) -> List[int]:
+    """
+    Ответы на пачку запросов (яйца, этажи); повторяющиеся запросы считаются один раз.
+    """
+    cache = {}
+    answers = []
+    for query in queries:
+        if query not in cache:
+            cache[query] = min_throws(*query)
+        answers.append(cache[query])
+    return answers
+
+
+def drop_strategy(eggs: int, floors: int) -> Generator[int, Optional[bool], int]:
+    """
+    Оптимальная стратегия бросков в виде генератора.
+
+    Генератор выдаёт этаж очередного броска; результат броска передаётся через
+    send(True), если яйцо разбилось, и next() / send(False), если нет. Обычный цикл for
+    поэтому перебирает броски «пока яйцо цело». По окончании StopIteration.value —
+    найденный критический этаж (самый высокий этаж, с которого яйцо не бьётся; 0 — бьётся с первого).
+
+    С k яйцами и m бросками в запасе бросок делается с этажа на f(k - 1, m - 1) + 1 выше
+    последнего безопасного: если яйцо разобьётся, остаток проверяется оставшимися
+    k - 1 яйцами за m - 1 бросков. Каждый шаг — O(k), память O(1).
+    """
+    throws = min_throws(eggs, floors)
+    if throws < 0:
+        raise ValueError("At least one egg is required")
+    eggs = min(eggs, max(floors.bit_length(), 1))
+    safe, broken = 0, floors + 1  # Наивысший безопасный и наинизший опасный известные этажи
+
+    while broken - safe > 1:
+        floor = min(safe + floors_covered(eggs - 1, throws - 1) + 1, broken - 1)
+        throws -= 1
+        if (yield floor):
+            broken = floor
+            eggs -= 1
+        else:
+            safe = floor
+    return safe
+
 
 def egg_drop(eggs: int, floors: int) -> int:
     """
     Решает задачу о минимальном количестве бросков яиц (egg drop problem).
 
-    Цель: найти минимальное число попыток (бросков), необходимых для определения 
+    Цель: найти минимальное число попыток (бросков), необходимых для определения
     критического этажа F, при котором яйцо разбивается, используя заданное количество яиц.
+    Сама стратегия бросков — генератор drop_strategy.
 
     Аргументы:
         eggs (int): Количество доступных яиц.
@@ -14,43 +116,20 @@ def egg_drop(eggs: int, floors: int) -> int:
     Возвращает:
         int: Минимальное количество бросков, необходимое для нахождения критического этажа.
     """
-    # dp[k][m] — максимальное число этажей, которые можно проверить с k яйцами за m бросков
-    dp = [[0] * (floors + 1) for _ in range(eggs + 1)]
-
-    # Если только одно яйцо — нужно проверять каждый этаж по порядку
-    for m in range(1, floors + 1):
-        dp[1][m] = m
+    return min_throws(eggs, floors)
 
-    # Динамическое программирование для заполнения таблицы
-    for k in range(2, eggs + 1):
-        for m in range(1, floors + 1):
-            dp[k][m] = dp[k - 1][m - 1] + dp[k][m - 1] + 1
-
-    # Найдём минимальное число бросков, при котором можно покрыть все этажи
-    min_throws = -1
-    for m in range(1, floors + 1):
-        if dp[eggs][m] >= floors:
-            min_throws = m
-            break
 
-    # Опционально: вывод стратегии бросков
-    if min_throws != -1:
-        print("Strategy of drops:")
-        remaining_throws = min_throws
-        current_floor = 0
-        step = dp[eggs - 1][remaining_throws - 1] + 1
-
-        while remaining_throws > 0:
-            current_floor += step
-            remaining_throws -= 1
-            if current_floor >= floors:
-                print(f"Drop from floor: {floors}")
-                break
-            print(f"Drop from floor: {current_floor}")
-            step = dp[eggs - 1][remaining_throws - 1] + 1
-
-    return min_throws
+if __name__ == "__main__":
+    print("Minimum number of throws:", egg_drop(2, 100))  # Ожидается: 14
+    print("Strategy of drops:", list(drop_strategy(2, 100)))
 
+    # Интерактивная стратегия: критический этаж 57
+    strategy = drop_strategy(2, 100)
+    floor = next(strategy)
+    try:
+        while True:
+            floor = strategy.send(floor > 57)
+    except StopIteration as stop:
+        print("Critical floor found:", stop.value)  # Ожидается: 57
 
-if __name__ == "__main__":
-    print("Minimum number of throws:", egg_drop(2, 100))  # Ожидается: 14
\ No newline at end of file
+    print(min_throws_many([(2, 10 ** 9), (3, 10 ** 18), (64, 10 ** 18), (1, 10 ** 6)]))
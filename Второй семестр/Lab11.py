@@ -1,64 +1,505 @@
-from typing import Dict, List, Optional, Literal
+import heapq
+import multiprocessing
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from typing import Dict, List, NamedTuple, Optional, Sequence
 
-def can_color(graph: Dict[int, List[int]], k: int) -> Optional[Dict[int, int]]:
+
+class _Graph:
+    """
+    Граф с вершинами 0..n-1: списки смежности и битовые маски соседей (int Python).
+
+    Смежность симметризуется, петли отбрасываются; вершины, встречающиеся только
+    среди соседей, тоже добавляются.
+    """
+
+    def __init__(self, graph: Dict[int, List[int]]):
+        self.nodes = list(graph)
+        index = {node: i for i, node in enumerate(self.nodes)}
+        for neighbors in graph.values():
+            for node in neighbors:
+                if node not in index:
+                    index[node] = len(self.nodes)
+                    self.nodes.append(node)
+
+        self.n = len(self.nodes)
+        self.bits = [0] * self.n
+        for node, neighbors in graph.items():
+            v = index[node]
+            for neighbor in neighbors:
+                u = index[neighbor]
+                if u != v:
+                    self.bits[v] |= 1 << u
+                    self.bits[u] |= 1 << v
+        self.adj = [list(_members(bits)) for bits in self.bits]
+        self.degree = [len(neighbors) for neighbors in self.adj]
+
+    def to_dict(self, colors: List[int]) -> Dict[int, int]:
+        """
+        Раскраска в исходных именах вершин, цвета с 1.
+        """
+        return {node: color + 1 for node, color in zip(self.nodes, colors)}
+
+
+def _members(bits: int):
+    """
+    Номера установленных битов маски по возрастанию.
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def _lowest_free(forbidden: int) -> int:
+    """
+    Наименьший цвет, не запрещённый маской.
+    """
+    return (~forbidden & (forbidden + 1)).bit_length() - 1
+
+
+def dsatur(g: _Graph) -> List[int]:
+    """
+    Жадная раскраска DSatur (Брелаз): следующей красится вершина с наибольшим числом
+    различных цветов среди соседей (насыщенностью), при равенстве — с большей степенью.
+
+    Запрещённые цвета каждой вершины хранятся битовой маской и обновляются только
+    у соседей только что окрашенной вершины; выбор — куча с ленивым удалением устаревших
+    записей, итого O((n + m) log n).
+
+    Возвращает:
+        List[int]: Цвет каждой вершины (с 0).
+    """
+    colors = [-1] * g.n
+    forbidden = [0] * g.n
+    heap = [(0, -g.degree[v], v) for v in range(g.n)]
+    heapq.heapify(heap)
+
+    while heap:
+        saturation, _, v = heapq.heappop(heap)
+        if colors[v] >= 0 or -saturation != forbidden[v].bit_count():
+            continue  # Вершина уже окрашена или запись устарела
+        color = _lowest_free(forbidden[v])
+        colors[v] = color
+        bit = 1 << color
+        for u in g.adj[v]:
+            if colors[u] < 0 and not forbidden[u] & bit:
+                forbidden[u] |= bit
+                heapq.heappush(heap, (-forbidden[u].bit_count(), -g.degree[u], u))
+    return colors
+
+
+def _ordered_clique(g: _Graph) -> List[int]:
+    """
+    Клика из порядка максимальной мощности (maximum cardinality search).
+
+    Вершины обходятся по убыванию числа уже пройденных соседей; для каждой вершины v
+    проверяется, образуют ли v и её пройденные соседи клику. Для хордальных графов
+    (в частности, интервальных — графов конфликтов при распределении регистров) этот порядок —
+    обратный совершенному порядку исключения, и наибольшая из таких клик — максимальная.
+    На остальных графах это просто ещё один кандидат. O(n + m) операций с масками.
+    """
+    best: List[int] = []
+    weight = [0] * g.n
+    visited = 0
+    heap = [(0, v) for v in range(g.n)]
+    while heap:
+        w, v = heapq.heappop(heap)
+        if visited >> v & 1 or -w != weight[v]:
+            continue  # Вершина уже пройдена или запись устарела
+        before = g.bits[v] & visited
+        if before.bit_count() + 1 > len(best) and all(
+                g.bits[u] & before == before ^ (1 << u) for u in _members(before)):
+            best = [v, *_members(before)]
+        visited |= 1 << v
+        for u in g.adj[v]:
+            if not visited >> u & 1:
+                weight[u] += 1
+                heapq.heappush(heap, (-weight[u], u))
+    return best
+
+
+def greedy_clique(g: _Graph, tries: int = 64) -> List[int]:
+    """
+    Большая клика — нижняя оценка хроматического числа.
+
+    Кандидаты: клика из порядка максимальной мощности (_ordered_clique, точна на хордальных
+    графах) и жадное наращивание из tries вершин наибольшей степени — клика растёт добавлением
+    кандидата, у которого больше всего соседей среди оставшихся кандидатов (пересечение
+    битовых масок). Вершины со степенью меньше размера уже найденной клики не проверяются.
+    """
+    best = _ordered_clique(g)
+    for v in sorted(range(g.n), key=lambda v: -g.degree[v])[:tries]:
+        if g.degree[v] + 1 <= len(best):
+            break
+        clique, candidates = [v], g.bits[v]
+        while candidates:
+            u = max(_members(candidates), key=lambda u: (g.bits[u] & candidates).bit_count())
+            clique.append(u)
+            candidates &= g.bits[u]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+class Coloring(NamedTuple):
+    """
+    Результат раскраски.
+    """
+    count: int  # Число цветов найденной раскраски
+    colors: Dict[int, int]  # {вершина: цвет}, цвета с 1
+    lower_bound: int  # Доказанная нижняя оценка (размер клики или результат перебора)
+    optimal: bool  # count доказанно минимально
+
+
+def _constraints(g: _Graph, colors: Sequence[int]) -> tuple[List[int], int]:
+    """
+    Маски запрещённых цветов для частичной раскраски и число использованных цветов.
+    """
+    forbidden = [0] * g.n
+    for v, color in enumerate(colors):
+        if color >= 0:
+            for u in g.adj[v]:
+                forbidden[u] |= 1 << color
+    return forbidden, max(colors, default=-1) + 1
+
+
+def _select(g: _Graph, colors: Sequence[int], forbidden: List[int]) -> int:
+    """
+    Неокрашенная вершина с наибольшей насыщенностью (при равенстве — степенью); -1, если таких нет.
+    """
+    choice, key = -1, (-1, -1)
+    for v in range(g.n):
+        if colors[v] < 0:
+            current = (forbidden[v].bit_count(), g.degree[v])
+            if current > key:
+                choice, key = v, current
+    return choice
+
+
+def _branch_and_bound(g: _Graph, colors: Sequence[int], upper: int, lower: int,
+                      deadline: Optional[float], first_only: bool,
+                      shared: Optional[tuple] = None) -> tuple[Optional[array], bool]:
+    """
+    Точный перебор DSatur с отсечениями: ищет раскраску меньше чем в upper цветов.
+
+    - Очередная вершина — с наибольшей насыщенностью; её допустимые цвета — биты маски:
+      не запрещённые соседями и меньшие upper - 1, плюс ровно один новый цвет
+      (цвета взаимозаменяемы, поэтому пробовать несколько новых бессмысленно).
+    - Найдя раскраску в q цветов, поиск продолжается с upper = q; при q == lower он окончен.
+    - Перебор итеративный: состояние — массив цветов array('i'), а стек хранит вершину,
+      ещё не опробованные цвета и список соседей, которым был добавлен запрет (для отката),
+      поэтому глубина не ограничена стеком Python.
+
+    Аргументы:
+        colors: Начальная частичная раскраска (например, клика), -1 — не окрашена.
+        first_only: Остановиться на первой найденной раскраске (задача распознавания).
+        shared: (bound, stop) при параллельном переборе — общая верхняя оценка
+            multiprocessing.Value и событие остановки; при каждой проверке граница подтягивается
+            из bound, найденная раскраска записывается в неё, а stop прерывает перебор.
+
+    Время и общая оценка проверяются уже на первом узле и затем примерно через каждые
+    2^16 / n узлов (не реже чем раз в 1024): узел стоит O(n), поэтому на больших графах
+    редкая проверка заметно превышала бы time_limit.
+
+    Возвращает:
+        tuple[Optional[array], bool]: Лучшая найденная раскраска (или None) и признак
+        того, что перебор завершён (а не прерван по времени или по stop).
+    """
+    n, adj = g.n, g.adj
+    colors = array('i', colors)
+    forbidden, used = _constraints(g, colors)
+    colored = sum(color >= 0 for color in colors)
+    best = None
+    if used >= upper:
+        return None, True  # Уже использовано не меньше цветов, чем в известной раскраске
+    if colored == n:
+        return colors, True
+
+    def options(v: int) -> int:
+        return ~forbidden[v] & ((1 << min(used + 1, upper - 1)) - 1)
+
+    first = _select(g, colors, forbidden)
+    stack = [[first, options(first), None, used]]  # [вершина, цвета, изменённые соседи, used до хода]
+    nodes, next_check = 0, 0
+    period = max(1, min(1024, (1 << 16) // n))
+
+    while stack:
+        frame = stack[-1]
+        v, remaining, changed, previous_used = frame
+        if changed is not None:  # Откатываем предыдущий цвет вершины
+            bit = 1 << colors[v]
+            for u in changed:
+                forbidden[u] ^= bit
+            colors[v] = -1
+            colored -= 1
+            used = previous_used
+            frame[2] = None
+
+        remaining &= (1 << (upper - 1)) - 1  # upper мог уменьшиться
+        if not remaining:
+            stack.pop()
+            continue
+
+        nodes += 1
+        if nodes > next_check:
+            next_check = nodes + period
+            if deadline is not None and time.monotonic() > deadline:
+                return best, False
+            if shared is not None:
+                if shared[1].is_set():
+                    return best, False
+                upper = min(upper, shared[0].value)
+                remaining &= (1 << (upper - 1)) - 1
+                if not remaining:
+                    stack.pop()
+                    continue
+
+        low = remaining & -remaining
+        frame[1] = remaining ^ low
+        color = low.bit_length() - 1
+        colors[v] = color
+        colored += 1
+        used = max(used, color + 1)
+        changed = []
+        for u in adj[v]:
+            if colors[u] < 0 and not forbidden[u] & low:
+                forbidden[u] |= low
+                changed.append(u)
+        frame[2] = changed
+
+        if colored == n:
+            best, upper = colors[:], used
+            if shared is not None:
+                bound, stop = shared
+                with bound.get_lock():
+                    bound.value = min(bound.value, upper)
+                if first_only or upper <= lower:
+                    stop.set()
+            if first_only or upper <= lower:
+                return best, True
+            continue
+
+        w = _select(g, colors, forbidden)
+        allowed = options(w)
+        if allowed:
+            stack.append([w, allowed, None, used])
+
+    return best, True
+
+
+def _subproblems(g: _Graph, start: Sequence[int], upper: int,
+                 target: int) -> tuple[List[array], Optional[array]]:
+    """
+    Расщепляет верхние уровни дерева перебора на независимые подзадачи.
+
+    Уровни раскрываются целиком (вершина с наибольшей насыщенностью, все её допустимые
+    цвета), пока подзадач меньше target. Подзадача — компактный массив цветов array('i').
+
+    Возвращает:
+        tuple[List[array], Optional[array]]: Подзадачи и лучшая раскраска, если какая-то
+        ветвь оказалась полностью окрашенной уже при расщеплении.
+    """
+    layer, best = [array('i', start)], None
+    while 0 < len(layer) < target:
+        children = []
+        for colors in layer:
+            forbidden, used = _constraints(g, colors)
+            v = _select(g, colors, forbidden)
+            if v < 0:
+                if used < upper:
+                    best, upper = colors, used
+                continue
+            for color in _members(~forbidden[v] & ((1 << min(used + 1, upper - 1)) - 1)):
+                child = colors[:]
+                child[v] = color
+                children.append(child)
+        if not children:
+            return [], best
+        layer = children
+    return layer, best
+
+
+_worker_state: Optional[tuple] = None  # (граф, bound, stop) в процессе-исполнителе
+
+
+def _init_worker(g: _Graph, bound, stop) -> None:
+    global _worker_state
+    _worker_state = (g, bound, stop)
+
+
+def _solve_subproblem(colors: array, lower: int, deadline: Optional[float],
+                      first_only: bool) -> tuple[Optional[array], bool]:
+    """
+    Перебор одной подзадачи в процессе-исполнителе с текущей общей верхней оценкой.
+    """
+    g, bound, stop = _worker_state
+    if stop.is_set() or (deadline is not None and time.monotonic() > deadline):
+        return None, False
+    return _branch_and_bound(g, colors, bound.value, lower, deadline, first_only, (bound, stop))
+
+
+def _parallel_search(g: _Graph, start: Sequence[int], upper: int, lower: int,
+                     deadline: Optional[float], first_only: bool,
+                     processes: int) -> tuple[Optional[array], bool]:
+    """
+    Тот же перебор, что _branch_and_bound, на пуле процессов.
+
+    Верхние уровни дерева делятся на подзадачи (примерно по 8 на процесс — пул раздаёт
+    их по мере освобождения исполнителей, что выравнивает нагрузку). Исполнители делят
+    верхнюю оценку (multiprocessing.Value) и событие остановки: первая найденная
+    раскраска в задаче распознавания или раскраска в lower цветов останавливает всех,
+    а ещё не начатые подзадачи отменяются. То же происходит по истечении deadline:
+    запущенные подзадачи сами замечают его при ближайшей проверке времени.
+    """
+    tasks, best = _subproblems(g, start, upper, 8 * processes)
+    if best is not None:
+        upper = max(best) + 1
+        if first_only or upper <= lower:
+            return best, True
+
+    context = multiprocessing.get_context()
+    bound, stop = context.Value('i', upper), context.Event()
+    finished = True
+    with ProcessPoolExecutor(processes, mp_context=context, initializer=_init_worker,
+                             initargs=(g, bound, stop)) as pool:
+        futures = [pool.submit(_solve_subproblem, colors, lower, deadline, first_only)
+                   for colors in tasks]
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            for future in as_completed(futures, timeout):
+                if future.cancelled():
+                    finished = False
+                    continue
+                found, done = future.result()
+                finished &= done
+                if found is not None and (best is None or max(found) < max(best)):
+                    best = found
+                if stop.is_set():
+                    for pending in futures:
+                        pending.cancel()
+        except FutureTimeout:
+            finished = False
+            stop.set()
+            for pending in futures:
+                pending.cancel()
+            for future in futures:  # Запущенные подзадачи вернут лучшее найденное к моменту остановки
+                if not future.cancelled():
+                    found, _ = future.result()
+                    if found is not None and (best is None or max(found) < max(best)):
+                        best = found
+
+    # Остановка по stop тоже окончательна: найдено то, что искали
+    return best, finished or (best is not None and (first_only or max(best) + 1 <= lower))
+
+
+def _search(g: _Graph, start: Sequence[int], upper: int, lower: int, deadline: Optional[float],
+            first_only: bool, processes: Optional[int]) -> tuple[Optional[array], bool]:
+    """
+    Последовательный перебор или, при processes > 1 (0 — по числу ядер), параллельный.
+    """
+    if processes == 0:
+        processes = os.cpu_count() or 1
+    if processes is not None and processes > 1:
+        return _parallel_search(g, start, upper, lower, deadline, first_only, processes)
+    return _branch_and_bound(g, start, upper, lower, deadline, first_only)
+
+
+def color_graph(graph: Dict[int, List[int]], time_limit: Optional[float] = None,
+                processes: Optional[int] = None) -> Coloring:
+    """
+    Минимальная раскраска графа: оценки сверху и снизу, затем точный перебор.
+
+    1. DSatur даёт раскраску — верхнюю оценку; жадная клика — нижнюю.
+    2. Если оценки совпали, ответ найден без перебора (частый случай на разреженных графах).
+    3. Иначе — перебор _branch_and_bound с вершинами клики, заранее окрашенными в 0..q-1,
+       в пределах time_limit секунд; по истечении времени возвращается лучшая раскраска
+       с optimal=False. При processes > 1 перебор идёт на пуле процессов (0 — по числу ядер).
+    """
+    g = _Graph(graph)
+    if g.n == 0:
+        return Coloring(0, {}, 0, True)
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+
+    best = dsatur(g)
+    upper = max(best) + 1
+    clique = greedy_clique(g)
+    lower = len(clique)
+    if lower == upper:
+        return Coloring(upper, g.to_dict(best), lower, True)
+
+    start = [-1] * g.n
+    for color, v in enumerate(clique):
+        start[v] = color
+    found, finished = _search(g, start, upper, lower, deadline, False, processes)
+    if found is not None:
+        best = found
+    count = max(best) + 1
+    return Coloring(count, g.to_dict(best), count if finished else lower, finished)
+
+
+def can_color(graph: Dict[int, List[int]], k: int, time_limit: Optional[float] = None,
+              processes: Optional[int] = None) -> Optional[Dict[int, int]]:
     """
     Проверяет, можно ли раскрасить граф с использованием не более чем `k` цветов,
-    так чтобы соседние вершины имели разные цвета (используется backtracking).
+    так чтобы соседние вершины имели разные цвета.
+
+    Сначала проверяются оценки: клика больше k — раскраски нет; DSatur уложился в k —
+    она найдена. Только иначе запускается перебор с ограничением в k цветов.
 
     Аргументы:
         graph (Dict[int, List[int]]): Граф в виде словаря смежности.
         k (int): Количество доступных цветов.
+        time_limit (Optional[float]): Предел времени перебора в секундах; если за это время
+            ответ не найден, выбрасывается TimeoutError.
+        processes (Optional[int]): Число процессов для перебора (None — без пула, 0 — по числу ядер).
 
     Возвращает:
         Optional[Dict[int, int]]: Раскраска в виде словаря {вершина: цвет}, или None, если невозможно.
     """
-    # Сортируем вершины по убыванию степени (жадная эвристика для ускорения)
-    nodes = sorted(graph.keys(), key=lambda node: -len(graph[node]))
-    colors = {}  # Текущая раскраска
+    g = _Graph(graph)
+    if g.n == 0:
+        return {}
+    greedy = dsatur(g)
+    if max(greedy) + 1 <= k:
+        return g.to_dict(greedy)
+    clique = greedy_clique(g)
+    if len(clique) > k:
+        return None
 
-    def backtrack(node_index: int) -> Optional[Dict[int, int]]:
-        """
-        Рекурсивная функция, которая пытается раскрасить вершины по порядку.
-        """
-        if node_index == len(nodes):
-            return colors.copy()  # Все вершины раскрашены
-
-        current_node = nodes[node_index]
-        for color in range(1, k + 1):
-            # Проверяем, используется ли этот цвет среди соседей
-            if all(colors.get(neighbor) != color for neighbor in graph[current_node]):
-                colors[current_node] = color  # Пробуем цвет
-                result = backtrack(node_index + 1)
-                if result is not None:
-                    return result
-                del colors[current_node]  # Откатываем выбор
+    start = [-1] * g.n
+    for color, v in enumerate(clique):
+        start[v] = color
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    found, finished = _search(g, start, k + 1, len(clique), deadline, True, processes)
+    if found is None and not finished:
+        raise TimeoutError(f"Could not decide {k}-colorability within {time_limit} s")
+    return None if found is None else g.to_dict(found)
 
-        return None  # Нет подходящего цвета
 
-    return backtrack(0)
-
-
-def find_min_colors(graph: Dict[int, List[int]]) -> tuple[int, Dict[int, int]]:
+def find_min_colors(graph: Dict[int, List[int]], time_limit: Optional[float] = None,
+                    processes: Optional[int] = None) -> tuple[int, Dict[int, int]]:
     """
     Находит минимальное количество цветов, необходимое для раскраски графа.
 
     Алгоритм:
-    - Попробует последовательно увеличивать число цветов от 1 до max_degree + 1.
-    - Использует `can_color()` для проверки возможности раскраски.
+    - Вместо перебора k = 1, 2, ... с нуля — один перебор color_graph, который сразу
+      начинает с раскраски DSatur и отсекает ветви оценкой по размеру клики.
 
     Аргументы:
         graph (Dict[int, List[int]]): Граф в виде словаря смежности.
+        time_limit (Optional[float]): Предел времени перебора в секундах; по его истечении
+            возвращается лучшая найденная раскраска (доказана ли её минимальность,
+            сообщает color_graph).
+        processes (Optional[int]): Число процессов для перебора (None — без пула, 0 — по числу ядер).
 
     Возвращает:
         tuple[int, Dict[int, int]]: Минимальное число цветов и соответствующая раскраска.
     """
-    max_degree = max(len(neighbors) for neighbors in graph.values())  # Максимальная степень вершины
-    for k in range(1, max_degree + 2):  # Проверим до max_degree + 1
-        coloring = can_color(graph, k)
-        if coloring is not None:
-            return k, coloring
-    # Запасной вариант: столько же цветов, сколько вершин
-    return len(graph), {node: i + 1 for i, node in enumerate(graph)}
+    result = color_graph(graph, time_limit, processes)
+    return result.count, result.colors
 
 
 if __name__ == "__main__":
@@ -95,6 +536,19 @@ if __name__ == "__main__":
         print(f"Раскраска вершин: {coloring}")
         print("-" * 40)
 
+    # Большой граф: перебор на пуле процессов с ограничением по времени
+    import random
+    random.seed(1)
+    big = {v: [] for v in range(60)}
+    for v in range(60):
+        for u in range(v + 1, 60):
+            if random.random() < 0.5:
+                big[v].append(u)
+                big[u].append(v)
+    result = color_graph(big, time_limit=10, processes=0)
+    print(f"Граф на 60 вершинах: {result.count} цветов, нижняя оценка {result.lower_bound}, "
+          f"оптимально: {result.optimal}")
+
     # Цвет 1 — красный  
     # Цвет 2 — зелёный  
     # Цвет 3 — синий  
\ No newline at end of file
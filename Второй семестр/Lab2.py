@@ -1,7 +1,12 @@
 import math
+import sys
+from fractions import Fraction
 from itertools import combinations
 from typing import NewType, Optional
 
+from Lab1_Greham import cross_product
+from convex_hull import build_chains
+
 # Типы данных для удобства чтения и документации
 Point = NewType("Point", tuple[float, float])
 Line = NewType("Line", tuple[float, float, float])       # Ax + By + C = 0
@@ -10,6 +15,17 @@ Circle = NewType("Circle", tuple[Point, int])           # ((x, y), r)
 Triangle = NewType("Triangle", tuple[Point, Point, Point])
 
 UNCERTAINTY = 1e-9  # Допустимая погрешность при сравнении чисел с плавающей точкой
+EPSILON = sys.float_info.epsilon  # Относительная погрешность одной операции с float
+
+
+def scaled_uncertainty(*values: float) -> float:
+    """
+    Погрешность, масштабированная по величине координат.
+
+    Для координат порядка 1 совпадает с UNCERTAINTY, для больших (например, 10^6)
+    растёт пропорционально, чтобы не быть меньше шага представления float.
+    """
+    return UNCERTAINTY * max(1.0, *(abs(v) for v in values))
 
 
 def points_to_line(p1: Point, p2: Point) -> Line:
@@ -30,13 +46,15 @@ def line_intersection(line1: Line, line2: Line) -> Optional[Point]:
     """
     Находит точку пересечения двух прямых (если они не параллельны).
 
-    Если прямые параллельны или совпадают — возвращает None.
+    Если прямые параллельны или совпадают — возвращает None. Порог для определителя
+    масштабируется по его слагаемым (scaled_uncertainty), поэтому решение о параллельности
+    не зависит от масштаба координат.
     """
     A1, B1, C1 = line1
     A2, B2, C2 = line2
 
     det = A1 * B2 - A2 * B1
-    if abs(det) < UNCERTAINTY:  # Параллельные/совпадающие прямые
+    if abs(det) < scaled_uncertainty(A1 * B2, A2 * B1):  # Параллельные/совпадающие прямые
         return None
 
     x = (B1 * C2 - B2 * C1) / det
@@ -55,14 +73,8 @@ def line_segment_intersection(line: Line, segment: Segment) -> Optional[Point]:
     if not point:
         return None
 
-    x, y = point
-    (x1, y1), (x2, y2) = segment
-
     # Проверяем, попадает ли точка в пределы отрезка с учетом погрешности
-    if (min(x1, x2) - UNCERTAINTY <= x <= max(x1, x2) + UNCERTAINTY) and \
-       (min(y1, y2) - UNCERTAINTY <= y <= max(y1, y2) + UNCERTAINTY):
-        return point
-    return None
+    return point if is_point_on_segment(point, segment) else None
 
 
 def segments_intersection(seg1: Segment, seg2: Segment) -> Optional[Point]:
@@ -77,16 +89,34 @@ def segments_intersection(seg1: Segment, seg2: Segment) -> Optional[Point]:
     if not pt:
         return None
 
-    x, y = pt
-    (x1, y1), (x2, y2) = seg1
-    in_seg1 = (min(x1, x2) - UNCERTAINTY <= x <= max(x1, x2) + UNCERTAINTY and 
-               min(y1, y2) - UNCERTAINTY <= y <= max(y1, y2) + UNCERTAINTY)
+    # Погрешность та же, что в is_point_on_segment, — масштабированная по координатам отрезка
+    return pt if is_point_on_segment(pt, seg1) and is_point_on_segment(pt, seg2) else None
 
-    (x1, y1), (x2, y2) = seg2
-    in_seg2 = (min(x1, x2) - UNCERTAINTY <= x <= max(x1, x2) + UNCERTAINTY and 
-               min(y1, y2) - UNCERTAINTY <= y <= max(y1, y2) + UNCERTAINTY)
 
-    return pt if (in_seg1 and in_seg2) else None
+def circle_line_discriminant_sign(line: Line, circle: Circle) -> int:
+    """
+    Точно определяет знак величины R²(A² + B²) - (A·cx + B·cy + C)².
+
+    Знак равен 1, если прямая пересекает окружность в двух точках, 0 — при касании
+    и -1, если пересечений нет. Сначала значение считается во float вместе с оценкой
+    накопленной ошибки; если оно дальше от нуля, чем ошибка, знак верен. Иначе
+    (почти касание) вычисление повторяется точно в рациональных числах Fraction.
+    """
+    (A, B, C), ((cx, cy), R) = line, circle
+    s = A * cx + B * cy + C
+    norm2 = A * A + B * B
+    disc = R * R * norm2 - s * s
+
+    magnitude = abs(A * cx) + abs(B * cy) + abs(C)
+    error = 16 * EPSILON * (R * R * norm2 + magnitude * magnitude)
+    if disc > error:
+        return 1
+    if disc < -error:
+        return -1
+
+    A, B, C, cx, cy, R = map(Fraction, (A, B, C, cx, cy, R))
+    exact = R * R * (A * A + B * B) - (A * cx + B * cy + C) ** 2
+    return (exact > 0) - (exact < 0)
 
 
 def line_circle_intersection(line: Line, circle: Circle) -> list[Point]:
@@ -94,29 +124,28 @@ def line_circle_intersection(line: Line, circle: Circle) -> list[Point]:
     Находит точки пересечения прямой и окружности.
 
     Алгоритм:
-    1. Найдём расстояние от центра окружности до прямой.
-    2. Если оно больше радиуса — нет пересечений.
-    3. Иначе найдём две точки пересечения (или одну, если прямая касательная).
+    1. Точно (см. circle_line_discriminant_sign) определяем, сколько точек пересечения:
+       0, 1 (касание) или 2. Абсолютная погрешность не используется, поэтому ответ
+       верен и для больших координат.
+    2. Находим основание перпендикуляра из центра на прямую.
+    3. Сдвигаемся от него вдоль прямой на sqrt(R² - d²) в обе стороны.
     """
     (A, B, C), ((cx, cy), R) = line, circle
-    numerator = abs(A * cx + B * cy + C)
-    denominator = math.sqrt(A**2 + B**2)
-    d = numerator / denominator
+    norm2 = A * A + B * B
+    if norm2 == 0:
+        return []  # Коэффициенты не задают прямую
 
-    if d > R:
+    sign = circle_line_discriminant_sign(line, circle)
+    if sign < 0:
         return []  # Нет пересечений
 
-    # Пример обработки вертикальной прямой (упрощённый случай)
-    if abs(B) < UNCERTAINTY:
-        x = -C / A
-        dy = math.sqrt(R**2 - (x - cx)**2)
-        return [(x, cy + dy), (x, cy - dy)]
+    s = A * cx + B * cy + C
+    foot = (cx - A * s / norm2, cy - B * s / norm2)
+    if sign == 0:
+        return [foot]  # Одна точка касания
 
-    # TODO: Общая реализация для произвольного случая
-    # Для полной реализации нужно решить систему уравнений:
-    #   Ax + By + C = 0
-    #   (x - cx)^2 + (y - cy)^2 = R^2
-    return []
+    h = math.sqrt(max(R * R * norm2 - s * s, 0.0)) / norm2
+    return [(foot[0] - B * h, foot[1] + A * h), (foot[0] + B * h, foot[1] - A * h)]
 
 
 def segment_circle_intersection(segment: Segment, circle: Circle) -> list[Point]:
@@ -143,17 +172,22 @@ def circles_intersection(circle1: Circle, circle2: Circle) -> list[Point]:
     - d — расстояние между центрами
     - a — проекция на линию центров
     - h — высота треугольника
+
+    Касание определяется с погрешностью, масштабированной по координатам и радиусам
+    (scaled_uncertainty): d, посчитанное во float, отличается от r1 + r2 больше чем на
+    UNCERTAINTY уже при координатах порядка 10^6.
     """
     (x1, y1), r1 = circle1
     (x2, y2), r2 = circle2
     dx, dy = x2 - x1, y2 - y1
     d = math.sqrt(dx**2 + dy**2)
+    eps = scaled_uncertainty(x1, y1, x2, y2, r1, r2)
 
-    if d > r1 + r2 or d < abs(r1 - r2):
-        return []  # Нет пересечений
+    if d == 0 or d > r1 + r2 + eps or d < abs(r1 - r2) - eps:
+        return []  # Нет пересечений (концентрические окружности не имеют отдельных точек пересечения)
 
     a = (r1**2 - r2**2 + d**2) / (2 * d)
-    h = math.sqrt(r1**2 - a**2)
+    h = math.sqrt(max(r1**2 - a**2, 0))  # При касании разность может уйти чуть ниже нуля
 
     xm = x1 + a * dx / d
     ym = y1 + a * dy / d
@@ -161,7 +195,7 @@ def circles_intersection(circle1: Circle, circle2: Circle) -> list[Point]:
     pt1 = (xm + h * dy / d, ym - h * dx / d)
     pt2 = (xm - h * dy / d, ym + h * dx / d)
 
-    if abs(d - r1 - r2) < UNCERTAINTY or abs(d - abs(r1 - r2)) < UNCERTAINTY:
+    if abs(d - r1 - r2) <= eps or abs(d - abs(r1 - r2)) <= eps:
         return [pt1]  # Одна точка касания
     return [pt1, pt2]  # Две точки пересечения
 
@@ -172,8 +206,9 @@ def is_point_on_segment(pt: Point, segment: Segment) -> bool:
     """
     (x1, y1), (x2, y2) = segment
     x, y = pt
-    return (min(x1, x2) - UNCERTAINTY <= x <= max(x1, x2) + UNCERTAINTY and 
-            min(y1, y2) - UNCERTAINTY <= y <= max(y1, y2) + UNCERTAINTY)
+    eps = scaled_uncertainty(x1, y1, x2, y2)
+    return (min(x1, x2) - eps <= x <= max(x1, x2) + eps and 
+            min(y1, y2) - eps <= y <= max(y1, y2) + eps)
 
 
 def distance(pt1: Point, pt2: Point) -> float:
@@ -185,14 +220,19 @@ def distance(pt1: Point, pt2: Point) -> float:
     return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
 
 
+def triangle_area(a: Point, b: Point, c: Point) -> float:
+    """
+    Вычисляет площадь треугольника по координатам вершин.
+    """
+    (x1, y1), (x2, y2), (x3, y3) = a, b, c
+    return abs(x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2)) / 2.0
+
+
 def triangle_exists(tri: Triangle) -> bool:
     """
     Проверяет, образуют ли три точки невырожденный треугольник.
     """
-    a, b, c = tri
-    area = lambda x1, y1, x2, y2, x3, y3: abs(x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2)) / 2.0
-    total_area = area(*a, *b, *c)
-    return total_area > 0
+    return triangle_area(*tri) > 0
 
 
 def is_triangle_inside(tri1: Triangle, tri2: Triangle) -> bool:
@@ -209,43 +249,91 @@ def is_point_inside_triangle(pt: Point, triangle: Triangle) -> bool:
     """
     Проверяет, находится ли точка внутри треугольника.
 
-    Основано на методе суммы площадей подтреугольников.
+    Основано на методе суммы площадей подтреугольников. Площади растут как квадрат
+    координат, поэтому погрешность масштабируется по сумме площадей (scaled_uncertainty).
     """
     p = pt
     a, b, c = triangle
-    area = lambda x1, y1, x2, y2, x3, y3: abs(x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2)) / 2.0
 
-    total_area = area(*a, *b, *c)
+    total_area = triangle_area(a, b, c)
     sub_areas = (
-        area(*p, *a, *b) +
-        area(*p, *b, *c) +
-        area(*p, *c, *a)
+        triangle_area(p, a, b) +
+        triangle_area(p, b, c) +
+        triangle_area(p, c, a)
     )
 
-    return abs(total_area - sub_areas) < UNCERTAINTY
+    return abs(total_area - sub_areas) < scaled_uncertainty(sub_areas)
 
 
-def find_nested_triangles(points: list[Point]) -> bool:
+def find_nested_triangles(points: list[Point], witness: bool = False):
     """
-    Ищет среди всех возможных треугольников хотя бы одну вложенную пару.
-
-    Возвращает True, если такая пара найдена.
+    Проверяет, есть ли среди треугольников на данных точках вложенная пара.
+
+    Вместо перебора всех пар треугольников (O(n⁶)) используется геометрия:
+    - если точка q лежит в треугольнике abc из других точек, то невырожденный треугольник
+      из q и двух вершин abc вложен в abc;
+    - наоборот, у вложенного треугольника есть вершина, не совпадающая с вершинами внешнего,
+      и она лежит в треугольнике из других точек.
+    По теореме Каратеодори точка лежит в треугольнике из других точек тогда и только тогда,
+    когда она не является вершиной их выпуклой оболочки. Значит, вложенная пара есть ровно тогда,
+    когда точки не все на одной прямой и не находятся в выпуклом положении
+    (то есть не все точки — вершины оболочки). Достаточно одной оболочки: O(n log n).
+    Оболочка — convex_hull.build_chains, повороты — Lab1_Greham.cross_product: точки на рёбрах
+    и повторы вершин вершинами не считаются, как и в convex_hull.monotone_chain.
+
+    Аргументы:
+        points (list[Point]): Список точек.
+        witness (bool): Вернуть ли саму пару треугольников вместо True/False.
+
+    Возвращает:
+        bool: Есть ли вложенная пара (при witness=False).
+        Optional[tuple[Triangle, Triangle]]: (внутренний, внешний) треугольник или None (при witness=True).
     """
-    triangles = list(combinations(points, 3))
-    for tri1, tri2 in combinations(triangles, 2):
-        if not triangle_exists(tri1) or not triangle_exists(tri2):
-            continue
-        if is_triangle_inside(tri1, tri2) or is_triangle_inside(tri2, tri1):
-            print("First triangle:", tri1)
-            print("Second triangle:", tri2)
-            return True
-    return False
+    points = [tuple(p) for p in points]
+    distinct = sorted(set(points))
+    hull = distinct
+    if len(distinct) > 2:
+        lower, upper = build_chains(distinct)
+        hull = lower[:-1] + upper[:-1]  # Против часовой стрелки
+    if len(hull) < 3 or len(hull) == len(points):
+        return None if witness else False
+    if not witness:
+        return True
+
+    # Любая точка, не ставшая вершиной оболочки (или повтор вершины), лежит внутри неё
+    # или на границе
+    on_hull, seen = set(hull), set()
+    for pt in points:
+        if pt not in on_hull or pt in seen:
+            break
+        seen.add(pt)
+
+    # Разбиваем оболочку веером треугольников из вершины, не совпадающей с pt,
+    # и двоичным поиском находим треугольник веера, содержащий pt
+    if hull[0] == pt:
+        hull = hull[1:] + hull[:1]
+    apex = hull[0]
+    low, high = 1, len(hull) - 2
+    while low < high:
+        mid = (low + high + 1) // 2
+        if cross_product(apex, hull[mid], pt) >= 0:
+            low = mid
+        else:
+            high = mid - 1
+    outer = (apex, hull[low], hull[low + 1])
+
+    # Внутренний треугольник: pt и две вершины внешнего, не лежащие с pt на одной прямой
+    for a, b in combinations(outer, 2):
+        if cross_product(a, b, pt) != 0:
+            return (a, b, pt), outer
+    return None
 
 
 if __name__ == "__main__":
     # Примеры использования
     points = [(0,0), (2,2), (1,1), (4,0), (5,1)]
     print("Are triangles nested:", find_nested_triangles(points))
+    print("Nested pair:", find_nested_triangles(points, witness=True))
 
     points = [(0,0), (2,2), (4,0), (5,1)]
     print("Are triangles nested:", find_nested_triangles(points))
\ No newline at end of file
@@ -1,40 +1,126 @@
-from typing import List, Dict, Optional
+from array import array
+from typing import Dict, Iterator, Optional, Union
 
-def build_transition_table(pattern: str) -> list[dict[str, int]]:
+from Lab4 import find_borders
+
+def build_char_classes(pattern: Union[str, bytes]) -> Dict:
+    """
+    Сжимает алфавит до классов эквивалентности символов.
+
+    Символы, не встречающиеся в образце, ведут себя в автомате одинаково, поэтому
+    все они попадают в класс 0; символы образца получают классы 1..k.
+    Так σ не превышает len(pattern) + 1 даже для текста в Unicode.
+
+    Аргументы:
+        pattern (str | bytes): Искомая подстрока.
+
+    Возвращает:
+        Dict: Отображение символ -> номер класса.
+    """
+    return {ch: index + 1 for index, ch in enumerate(sorted(set(pattern)))}
+
+
+def build_dense_transition_table(pattern: Union[str, bytes]) -> tuple[array, Dict]:
     """
-    Строит таблицу переходов для конечного автомата поиска подстроки.
+    Строит таблицу переходов автомата одним непрерывным массивом за O(m·σ).
 
     Алгоритм:
-    - Для каждого состояния (0..m) определяется переход для каждого символа алфавита.
-    - Если текущий символ совпадает с символом в паттерне — увеличиваем состояние.
-    - Иначе — используем "откат" через уже построенную часть таблицы (похоже на KMP).
+    - Строка состояния q — копия строки состояния, в которое ведёт функция отказов
+      (граница префикса pattern[:q] из find_borders), с единственным изменённым
+      переходом по символу pattern[q] в состояние q + 1.
+    - Копирование строки — срез массива за O(σ), без циклов «отката» для каждой пары
+      (состояние, символ).
+
+    Таблица хранится построчно: переход из строки со смещением s по классу c — table[s + c].
+    Значения сразу являются смещениями строк (номер состояния × σ), поэтому при поиске
+    не нужно умножение.
 
     Аргументы:
-        pattern (str): Искомая подстрока.
+        pattern (str | bytes): Искомая подстрока (непустая).
 
     Возвращает:
-        List[Dict[str, int]]: Таблица переходов размером (m+1) x |алфавит|
+        tuple[array, Dict]: Таблица array('i') размером (m+1)·σ и отображение символов в классы.
     """
     m = len(pattern)
-    alphabet = {'a', 'b', 'c'}  # Ограничимся этим набором символов
-    transition_table = [{} for _ in range(m + 1)]
+    classes = build_char_classes(pattern)
+    sigma = len(classes) + 1
+    borders = find_borders(pattern)
+
+    table = array('i', [0]) * ((m + 1) * sigma)
+    table[classes[pattern[0]]] = sigma  # Из начального состояния — только по первому символу
+    for q in range(1, m + 1):
+        row, fallback = q * sigma, borders[q - 1] * sigma
+        table[row:row + sigma] = table[fallback:fallback + sigma]
+        if q < m:
+            table[row + classes[pattern[q]]] = (q + 1) * sigma
+
+    return table, classes
 
-    for state in range(m + 1):
-        for c in alphabet:
-            # Попробуем продвинуться дальше по паттерну
-            next_state = min(m, state + 1)
-            # Пока не найдём совпадение или не вернёмся к состоянию 0
-            while next_state > 0 and (next_state - 1 >= len(pattern) or pattern[next_state - 1] != c):
-                next_state = transition_table[next_state - 1].get(c, 0)
-            transition_table[state][c] = next_state
 
-    return transition_table
+class _ZeroClassTable(dict):
+    """
+    Таблица для str.translate: символы вне образца переходят в класс 0.
+    """
+
+    def __missing__(self, key: int) -> str:
+        return '\x00'
 
 
-def finite_automata(text: str, pattern: str) -> Optional[int]:
+def text_to_classes(text: Union[str, bytes], classes: Dict):
+    """
+    Переводит текст в последовательность номеров классов одной операцией translate.
+    """
+    if isinstance(text, (bytes, bytearray)):
+        byte_table = bytearray(256)
+        for ch, cls in classes.items():
+            byte_table[ch] = cls
+        return bytes(text).translate(byte_table)
+    if isinstance(text, str) and len(classes) < 256:
+        str_table = _ZeroClassTable({ord(ch): chr(cls) for ch, cls in classes.items()})
+        return text.translate(str_table).encode('latin-1')
+    return [classes.get(ch, 0) for ch in text]
+
+
+def finite_automata_iter(text: Union[str, bytes], pattern: Union[str, bytes]) -> Iterator[int]:
+    """
+    Лениво выдаёт индексы всех вхождений подстроки, проходя текст автоматом один раз.
+
+    После принимающего состояния автомат продолжает работу по той же таблице
+    (строка состояния m скопирована со строки его границы), поэтому перекрывающиеся
+    вхождения тоже находятся.
+
+    Пустой образец, как и в finite_automata, встречается в каждой позиции 0..len(text).
+
+    Аргументы:
+        text (str | bytes): Текст, в котором ищем.
+        pattern (str | bytes): Подстрока, которую ищем.
+
+    Возвращает:
+        Iterator[int]: Индексы начала вхождений по возрастанию.
+    """
+    if not len(pattern):
+        yield from range(len(text) + 1)
+        return
+
+    table, classes = build_dense_transition_table(pattern)
+    m = len(pattern)
+    final = m * (len(classes) + 1)  # Смещение строки принимающего состояния
+    state = 0  # Начальное состояние
+
+    for i, cls in enumerate(text_to_classes(text, classes)):
+        state = table[state + cls]
+
+        if state == final:  # Полное совпадение паттерна
+            yield i - m + 1  # Начальный индекс совпадения
+
+
+def finite_automata(text: Union[str, bytes], pattern: Union[str, bytes]) -> Optional[int]:
     """
     Реализует алгоритм поиска подстроки с помощью конечного автомата.
 
+    Использует плотную таблицу build_dense_transition_table: каждый шаг — одно
+    сложение и одно обращение к массиву вместо поиска в словаре.
+
     Аргументы:
         text (str): Текст, в котором ищем.
         pattern (str): Подстрока, которую ищем.
@@ -45,19 +131,8 @@ def finite_automata(text: str, pattern: str) -> Optional[int]:
     if not pattern:
         return 0  # Пустая подстрока всегда найдена
 
-    transition_table = build_transition_table(pattern)
-    n = len(text)
-    m = len(pattern)
-    state = 0  # Начальное состояние
-
-    for i in range(n):
-        current_char = text[i]
-        state = transition_table[state].get(current_char, 0)
-
-        if state == m:  # Полное совпадение паттерна
-            return i - m + 1  # Возвращаем начальный индекс совпадения
-
-    return None  # Совпадений не найдено
+    # Генератор останавливается на первом вхождении — остаток текста не просматривается
+    return next(finite_automata_iter(text, pattern), None)
 
 
 if __name__ == "__main__":
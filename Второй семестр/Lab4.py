@@ -1,4 +1,7 @@
-from typing import List
+import mmap
+from typing import Iterable, Iterator, List, Union
+
+Chunk = Union[str, bytes, bytearray, memoryview]
 
 def find_borders(pattern: str) -> List[int]:
     """
@@ -31,6 +34,109 @@ def find_borders(pattern: str) -> List[int]:
     return borders
 
 
+class KMPMatcher:
+    """
+    Потоковый поиск подстроки алгоритмом КМП.
+
+    Текст подаётся фрагментами через feed(chunk); текущая позиция в образце
+    (compare_index) сохраняется между вызовами, поэтому вхождения на стыке фрагментов
+    тоже находятся, а индексы вхождений — глобальные (от начала всего потока).
+    Фрагменты могут быть str (при образце str) или bytes / bytearray / memoryview /
+    mmap (при образце bytes) — байтовые данные не копируются.
+    """
+
+    def __init__(self, pattern: Union[str, bytes]):
+        if not len(pattern):  # len, а не bool: у массива NumPy нет однозначного значения истинности
+            raise ValueError("Pattern must not be empty")
+        self.pattern = pattern
+        self.borders = find_borders(pattern)
+        self.compare_index = 0  # Текущая позиция в pattern
+        self.position = 0  # Количество уже обработанных символов потока
+
+    def _view(self, chunk: Chunk):
+        """
+        Для байтовых данных (bytes, bytearray, mmap, memoryview формата 'B') возвращает
+        memoryview без копирования (элементы — int, как у bytes). Строки и прочие
+        последовательности — списки токенов, array('i'), массивы NumPy — используются как есть:
+        их буфер нельзя читать побайтно, иначе элементы шириной больше байта распадутся.
+        """
+        if isinstance(chunk, (bytes, bytearray, mmap.mmap)) or \
+                (isinstance(chunk, memoryview) and chunk.format == 'B'):
+            return memoryview(chunk).cast('B')
+        return chunk
+
+    def feed(self, chunk: Chunk) -> Iterator[int]:
+        """
+        Обрабатывает фрагмент и лениво выдаёт глобальные индексы начала вхождений.
+
+        Состояние обновляется по мере выдачи, поэтому итератор нужно исчерпать
+        до передачи следующего фрагмента.
+        """
+        pattern, borders = self.pattern, self.borders
+        m = len(pattern)
+        compare_index, base = self.compare_index, self.position
+        text = self._view(chunk)
+
+        for i, ch in enumerate(text):
+            while compare_index > 0 and ch != pattern[compare_index]:
+                compare_index = borders[compare_index - 1]
+            if ch == pattern[compare_index]:
+                compare_index += 1
+            if compare_index == m:
+                compare_index = borders[-1]
+                self.compare_index, self.position = compare_index, base + i + 1
+                yield base + i - m + 1
+
+        self.compare_index, self.position = compare_index, base + len(text)
+
+    def count(self, chunk: Chunk) -> int:
+        """
+        Обрабатывает фрагмент и возвращает только число вхождений (без объектов на каждое вхождение).
+        """
+        pattern, borders = self.pattern, self.borders
+        m = len(pattern)
+        compare_index = self.compare_index
+        found = 0
+        text = self._view(chunk)
+
+        for ch in text:
+            while compare_index > 0 and ch != pattern[compare_index]:
+                compare_index = borders[compare_index - 1]
+            if ch == pattern[compare_index]:
+                compare_index += 1
+            if compare_index == m:
+                found += 1
+                compare_index = borders[-1]
+
+        self.compare_index = compare_index
+        self.position += len(text)
+        return found
+
+
+def kmp_stream(chunks: Iterable[Chunk], pattern: Union[str, bytes]) -> Iterator[int]:
+    """
+    Ищет все вхождения образца в тексте, поступающем фрагментами.
+
+    Аргументы:
+        chunks (Iterable): Фрагменты текста (например, блоки файла или срезы mmap).
+        pattern (str | bytes): Образец.
+
+    Возвращает:
+        Iterator[int]: Глобальные индексы начала вхождений.
+    """
+    matcher = KMPMatcher(pattern)
+    for chunk in chunks:
+        yield from matcher.feed(chunk)
+
+
+def kmp_stream_count(chunks: Iterable[Chunk], pattern: Union[str, bytes]) -> int:
+    """
+    Считает вхождения образца в тексте, поступающем фрагментами.
+    """
+    matcher = KMPMatcher(pattern)
+    return sum(matcher.count(chunk) for chunk in chunks)
+
+
 def kmp_algorithm(text: str, pattern: str) -> List[int]:
     """
     Реализует алгоритм Кнута-Морриса-Пратта (KMP) для поиска всех вхождений подстроки в строке.
@@ -47,26 +153,7 @@ def kmp_algorithm(text: str, pattern: str) -> List[int]:
     if not pattern:
         return [0]  # Обработка пустого шаблона
 
-    borders = find_borders(pattern)
-    result = []
-    compare_index = 0  # Текущая позиция в pattern
-
-    for i in range(len(text)):
-        # Откатываемся, пока не найдем совпадение или не достигнем начала
-        while compare_index > 0 and text[i] != pattern[compare_index]:
-            compare_index = borders[compare_index - 1]
-
-        # Если символ совпал, продвигаемся по pattern
-        if text[i] == pattern[compare_index]:
-            compare_index += 1
-
-        # Если дошли до конца pattern — нашли совпадение
-        if compare_index == len(pattern):
-            start_index = i - compare_index + 1
-            result.append(start_index)
-            compare_index = borders[-1]  # Продолжаем поиск следующего вхождения
-
-    return result
+    return list(KMPMatcher(pattern).feed(text))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
-from typing import List, Dict
+from array import array
+from typing import List, Dict, Iterator, Union
+
+Text = Union[str, bytes]
 
 def get_bad_characters_dict(pattern: str) -> Dict[str, int]:
     """
@@ -69,7 +72,235 @@ def bm_algorithm_bad_character(text: str, pattern: str) -> List[int]:
     return result
 
 
+class _ShiftTable(dict):
+    """
+    Таблица сдвигов для str: символы, которых нет в образце, получают значение по умолчанию
+    (без вставки в словарь), поэтому поиск обращается к ней так же, как к массиву: table[ch].
+    """
+
+    def __init__(self, default: int):
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, key) -> int:
+        return self.default
+
+
+def _make_table(pattern: Text, default: int):
+    """
+    Для байтового алфавита — массив из 256 элементов, для str — _ShiftTable.
+    """
+    if isinstance(pattern, (bytes, bytearray)):
+        return array('i', [default]) * 256
+    return _ShiftTable(default)
+
+
+def build_last_occurrence_table(pattern: Text):
+    """
+    Таблица последних вхождений символов в образец (правило плохого символа); -1 — символа нет.
+    """
+    table = _make_table(pattern, -1)
+    for i, char in enumerate(pattern):
+        table[char] = i
+    return table
+
+
+def build_good_suffix_table(pattern: Text) -> List[int]:
+    """
+    Строит таблицу сдвигов по правилу хорошего суффикса (сильный вариант).
+
+    shift[j] — сдвиг образца, если несовпадение произошло в позиции j - 1, то есть
+    суффикс pattern[j:] уже совпал с текстом. shift[0] — сдвиг после полного совпадения,
+    он равен периоду образца.
+
+    Использует массив border_pos: border_pos[i] — начало самой широкой собственной
+    границы суффикса pattern[i:].
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border_pos = [0] * (m + 1)
+
+    # Случай 1: совпавший суффикс ещё раз встречается в образце с другим символом перед ним
+    i, j = m, m + 1
+    border_pos[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border_pos[j]
+        i -= 1
+        j -= 1
+        border_pos[i] = j
+
+    # Случай 2: с текстом совпадает только часть суффикса — граница всего образца
+    j = border_pos[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border_pos[j]
+
+    return shift
+
+
+def boyer_moore_iter(text: Text, pattern: Text) -> Iterator[int]:
+    """
+    Полный алгоритм Бойера-Мура: правило плохого символа, правило хорошего суффикса
+    и правило Галиля.
+
+    Правило Галиля: после полного совпадения образец сдвигается на свой период p,
+    и первые m - p символов нового положения заведомо совпадают, поэтому сравнение
+    справа налево останавливается на них. Это убирает квадратичный случай
+    на периодических образцах (например, «aaaa» в «aaaa...a»).
+
+    Аргументы:
+        text (str | bytes): Текст, в котором производится поиск.
+        pattern (str | bytes): Подстрока, которую ищем.
+
+    Возвращает:
+        Iterator[int]: Индексы начала вхождений по возрастанию (лениво).
+    """
+    n, m = len(text), len(pattern)
+    if m == 0 or m > n:
+        return
+
+    last = build_last_occurrence_table(pattern)
+    good_suffix = build_good_suffix_table(pattern)
+    period = good_suffix[0]
+    shift = 0
+    known = 0  # Сколько первых символов образца заведомо совпадает в текущем положении
+
+    while shift <= n - m:
+        j = m - 1
+        while j >= known and pattern[j] == text[shift + j]:
+            j -= 1
+
+        if j < known:  # Полное совпадение найдено
+            yield shift
+            shift += period
+            known = m - period
+        else:
+            known = 0
+            shift += max(good_suffix[j + 1], j - last[text[shift + j]])
+
+
+def boyer_moore(text: Text, pattern: Text) -> List[int]:
+    """
+    Список всех вхождений (см. boyer_moore_iter).
+    """
+    return list(boyer_moore_iter(text, pattern))
+
+
+def horspool_iter(text: Text, pattern: Text) -> Iterator[int]:
+    """
+    Алгоритм Бойера-Мура-Хорспула.
+
+    Сдвиг определяется только символом текста под последней позицией образца:
+    table[c] = расстояние от последнего вхождения c в pattern[:-1] до конца образца
+    (m, если символа нет). На естественном языке даёт почти те же сдвиги, что и полный
+    алгоритм, при более простом внутреннем цикле.
+
+    Возвращает:
+        Iterator[int]: Индексы начала вхождений по возрастанию (лениво).
+    """
+    n, m = len(text), len(pattern)
+    if m == 0 or m > n:
+        return
+
+    table = _make_table(pattern, m)
+    for i in range(m - 1):
+        table[pattern[i]] = m - 1 - i
+
+    last_char = pattern[m - 1]
+    shift = 0
+    while shift <= n - m:
+        c = text[shift + m - 1]
+        if c == last_char:
+            j = m - 2
+            while j >= 0 and pattern[j] == text[shift + j]:
+                j -= 1
+            if j < 0:
+                yield shift
+        shift += table[c]
+
+
+def horspool(text: Text, pattern: Text) -> List[int]:
+    """
+    Список всех вхождений (см. horspool_iter).
+    """
+    return list(horspool_iter(text, pattern))
+
+
+def sunday_iter(text: Text, pattern: Text) -> Iterator[int]:
+    """
+    Алгоритм Санди (Quick Search).
+
+    Сдвиг определяется символом текста сразу за окном: table[c] = m - (последняя позиция c
+    в образце), m + 1, если символа нет. Максимальный сдвиг на единицу больше, чем у Хорспула.
+
+    Возвращает:
+        Iterator[int]: Индексы начала вхождений по возрастанию (лениво).
+    """
+    n, m = len(text), len(pattern)
+    if m == 0 or m > n:
+        return
+
+    table = _make_table(pattern, m + 1)
+    for i, char in enumerate(pattern):
+        table[char] = m - i
+
+    shift = 0
+    while shift <= n - m:
+        j = 0
+        while j < m and pattern[j] == text[shift + j]:
+            j += 1
+        if j == m:
+            yield shift
+        if shift + m >= n:
+            break
+        shift += table[text[shift + m]]
+
+
+def sunday(text: Text, pattern: Text) -> List[int]:
+    """
+    Список всех вхождений (см. sunday_iter).
+    """
+    return list(sunday_iter(text, pattern))
+
+
 if __name__ == "__main__":
     print(f"Result of BM algorithm (bad character rule): {bm_algorithm_bad_character('abca', 'abca')}")          # Ожидается: [0]
     print(f"Result of BM algorithm (bad character rule): {bm_algorithm_bad_character('abcababdabaaba', 'abaaba')}")   # Ожидается: [7]
-    print(f"Result of BM algorithm (bad character rule): {bm_algorithm_bad_character('abcababdabaabadd', 'abaaba')}") # Ожидается: []
\ No newline at end of file
+    print(f"Result of BM algorithm (bad character rule): {bm_algorithm_bad_character('abcababdabaabadd', 'abaaba')}") # Ожидается: []
+
+    # Сравнение числа просмотренных символов текста на тексте на естественном языке
+    import random
+
+    class CountingText:
+        """
+        Обёртка над текстом, подсчитывающая обращения к символам.
+        """
+
+        def __init__(self, text: Text):
+            self.text = text
+            self.reads = 0
+
+        def __len__(self) -> int:
+            return len(self.text)
+
+        def __getitem__(self, index: int):
+            self.reads += 1
+            return self.text[index]
+
+    words = ("алгоритм поиска подстроки в строке работает быстрее если образец длинный "
+             "а алфавит текста достаточно велик для больших сдвигов").split()
+    random.seed(0)
+    corpus = " ".join(random.choice(words) for _ in range(20000))
+    for needle in ("строке", "поиска подстроки", "алгоритм поиска подстроки в строке работает"):
+        print(f"Pattern of length {len(needle)}:")
+        for name, search in (("bad character", bm_algorithm_bad_character), ("Boyer-Moore", boyer_moore),
+                             ("Horspool", horspool), ("Sunday", sunday)):
+            counted = CountingText(corpus)
+            hits = search(counted, needle)
+            print(f"  {name:<14} hits={len(hits):<6} inspections per character={counted.reads / len(corpus):.3f}")
+
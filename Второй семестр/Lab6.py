@@ -1,12 +1,146 @@
-from typing import List
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+Text = Union[str, bytes, Sequence[int]]
+
+# Двойное хеширование: два независимых простых модуля. Вероятность ложного совпадения
+# окна с образцом — порядка 1 / (MOD1 · MOD2), поэтому проверки «на всякий случай»
+# почти никогда не выполняются впустую. Основания фиксированы, чтобы отпечатки
+# документов, посчитанные в разных процессах, были сравнимы.
+MOD1 = (1 << 61) - 1  # Простое Мерсенна
+MOD2 = 1_000_000_007
+BASE1 = 911_382_323
+BASE2 = 972_663_749
+# Основания для второго (вертикального) измерения в двумерном поиске
+VERTICAL_BASE1 = 1_000_000_181
+VERTICAL_BASE2 = 998_244_353
+
+
+def _codes(text: Text) -> Sequence[int]:
+    """
+    Представляет текст последовательностью целых кодов (для bytes и списков — без копирования).
+
+    Байтовые буферы (memoryview, mmap, array('B'), массивы NumPy uint8) копируются в bytes,
+    прочие array и массивы NumPy — в список int Python: так хеш не переполняет int64,
+    а у текста и образца остаётся всего два представления — bytes и список (см. _comparable).
+    """
+    if isinstance(text, str):
+        return [ord(ch) for ch in text]
+    if isinstance(text, (bytes, bytearray, list)):
+        return text
+    try:
+        view = memoryview(text)
+    except TypeError:
+        return list(text)
+    if view.format == 'B' and view.ndim == 1:
+        return view.tobytes()
+    return view.tolist()
+
+
+def _comparable(codes: Sequence[int], reference: Sequence[int]) -> Optional[Sequence[int]]:
+    """
+    Коды образца в том же представлении (bytes или список), что и коды текста reference, —
+    иначе срез текста никогда не равен образцу. None, если образец с кодами вне 0..255
+    не может встретиться в байтовом тексте.
+    """
+    if isinstance(codes, (bytes, bytearray)) == isinstance(reference, (bytes, bytearray)):
+        return codes
+    if isinstance(codes, (bytes, bytearray)):
+        return list(codes)
+    return bytes(codes) if all(0 <= code < 256 for code in codes) else None
+
+
+def _combine(h1: int, h2: int) -> int:
+    """
+    Склеивает два хеша в одно целое (MOD2 < 2^30) — ключ для множеств и словарей.
+    """
+    return (h1 << 30) | h2
+
+
+def polynomial_hash(values: Sequence[int], base: int = BASE1, mod: int = MOD1) -> int:
+    """
+    Полиномиальный хеш последовательности по одному модулю.
+    """
+    h = 0
+    for value in values:
+        h = (h * base + value) % mod
+    return h
+
+
+def rolling_hashes(values: Sequence[int], k: int, base: int = BASE1, mod: int = MOD1) -> Iterator[int]:
+    """
+    Скользящий полиномиальный хеш всех окон длины k по одному модулю.
+
+    Возвращает:
+        Iterator[int]: Хеш окна values[i:i + k] для i = 0, 1, ..., len(values) - k.
+    """
+    n = len(values)
+    if k <= 0 or k > n:
+        return
+    high = pow(base, k - 1, mod)  # Вес символа, уходящего из окна
+    h = polynomial_hash(values[:k], base, mod)
+    yield h
+    for i in range(k, n):
+        h = ((h - values[i - k] * high) * base + values[i]) % mod
+        yield h
+
+
+def rolling_keys(text: Text, k: int) -> Iterator[int]:
+    """
+    Двойной скользящий хеш всех окон длины k (оба модуля, склеенные в одно число).
+
+    Оба хеша считаются в одном цикле: это ключи для отпечатков без проверки исходным
+    текстом, поэтому здесь нужна вероятность коллизии двух модулей.
+    """
+    values = _codes(text)
+    n = len(values)
+    if k <= 0 or k > n:
+        return
+    high1, high2 = pow(BASE1, k - 1, MOD1), pow(BASE2, k - 1, MOD2)
+    h1, h2 = polynomial_hash(values[:k], BASE1, MOD1), polynomial_hash(values[:k], BASE2, MOD2)
+    yield (h1 << 30) | h2
+    for i in range(k, n):
+        out, new = values[i - k], values[i]
+        h1 = ((h1 - out * high1) * BASE1 + new) % MOD1
+        h2 = ((h2 - out * high2) * BASE2 + new) % MOD2
+        yield (h1 << 30) | h2
+
+
+def fingerprint(text: Text) -> int:
+    """
+    Двойной хеш всей последовательности — тот же, что rolling_keys даёт для окна.
+    """
+    values = _codes(text)
+    return _combine(polynomial_hash(values, BASE1, MOD1), polynomial_hash(values, BASE2, MOD2))
+
+
+def rk_iter(text: Text, pattern: Text) -> Iterator[int]:
+    """
+    Лениво выдаёт индексы вхождений образца методом Рабина-Карпа (см. rk_algorithm).
+    """
+    m = len(pattern)
+    if m == 0 or m > len(text):
+        return
+
+    # Совпадение хешей проверяем по кодам: срез массива NumPy нельзя сравнить через ==
+    values = _codes(text)
+    pattern = _comparable(_codes(pattern), values)
+    if pattern is None:
+        return
+    target = polynomial_hash(pattern)
+    for i, key in enumerate(rolling_hashes(values, m)):
+        if key == target and values[i:i + m] == pattern:
+            yield i
+
 
 def rk_algorithm(text: str, pattern: str) -> List[int]:
     """
     Реализует алгоритм поиска подстроки в строке методом Рабина-Карпа.
 
     Метод использует полиномиальный хэширование для эффективного сравнения подстрок.
-    Это позволяет свести временную сложность к O(n + m) в среднем случае,
-    где n — длина текста, m — длина образца.
+    Модуль — 61-битное простое MOD1 (вместо 101), поэтому совпадение хешей почти всегда
+    означает настоящее вхождение, и проверка срезом выполняется лишь для них.
+    Это даёт O(n + m) и на типичных, и на неудачных текстах.
 
     Аргументы:
         text (str): Текст, в котором производится поиск.
@@ -15,46 +149,131 @@ def rk_algorithm(text: str, pattern: str) -> List[int]:
     Возвращает:
         List[int]: Список индексов, начиная с которых встречается подстрока в тексте.
     """
-    result = []
-    base = 256       # Основание для полиномиального хэша
-    mod = 101        # Простое число для уменьшения размера хэша
-    m = len(pattern)
-    n = len(text)
+    return list(rk_iter(text, pattern))
+
+
+def rk_multi(text: Text, patterns: Iterable[Text]) -> Iterator[tuple[Text, int]]:
+    """
+    Ищет сразу много образцов: хеши образцов одной длины хранятся в словаре,
+    и каждое окно текста проверяется одним поиском в нём (найденное сверяется срезом).
+
+    Образцы группируются по длине; на каждую различную длину — один проход по тексту.
+
+    Возвращает:
+        Iterator[tuple[Text, int]]: Пары (образец, индекс вхождения).
+    """
+    values = _codes(text)
+    by_length: dict[int, dict[int, list]] = {}
+    for pattern in patterns:
+        codes = _comparable(_codes(pattern), values) if len(pattern) else None
+        if codes is not None:
+            by_length.setdefault(len(pattern), {}).setdefault(polynomial_hash(codes), []).append((pattern, codes))
+
+    for m, fingerprints in by_length.items():
+        for i, key in enumerate(rolling_hashes(values, m)):
+            candidates = fingerprints.get(key)
+            if candidates:
+                window = values[i:i + m]
+                for pattern, codes in candidates:
+                    if window == codes:
+                        yield pattern, i
+
+
+def rk_2d(grid: Sequence[Text], pattern: Sequence[Text]) -> List[tuple[int, int]]:
+    """
+    Двумерный поиск Рабина-Карпа: находит все вхождения прямоугольного образца в матрицу.
 
-    if m == 0 or m > n:
-        return result
+    Алгоритм:
+    1. В каждой строке матрицы считаются скользящие хеши окон ширины образца.
+    2. В каждом столбце полученных хешей считается скользящий хеш окон высоты образца
+       (с другими основаниями), то есть хеш прямоугольника h × w.
+    3. Совпадения проверяются построчным сравнением.
 
-    # Предвычисляем значения степени для хэширования
-    h_pow = 1
-    for _ in range(m - 1):
-        h_pow = (h_pow * base) % mod
+    Аргументы:
+        grid: Строки матрицы одинаковой длины.
+        pattern: Строки образца одинаковой длины.
 
-    # Вычисляем хэш для pattern и первой подстроки text
-    pattern_hash = 0
-    window_hash = 0
-    for i in range(m):
-        pattern_hash = (base * pattern_hash + ord(pattern[i])) % mod
-        window_hash = (base * window_hash + ord(text[i])) % mod
+    Возвращает:
+        List[tuple[int, int]]: Координаты (строка, столбец) левых верхних углов вхождений.
+    """
+    h, w = len(pattern), len(pattern[0]) if len(pattern) else 0
+    if h == 0 or w == 0 or h > len(grid) or w > len(grid[0]):
+        return []
 
-    # Скользим окном по тексту
-    for i in range(n - m + 1):
-        if pattern_hash == window_hash:
-            # Хэши совпали, проверяем точное совпадение
-            if all(pattern[j] == text[i + j] for j in range(m)):
-                result.append(i)
+    def rectangle_hashes(rows: Sequence[Text]) -> list[list[tuple[int, int]]]:
+        # Хеши окон ширины w в каждой строке по обоим модулям
+        row_hashes = [(list(rolling_hashes(_codes(row), w, BASE1, MOD1)),
+                       list(rolling_hashes(_codes(row), w, BASE2, MOD2))) for row in rows]
+        columns = len(row_hashes[0][0])
+        result = []
+        for c in range(columns):
+            first = rolling_hashes([r[0][c] for r in row_hashes], h, VERTICAL_BASE1, MOD1)
+            second = rolling_hashes([r[1][c] for r in row_hashes], h, VERTICAL_BASE2, MOD2)
+            result.append(list(zip(first, second)))
+        return result  # result[столбец][строка]
 
-        # Обновляем хэш для следующей подстроки
-        if i < n - m:
-            window_hash = (
-                base * (window_hash - ord(text[i]) * h_pow) + ord(text[i + m])
-            ) % mod
-            window_hash = (window_hash + mod) % mod  # Избегаем отрицательных значений
+    target = rectangle_hashes(pattern)[0][0]
+    pattern_rows = [list(_codes(row)) for row in pattern]  # Строки сравниваются списками кодов
+    found = []
+    for c, column in enumerate(rectangle_hashes(grid)):
+        for r, key in enumerate(column):
+            if key == target and all(list(_codes(grid[r + i][c:c + w])) == pattern_rows[i] for i in range(h)):
+                found.append((r, c))
+    found.sort()
+    return found
 
-    return result
+
+def winnow(text: Text, k: int = 5, window: int = 4) -> List[tuple[int, int]]:
+    """
+    Отпечаток документа методом просеивания (winnowing).
+
+    Считаются хеши всех k-грамм; в каждом окне из `window` подряд идущих хешей выбирается
+    минимальный (самый правый при равенстве). Любое общее для двух документов совпадение
+    длиной не меньше window + k - 1 гарантированно даёт общий выбранный хеш.
+    Минимум окна поддерживается монотонной очередью — O(n) на документ.
+
+    Аргументы:
+        text: Текст документа (нормализацию — регистр, пробелы — выполняет вызывающий).
+        k (int): Длина k-граммы.
+        window (int): Размер окна просеивания.
+
+    Возвращает:
+        List[tuple[int, int]]: Пары (хеш, позиция k-граммы) выбранных отпечатков.
+    """
+    selected = []
+    candidates = deque()  # (хеш, позиция) с возрастающими хешами
+    for position, key in enumerate(rolling_keys(text, k)):
+        while candidates and candidates[-1][0] >= key:
+            candidates.pop()
+        candidates.append((key, position))
+        if candidates[0][1] <= position - window:
+            candidates.popleft()
+        if position >= window - 1 and (not selected or selected[-1][1] != candidates[0][1]):
+            selected.append(candidates[0])
+    if not selected and candidates:
+        selected.append(candidates[0])  # Документ короче одного окна
+    return selected
+
+
+def fingerprint_similarity(first: Iterable[tuple[int, int]], second: Iterable[tuple[int, int]]) -> float:
+    """
+    Мера Жаккара множеств хешей двух отпечатков winnow (от 0 до 1).
+    """
+    a = {key for key, _ in first}
+    b = {key for key, _ in second}
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
 
 
 if __name__ == "__main__":
     print(f"Result of RK algorithm: {rk_algorithm('abca', 'abca')}")          # Ожидается: [0]
     print(f"Result of RK algorithm: {rk_algorithm('abcababdabaaba', 'abaaba')}")   # Ожидается: [7]
     print(f"Result of RK algorithm: {rk_algorithm('abcababdabaabadd', 'abaaba')}") # Ожидается: []
-    print(f"Result of RK algorithm: {rk_algorithm('abcababdabaab', 'ab')}")       # Ожидается: [0, 3, 7]
\ No newline at end of file
+    print(f"Result of RK algorithm: {rk_algorithm('abcababdabaab', 'ab')}")       # Ожидается: [0, 3, 5, 8, 11]
+    print(f"Result of multi-pattern RK: {list(rk_multi('abcababdabaab', ['ab', 'ba', 'abd']))}")
+    print(f"Result of 2-D RK: {rk_2d(['abca', 'bcab', 'cabc'], ['bc', 'ca'])}")    # Ожидается: [(0, 1), (1, 0)]
+
+    doc1 = "a rolling hash makes document fingerprinting linear in the document length"
+    doc2 = "with a rolling hash, document fingerprinting stays linear in the document length"
+    print(f"Similarity of fingerprints: {fingerprint_similarity(winnow(doc1), winnow(doc2)):.2f}")
\ No newline at end of file
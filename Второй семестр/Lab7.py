@@ -1,4 +1,309 @@
-from typing import List, Tuple
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+def kadane(values: Iterable[float]) -> Tuple[float, int, int]:
+    """
+    Алгоритм Кадане за один проход по итератору с O(1) памяти.
+
+    Текущий подмассив продолжается, пока его сумма неотрицательна; иначе новый
+    подмассив начинается с текущего элемента. Начало текущего подмассива запоминается
+    в момент сброса, а в ответ копируется только вместе с новым максимумом — поэтому
+    границы всегда соответствуют найденной сумме.
+    Если все элементы отрицательны, ответ — один наибольший элемент.
+
+    Аргументы:
+        values (Iterable[float]): Числа — список, генератор, array, memoryview и т. п.
+
+    Возвращает:
+        Tuple[float, int, int]: (сумма, начало, конец) — конец включительно;
+        для пустого входа (-inf, 0, -1).
+    """
+    best, best_start, best_end = float('-inf'), 0, -1
+    current, start = 0, 0
+
+    for index, elem in enumerate(values):
+        if current < 0:
+            current, start = elem, index  # Отрицательный префикс только уменьшает сумму
+        else:
+            current += elem
+
+        if current > best:
+            best, best_start, best_end = current, start, index
+
+    return best, best_start, best_end
+
+
+class Summary(NamedTuple):
+    """
+    Свёртка фрагмента массива для схемы «разделяй и властвуй».
+
+    Индексы глобальные (с учётом смещения фрагмента), концы включительно.
+    """
+    total: float  # Сумма всего фрагмента
+    prefix: float  # Лучшая сумма префикса
+    prefix_end: int
+    suffix: float  # Лучшая сумма суффикса
+    suffix_start: int
+    best: float  # Лучшая сумма подмассива внутри фрагмента
+    best_start: int
+    best_end: int
+
+
+def combine(left: Summary, right: Summary) -> Summary:
+    """
+    Объединяет свёртки двух соседних фрагментов за O(1).
+
+    Лучший подмассив объединения либо целиком внутри одной из частей, либо
+    состоит из лучшего суффикса левой и лучшего префикса правой части.
+    """
+    if left.prefix >= left.total + right.prefix:
+        prefix, prefix_end = left.prefix, left.prefix_end
+    else:
+        prefix, prefix_end = left.total + right.prefix, right.prefix_end
+
+    if right.suffix >= right.total + left.suffix:
+        suffix, suffix_start = right.suffix, right.suffix_start
+    else:
+        suffix, suffix_start = right.total + left.suffix, left.suffix_start
+
+    best, best_start, best_end = left.best, left.best_start, left.best_end
+    if left.suffix + right.prefix > best:
+        best, best_start, best_end = left.suffix + right.prefix, left.suffix_start, right.prefix_end
+    if right.best > best:
+        best, best_start, best_end = right.best, right.best_start, right.best_end
+
+    return Summary(left.total + right.total, prefix, prefix_end, suffix, suffix_start,
+                   best, best_start, best_end)
+
+
+def summarize(chunk: Sequence[float], offset: int = 0) -> Summary:
+    """
+    Свёртка одного непустого фрагмента за один проход.
+
+    Числовые буферы (array, memoryview, массивы NumPy) обрабатываются векторно через NumPy,
+    если он установлен; иначе — циклом на Python.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None and not isinstance(chunk, (list, tuple)):
+        return _summarize_array(np.asarray(chunk), offset)
+
+    best, best_start, best_end = kadane(chunk)
+    total, prefix, prefix_end = 0, float('-inf'), offset
+    for index, elem in enumerate(chunk):
+        total += elem
+        if total > prefix:
+            prefix, prefix_end = total, offset + index
+
+    suffix, suffix_start, running = float('-inf'), offset, 0
+    for index in range(len(chunk) - 1, -1, -1):
+        running += chunk[index]
+        if running > suffix:
+            suffix, suffix_start = running, offset + index
+
+    return Summary(total, prefix, prefix_end, suffix, suffix_start,
+                   best, offset + best_start, offset + best_end)
+
+
+def _summarize_array(values, offset: int) -> Summary:
+    """
+    Векторная свёртка фрагмента через префиксные суммы.
+
+    P[k] — сумма первых k элементов. Лучший подмассив, оканчивающийся в j, равен
+    P[j + 1] - min(P[0..j]); минимум по всем j считается накопительным минимумом.
+    """
+    import numpy as np
+
+    prefix_sums = np.cumsum(values)
+    before = np.concatenate(([0], prefix_sums[:-1]))  # Суммы до каждого элемента
+    total = prefix_sums[-1].item()
+
+    prefix_end = int(np.argmax(prefix_sums))
+    suffix_start = int(np.argmin(before))  # Суффикс с j: total - before[j]
+
+    running_min = np.minimum.accumulate(before)
+    gains = prefix_sums - running_min
+    best_end = int(np.argmax(gains))
+    best_start = int(np.argmin(before[:best_end + 1]))
+
+    return Summary(total, prefix_sums[prefix_end].item(), offset + prefix_end,
+                   total - before[suffix_start].item(), offset + suffix_start,
+                   gains[best_end].item(), offset + best_start, offset + best_end)
+
+
+def _summarize_task(task: Tuple[Sequence[float], int]) -> Summary:
+    """
+    Задание для процесса-исполнителя: (фрагмент, смещение) -> свёртка.
+    """
+    return summarize(*task)
+
+
+def chunked(values: Iterable[float], size: int) -> Iterator[List[float]]:
+    """
+    Нарезает поток чисел на фрагменты не длиннее size.
+    """
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def parallel_kadane(chunks: Iterable[Sequence[float]], processes: Optional[int] = None,
+                    max_pending: Optional[int] = None) -> Tuple[float, int, int]:
+    """
+    Максимальный подмассив потока фрагментов, свёрнутых параллельно в пуле процессов.
+
+    Каждый фрагмент независимо сворачивается в Summary (сумма, лучший префикс,
+    лучший суффикс, лучший подмассив); свёртки объединяются слева направо функцией combine.
+    В работе одновременно не более max_pending фрагментов, поэтому поток любой длины
+    обрабатывается в ограниченной памяти, а время масштабируется числом ядер.
+
+    Аргументы:
+        chunks (Iterable[Sequence[float]]): Фрагменты потока по порядку (например, chunked(...)
+            или массивы, прочитанные из файла); пустые фрагменты пропускаются.
+        processes (Optional[int]): Число процессов (по умолчанию — число ядер).
+        max_pending (Optional[int]): Ограничение очереди (по умолчанию 2 · processes).
+
+    Возвращает:
+        Tuple[float, int, int]: (сумма, начало, конец) в глобальных индексах, как у kadane.
+    """
+    processes = processes or os.cpu_count() or 1
+    limit = max_pending or 2 * processes
+    result: Optional[Summary] = None
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+        offset = 0
+
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            pending.append(pool.submit(_summarize_task, (chunk, offset)))
+            offset += len(chunk)
+            if len(pending) >= limit:
+                summary = pending.popleft().result()
+                result = summary if result is None else combine(result, summary)
+
+        while pending:
+            summary = pending.popleft().result()
+            result = summary if result is None else combine(result, summary)
+
+    if result is None:
+        return float('-inf'), 0, -1
+    return result.best, result.best_start, result.best_end
+
+
+def bounded_window(values: Iterable[float], min_len: int = 1,
+                   max_len: Optional[int] = None) -> Tuple[float, int, int]:
+    """
+    Подмассив с наибольшей суммой, длина которого от min_len до max_len включительно.
+
+    Сумма подмассива [i, j) равна P[j] - P[i], где P — префиксные суммы. Для каждого
+    конца j нужен минимум P[i] по окну i ∈ [j - max_len, j - min_len]; он хранится
+    в монотонной очереди (значения P возрастают от начала к концу), поэтому каждый
+    индекс добавляется и удаляется не более одного раза — O(n) времени.
+    Поток читается один раз; в памяти — O(max_len) префиксных сумм (без max_len — O(n)
+    в худшем случае монотонно убывающих сумм).
+
+    Аргументы:
+        values (Iterable[float]): Числа (в том числе генератор).
+        min_len (int): Минимальная длина подмассива (>= 1).
+        max_len (Optional[int]): Максимальная длина; None — без ограничения.
+
+    Возвращает:
+        Tuple[float, int, int]: (сумма, начало, конец) — конец включительно;
+        (-inf, 0, -1), если подходящего подмассива нет.
+    """
+    if min_len < 1 or (max_len is not None and max_len < min_len):
+        raise ValueError("Expected 1 <= min_len <= max_len")
+
+    best, best_start, best_end = float('-inf'), 0, -1
+    candidates = deque()  # (P[i], i) с возрастающими P[i] — кандидаты в начало
+    recent = deque([0])  # P[j - min_len .. j]: ещё не допущенные в candidates суммы
+    prefix = 0
+
+    for j, elem in enumerate(values, start=1):
+        prefix += elem
+        recent.append(prefix)
+
+        # Начало i = j - min_len становится допустимым
+        i = j - min_len
+        if i >= 0:
+            value = recent.popleft()
+            while candidates and candidates[-1][0] >= value:
+                candidates.pop()
+            candidates.append((value, i))
+        if max_len is not None:
+            while candidates and candidates[0][1] < j - max_len:
+                candidates.popleft()
+
+        if candidates and prefix - candidates[0][0] > best:
+            best, best_start, best_end = prefix - candidates[0][0], candidates[0][1], j - 1
+
+    return best, best_start, best_end
+
+
+def max_subrectangle(matrix) -> Tuple[float, Tuple[int, int, int, int]]:
+    """
+    Прямоугольная подматрица с наибольшей суммой (двумерный Кадане).
+
+    Алгоритм (сжатие по строкам за O(rows² · cols)):
+    - Матрица транспонируется так, чтобы строк было не больше, чем столбцов.
+    - Двумерные префиксные суммы S считаются один раз; для пары строк (top, bottom)
+      сжатая строка — разность S[bottom + 1] - S[top], и её префиксные суммы готовы.
+    - Для фиксированного top одномерный Кадане выполняется сразу для всех bottom:
+      лучший отрезок, оканчивающийся в столбце j, — префикс минус накопительный минимум
+      предыдущих префиксов (np.minimum.accumulate по строкам матрицы).
+
+    Аргументы:
+        matrix: Двумерный массив чисел (список списков или массив NumPy).
+
+    Возвращает:
+        Tuple[float, Tuple[int, int, int, int]]: Сумма и границы (top, left, bottom, right)
+        включительно; для пустой матрицы (-inf, (0, 0, -1, -1)).
+    """
+    import numpy as np
+
+    data = np.asarray(matrix)
+    if data.size == 0:
+        return float('-inf'), (0, 0, -1, -1)
+    data = data.astype(np.int64 if np.issubdtype(data.dtype, np.integer) else np.float64)
+    transposed = data.shape[0] > data.shape[1]
+    if transposed:
+        data = data.T
+    rows, cols = data.shape
+
+    sums = np.zeros((rows + 1, cols + 1), dtype=data.dtype)
+    np.cumsum(np.cumsum(data, axis=0), axis=1, out=sums[1:, 1:])
+
+    # Буферы выделяются один раз: на каждом шаге — четыре векторных прохода без копий
+    best, where = None, None
+    strip = np.empty((rows, cols + 1), dtype=data.dtype)
+    running_min = np.empty((rows, cols), dtype=data.dtype)
+    for top in range(rows):
+        height = rows - top
+        block = strip[:height]
+        np.subtract(sums[top + 1:], sums[top], out=block)  # Префиксы сжатых строк top..bottom
+        low = running_min[:height]
+        np.minimum.accumulate(block[:, :-1], axis=1, out=low)
+        np.subtract(block[:, 1:], low, out=low)  # Лучшая сумма, оканчивающаяся в каждом столбце
+        flat = int(np.argmax(low))
+        value = low.flat[flat]
+        if best is None or value > best:
+            bottom, right = divmod(flat, cols)
+            left = int(np.argmin(block[bottom, :right + 1]))
+            best, where = value.item(), (top, left, top + bottom, right)
+
+    top, left, bottom, right = where
+    if transposed:
+        top, left, bottom, right = left, top, right, bottom
+    return best, (top, left, bottom, right)
+
 
 def the_largest_subarray(array: List[float]) -> Tuple[List[float], float]:
     """
@@ -16,35 +321,11 @@ def the_largest_subarray(array: List[float]) -> Tuple[List[float], float]:
         array (List[float]): Массив вещественных чисел.
 
     Возвращает:
-        Tuple[List[float], float]: 
+        Tuple[List[float], float]:
             - Непрерывный подмассив с наибольшей суммой.
             - Сумма этого подмассива.
     """
-    if not array:
-        return ([], float('-inf'))  # Обработка пустого входного массива
-
-    max_sum = float('-inf')
-    current_sum = 0
-    start_idx = 0
-    end_idx = 0
-
-    for index, elem in enumerate(array):
-        current_sum += elem
-
-        if current_sum > max_sum:
-            max_sum = current_sum
-            end_idx = index
-
-        if current_sum < 0:
-            current_sum = 0
-            start_idx = index + 1
-
-    # Корректировка, если все элементы отрицательны
-    if max_sum < 0:
-        max_value = max(array)
-        max_index = array.index(max_value)
-        return ([max_value], max_value)
-
+    max_sum, start_idx, end_idx = kadane(array)
     return (array[start_idx:end_idx + 1], max_sum)
 
 
@@ -52,4 +333,15 @@ if __name__ == "__main__":
     print(f"Result: {the_largest_subarray([-2, 1, -3, 4, -1, 2, 1, -5, 4])}")  # Ожидается: [4, -1, 2, 1], 6
     print(f"Result: {the_largest_subarray([2, -1, 2, -1, 2])}")                # Ожидается: [2, -1, 2, -1, 2], 4
     print(f"Result: {the_largest_subarray([-2, -1, -2, -1, -2])}")             # Ожидается: [-1], -1
-    print(f"Result: {the_largest_subarray([])}")                              # Ожидается: ([], -inf)
\ No newline at end of file
+    print(f"Result: {the_largest_subarray([])}")                              # Ожидается: ([], -inf)
+    print(f"Result: {the_largest_subarray([5, -10, 1, 1])}")                  # Ожидается: [5], 5
+
+    print(f"Window of length 2..3: {bounded_window([4, -1, 2, 1, -5, 4, 3], 2, 3)}")  # Ожидается: (7, 5, 6)
+    print(f"Best subrectangle: {max_subrectangle([[1, -2, 3], [-4, 5, 6], [7, -8, 9]])}")  # Ожидается: (18, (0, 2, 2, 2))
+
+    # Поток чисел, не помещающийся в список: обрабатывается по фрагментам в пуле процессов
+    import random
+
+    random.seed(0)
+    ticks = (random.gauss(0, 1) for _ in range(10 ** 6))
+    print(f"Parallel result: {parallel_kadane(chunked(ticks, 100_000))}")
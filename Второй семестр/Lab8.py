@@ -1,30 +1,229 @@
-from typing import List, Literal
+from typing import Dict, Iterable, List, Literal, Optional
 
-def coin_exchange(coins: List[int], amount: int) -> float | Literal[-1]:
+import numpy as np
+
+
+def _index_dtype(limit: int):
+    """
+    int32, если значения помещаются, иначе int64 — таблица вдвое меньше на типичных суммах.
+    """
+    return np.int32 if limit < 2 ** 31 - 1 else np.int64
+
+
+def _by_residue(table: np.ndarray, coin: int) -> np.ndarray:
+    """
+    Представляет таблицу матрицей (K, coin): строка k, столбец r — сумма k · coin + r.
+
+    Хвост дополняется копией последних значений, чтобы длина делилась на coin;
+    после обработки лишние элементы отбрасываются.
+    """
+    rows = -(-len(table) // coin)
+    padded = np.empty(rows * coin, dtype=table.dtype)
+    padded[:len(table)] = table
+    padded[len(table):] = table[-1]
+    return padded.reshape(rows, coin)
+
+
+class CoinChange:
+    """
+    Размен суммы монетами: одна таблица динамического программирования на все суммы
+    от 0 до max_amount, затем любое число запросов без пересчёта.
+
+    Режимы:
+    - минимальное число монет и сам набор монет (min_coins / change);
+    - число способов размена (ways) — по модулю или точно (большие целые);
+    - ограниченный запас: counts[i] — сколько монет coins[i] есть (None — без ограничений).
+
+    Таблицы хранятся в целочисленных массивах NumPy; «недостижимо» обозначается значением
+    max_amount + 1 вместо float('inf'). Внутренний цикл по суммам векторизован для каждой монеты.
+    """
+
+    def __init__(self, coins: Iterable[int], max_amount: int, counts: Optional[Iterable[int]] = None):
+        coins = list(coins)
+        if any(coin <= 0 for coin in coins):
+            raise ValueError("Coin values must be positive")
+        if max_amount < 0:
+            raise ValueError("Amount must be non-negative")
+        counts = None if counts is None else list(counts)
+        if counts is not None and len(counts) != len(coins):
+            raise ValueError("counts must have one entry per coin")
+
+        # Повторы номинала — одна и та же монета во всех режимах: запасы складываются
+        # (None — без ограничений), иначе ways считал бы их разными монетами
+        merged: Dict[int, Optional[int]] = {}
+        for i, coin in enumerate(coins):
+            count = None if counts is None else counts[i]
+            if coin in merged:
+                count = None if merged[coin] is None or count is None else merged[coin] + count
+            merged[coin] = count
+        self.coins = list(merged)
+        self.counts = None if counts is None else list(merged.values())
+
+        self.max_amount = max_amount
+        self.unreachable = max_amount + 1  # Больше любого реального числа монет
+        self._items: List[tuple[int, int, int]] = []  # (вес, количество монет, номинал) для запаса
+        self._taken: List[np.ndarray] = []  # Упакованные биты «предмет взят» для восстановления
+        self._ways: Dict[Optional[int], np.ndarray] = {}
+
+        if self.counts is None:
+            self._table = self._build_unbounded()
+        else:
+            self._table = self._build_bounded()
+
+    def _build_unbounded(self) -> np.ndarray:
+        """
+        dp[a] = min(dp[a], dp[a - c] + 1) для каждой монеты c.
+
+        Внутри класса вычетов r по модулю c это префиксный минимум:
+        dp'[r + kc] = k + min_{j <= k} (dp[r + jc] - j), то есть один minimum.accumulate
+        по матрице (K, c) вместо цикла по суммам.
+        """
+        dp = np.full(self.max_amount + 1, self.unreachable, dtype=_index_dtype(2 * self.unreachable))
+        dp[0] = 0
+        for coin in sorted(set(self.coins)):
+            if coin > self.max_amount:
+                continue
+            grid = _by_residue(dp, coin)
+            k = np.arange(len(grid), dtype=dp.dtype)[:, None]
+            grid -= k
+            np.minimum.accumulate(grid, axis=0, out=grid)
+            grid += k
+            dp = np.minimum(grid.reshape(-1)[:len(dp)], self.unreachable)
+        return dp
+
+    def _build_bounded(self) -> np.ndarray:
+        """
+        Ограниченный запас: каждая монета c с запасом q раскладывается на «пачки»
+        1, 2, 4, ..., остаток (двоичное разбиение) — их комбинациями набирается любое
+        число от 0 до q. Каждая пачка — предмет задачи о рюкзаке 0/1, который обновляет
+        таблицу одним векторным сравнением со сдвинутой копией.
+        """
+        dp = np.full(self.max_amount + 1, self.unreachable, dtype=_index_dtype(2 * self.unreachable))
+        dp[0] = 0
+        for coin, count in zip(self.coins, self.counts):
+            if count is None:
+                count = self.max_amount // coin  # Без ограничений — сколько поместится
+            pack = 1
+            while count > 0:
+                take = min(pack, count)
+                weight = coin * take
+                count -= take
+                pack *= 2
+                if weight > self.max_amount:
+                    break
+                candidate = dp[:-weight] + take
+                better = candidate < dp[weight:]
+                dp[weight:][better] = candidate[better]
+                self._items.append((weight, take, coin))
+                self._taken.append(np.packbits(better))
+        return dp
+
+    def _check(self, amount: int) -> None:
+        if not 0 <= amount <= self.max_amount:
+            raise ValueError(f"Amount must be between 0 and {self.max_amount}")
+
+    def min_coins(self, amount: int) -> int:
+        """
+        Минимальное число монет для суммы amount или -1, если набрать её нельзя.
+        """
+        self._check(amount)
+        value = int(self._table[amount])
+        return -1 if value >= self.unreachable else value
+
+    def min_coins_many(self, amounts: Iterable[int]) -> np.ndarray:
+        """
+        Ответы сразу на много сумм одной операцией индексации таблицы (-1 — недостижимо).
+        """
+        amounts = np.asarray(list(amounts), dtype=np.int64)
+        if np.any((amounts < 0) | (amounts > self.max_amount)):
+            raise ValueError(f"Amount must be between 0 and {self.max_amount}")
+        result = self._table[amounts].astype(np.int64)
+        result[result >= self.unreachable] = -1
+        return result
+
+    def change(self, amount: int) -> Optional[List[int]]:
+        """
+        Восстанавливает один из оптимальных наборов монет (по убыванию номинала) или None.
+
+        Без ограничения запаса достаточно шагать от суммы вниз по любой монете c,
+        для которой dp[a - c] = dp[a] - 1. С ограниченным запасом — пройти пачки
+        в обратном порядке по сохранённым битам «взята».
+        """
+        if self.min_coins(amount) < 0:
+            return None
+        table = self._table
+        used = []
+        if self.counts is None:
+            coins = sorted(set(self.coins), reverse=True)
+            while amount > 0:
+                for coin in coins:
+                    if coin <= amount and table[amount - coin] == table[amount] - 1:
+                        used.append(coin)
+                        amount -= coin
+                        break
+        else:
+            for (weight, take, coin), taken in zip(reversed(self._items), reversed(self._taken)):
+                index = amount - weight
+                if index >= 0 and (taken[index >> 3] >> (7 - (index & 7))) & 1:
+                    used.extend([coin] * take)
+                    amount -= weight
+        used.sort(reverse=True)
+        return used
+
+    def _build_ways(self, modulus: Optional[int]) -> np.ndarray:
+        """
+        Таблица числа способов (порядок монет не важен).
+
+        Для каждой монеты в классе вычетов по модулю c новое значение — сумма старых
+        по j <= k (без ограничения) или по k - q <= j <= k (запас q): один cumsum по матрице
+        (K, c) и, для запаса, вычитание сдвинутой копии. Без модуля значения — большие
+        целые Python (dtype=object); с модулем — int64, если переполнение исключено.
+        """
+        size = self.max_amount + 1
+        exact = modulus is None or size * (modulus - 1) >= 2 ** 63
+        ways = np.zeros(size, dtype=object if exact else np.int64)
+        ways[0] = 1
+        counts = self.counts if self.counts is not None else [None] * len(self.coins)
+
+        for coin, count in zip(self.coins, counts):
+            if coin > self.max_amount:
+                continue
+            grid = _by_residue(ways, coin)
+            sums = np.cumsum(grid, axis=0)
+            if count is not None and count + 1 < len(grid):
+                sums[count + 1:] -= np.cumsum(grid, axis=0)[:-(count + 1)]
+            ways = sums.reshape(-1)[:size]
+            if modulus is not None:
+                ways = ways % modulus
+        return ways
+
+    def ways(self, amount: int, modulus: Optional[int] = None) -> int:
+        """
+        Число способов набрать amount (по модулю modulus, если он задан).
+
+        Таблица для каждого модуля строится один раз при первом запросе.
+        """
+        self._check(amount)
+        if modulus not in self._ways:
+            self._ways[modulus] = self._build_ways(modulus)
+        return int(self._ways[modulus][amount])
+
+
+def coin_exchange(coins: List[int], amount: int) -> int | Literal[-1]:
     """
     Вычисляет минимальное количество монет, необходимое для набора заданной суммы.
 
-    Используется метод динамического программирования.
-    
+    Используется метод динамического программирования (см. CoinChange).
+
     Аргументы:
         coins (List[int]): Список номиналов доступных монет (предполагается, что каждая > 0).
         amount (int): Целевая сумма, которую нужно набрать.
 
     Возвращает:
-        float | Literal[-1]: Минимальное количество монет для получения суммы `amount`.
-                             Если сумму набрать невозможно — возвращает -1.
+        int | Literal[-1]: Минимальное количество монет для получения суммы `amount`.
+                           Если сумму набрать невозможно — возвращает -1.
     """
-    # dp[i] — минимальное количество монет, чтобы получить сумму i
-    dp = [float('inf')] * (amount + 1)
-    dp[0] = 0  # Для суммы 0 нужно 0 монет
-
-    for current_amount in range(1, amount + 1):
-        for coin in coins:
-            if coin <= current_amount:
-                # Обновляем dp[current_amount], если можно улучшить текущее значение
-                dp[current_amount] = min(dp[current_amount], dp[current_amount - coin] + 1)
-
-    return dp[amount] if dp[amount] != float('inf') else -1
+    return CoinChange(coins, amount).min_coins(amount)
 
 
 if __name__ == "__main__":
@@ -32,4 +231,15 @@ if __name__ == "__main__":
     print(coin_exchange([1], 10))              # Ожидается: 10 (монет по 1)
     print(coin_exchange([1, 2, 5], 100))       # Ожидается: 20 (20 монет по 5)
     print(coin_exchange([3, 5], 7))            # Ожидается: -1 (нельзя набрать 7)
-    print(coin_exchange([1, 5, 10, 25], 30))   # Ожидается: 2 (25 + 5)
\ No newline at end of file
+    print(coin_exchange([1, 5, 10, 25], 30))   # Ожидается: 2 (25 + 5)
+
+    # Одна таблица — много запросов
+    solver = CoinChange([1, 5, 10, 25], 1000)
+    print(solver.min_coins_many([30, 99, 1000]))  # Ожидается: [2 9 40]
+    print(solver.change(99))                     # Ожидается: [25, 25, 25, 10, 10, 1, 1, 1, 1]
+    print(solver.ways(100))                      # Ожидается: 242
+    print(solver.ways(1000, modulus=10 ** 9 + 7))
+
+    # Ограниченный запас: две монеты по 25, сколько угодно остальных
+    limited = CoinChange([1, 5, 10, 25], 100, counts=[None, None, None, 2])
+    print(limited.min_coins(100), limited.change(100))  # Ожидается: 7 [25, 25, 10, 10, 10, 10, 10]
@@ -1,70 +1,108 @@
-import sys
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-def tsp_with_path(dist: List[List[int]], start: int) -> Tuple[int, List[int]]:
+import numpy as np
+
+
+def held_karp_memory(n: int, itemsize: int = 8) -> int:
+    """
+    Оценка памяти (в байтах) под таблицы tsp_with_path для n городов.
+
+    Начальный город в маску не входит, поэтому масок 2^(n-1), а концов пути n - 1:
+    таблица стоимостей — 2^(n-1) · (n-1) элементов по itemsize байт, таблица предков —
+    столько же однобайтовых элементов, плюс номера масок и их порядок по числу битов.
+    """
+    if n <= 1:
+        return 0
+    masks = 1 << (n - 1)
+    return masks * (n - 1) * (itemsize + 1) + masks * (4 + 8 + 1)
+
+
+def tsp_with_path(dist: List[List[int]], start: int,
+                  memory_limit: Optional[int] = None) -> Tuple[int, List[int]]:
     """
     Решает задачу коммивояжёра (TSP) методом динамического программирования с битовыми масками.
 
-    Алгоритм:
-    - Используется DP[mask][i] — минимальная стоимость пути, посетившего города из mask и закончившегося в i.
-    - mask — это битовая маска, где установленные биты соответствуют посещённым городам.
-    - Восстанавливается оптимальный путь через массив parent.
+    Алгоритм (Хелд–Карп):
+    - DP[mask][i] — минимальная стоимость пути из start, посетившего города из mask
+      и закончившегося в i. Начальный город всегда посещён, поэтому в маску не входит:
+      перебираются только 2^(n-1) масок, содержащих start, а не все 2^n.
+    - Таблицы хранятся в массивах NumPy: стоимости — int64 (float64 для дробных расстояний),
+      предки — int8 (номер предыдущего города).
+    - Маски обрабатываются слоями по числу городов; в слое для каждого конца j все
+      переходы DP[mask ^ j][i] + dist[i][j] считаются одной векторной операцией,
+      а минимум по i — одним argmin.
+    - Оптимальный путь восстанавливается по таблице предков.
 
     Аргументы:
         dist (List[List[int]]): Матрица расстояний между городами (n x n), где dist[i][j] — стоимость перехода из i в j.
         start (int): Начальный город (индекс).
+        memory_limit (Optional[int]): Предел памяти в байтах; если оценка held_karp_memory его
+            превышает, MemoryError выбрасывается до выделения таблиц.
 
     Возвращает:
-        Tuple[int, List[int]]: 
+        Tuple[int, List[int]]:
             - Общая минимальная стоимость замкнутого маршрута.
             - Список индексов городов в порядке обхода (включает возврат в начальный город).
     """
-    n = len(dist)
-    total_mask = (1 << n) - 1  # Все города посещены
-
-    # dp[mask][i] — минимальная стоимость пути, при котором посещены города из mask и мы стоим в i
-    dp = [[sys.maxsize] * n for _ in range(total_mask + 1)]
-    dp[1 << start][start] = 0  # Начальное состояние: стоим в start, посетили только его
-
-    # parent[mask][i] — предыдущий город перед i в состоянии mask
-    parent = [[-1] * n for _ in range(total_mask + 1)]
-
-    # Заполняем dp для всех масок
-    for mask in range(total_mask + 1):
-        for i in range(n):
-            if not (mask & (1 << i)):  # Если i не в маске — пропускаем
-                continue
-
-            for j in range(n):
-                if mask & (1 << j):  # Если j уже посещён — пропускаем
-                    continue
-
-                new_mask = mask | (1 << j)  # Добавляем j в маску
-                if dp[mask][i] + dist[i][j] < dp[new_mask][j]:
-                    dp[new_mask][j] = dp[mask][i] + dist[i][j]
-                    parent[new_mask][j] = i  # Сохраняем предка
+    matrix = np.asarray(dist)
+    n = len(matrix)
+    if n == 1:
+        return 0, [start, start]
+    if n - 1 > np.iinfo(np.int8).max:
+        raise ValueError("Too many cities for the exact algorithm")
+
+    exact = np.issubdtype(matrix.dtype, np.integer)
+    matrix = matrix.astype(np.int64 if exact else np.float64)
+    needed = held_karp_memory(n, matrix.itemsize)
+    if memory_limit is not None and needed > memory_limit:
+        raise MemoryError(f"Held-Karp for {n} cities needs about {needed / 2 ** 30:.2f} GiB")
+    infinity = np.iinfo(np.int64).max // 4 if exact else np.inf
+
+    # Города, кроме start, перенумерованы 0..n-2; бит k маски — город others[k]
+    others = [city for city in range(n) if city != start]
+    inner = matrix[np.ix_(others, others)]  # inner[i][j] = dist[others[i]][others[j]]
+    size, ends = 1 << (n - 1), n - 1
+
+    dp = np.full((size, ends), infinity, dtype=matrix.dtype)
+    parent = np.full((size, ends), -1, dtype=np.int8)  # -1 — предок start
+    for j in range(ends):
+        dp[1 << j, j] = matrix[start, others[j]]
+
+    # Маски, упорядоченные по числу битов: слой k зависит только от слоя k - 1
+    masks = np.arange(size, dtype=np.int32)
+    bits = np.zeros(size, dtype=np.int8)
+    for k in range(ends):
+        bits += ((masks >> k) & 1).astype(np.int8)
+    order = masks[np.argsort(bits, kind='stable')]
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(bits, minlength=ends + 1))))
+    del masks, bits
+
+    for layer in range(2, ends + 1):
+        layer_masks = order[bounds[layer]:bounds[layer + 1]]
+        for j in range(ends):
+            selected = layer_masks[(layer_masks >> j) & 1 == 1]
+            candidates = dp[selected ^ (1 << j)]  # Строки DP без города j
+            candidates += inner[:, j]  # Вышли из i, пришли в j; i не из маски даёт «бесконечность»
+            best = candidates.argmin(axis=1)
+            dp[selected, j] = candidates[np.arange(len(selected)), best]
+            parent[selected, j] = best
 
     # Находим минимальную стоимость завершения цикла
-    min_cost = sys.maxsize
-    last_city = -1
-    for i in range(n):
-        if i == start:
-            continue
-        cost_with_return = dp[total_mask][i] + dist[i][start]
-        if dp[total_mask][i] != sys.maxsize and cost_with_return < min_cost:
-            min_cost = cost_with_return
-            last_city = i
+    full = size - 1
+    closing = dp[full] + matrix[others, start]
+    last = int(np.argmin(closing))
+    min_cost = closing[last].item()
 
     # Восстановление пути
     path = []
-    mask = total_mask
-    current = last_city
+    mask, current = full, last
     while current != -1:
-        path.append(current)
-        prev = parent[mask][current]
-        mask ^= (1 << current)  # Убираем текущий город из маски
+        path.append(others[current])
+        prev = int(parent[mask, current])
+        mask ^= 1 << current  # Убираем текущий город из маски
         current = prev
 
+    path.append(start)
     path.reverse()          # Путь был собран в обратном порядке
     path.append(start)      # Добавляем возврат в начальный город
 
@@ -84,4 +122,7 @@ if __name__ == "__main__":
     min_cost, path = tsp_with_path(dist, 0)
 
     print("The optimal route:", " -> ".join(map(str, path)))
-    print("Total cost:", min_cost)
\ No newline at end of file
+    print("Total cost:", min_cost)
+
+    for cities in (20, 22):
+        print(f"Memory for {cities} cities: {held_karp_memory(cities) / 2 ** 20:.0f} MiB")
@@ -0,0 +1,203 @@
+from array import array
+from collections import deque
+from typing import Iterable, Iterator, Union
+
+Text = Union[str, bytes]
+
+
+class _ClassTable(dict):
+    """
+    Таблица для str.translate: символы вне алфавита образцов переходят в класс 0.
+    """
+
+    def __missing__(self, key: int) -> str:
+        return '\x00'
+
+
+class AhoCorasick:
+    """
+    Автомат Ахо–Корасик: поиск сразу множества образцов за один проход по тексту.
+
+    Обобщает конечный автомат из Lab3_automat.py:
+    - алфавит не фиксирован — он собирается из символов образцов, а все прочие
+      символы текста попадают в один общий класс 0;
+    - переходы хранятся плотной таблицей array('i') размером (число состояний) × σ,
+      где σ — число классов символов, а не списком словарей;
+    - найденные вхождения выдаются все, а не только первое.
+
+    Образцы могут быть строками (str) или байтами (bytes), но одного типа.
+    """
+
+    def __init__(self, patterns: Iterable[Text]):
+        self.patterns = list(patterns)
+        if not self.patterns:
+            raise ValueError("At least one pattern is required")
+        if any(len(p) == 0 for p in self.patterns):
+            raise ValueError("Empty patterns are not supported")
+        self.is_bytes = isinstance(self.patterns[0], (bytes, bytearray))
+        if any(isinstance(p, (bytes, bytearray)) != self.is_bytes for p in self.patterns):
+            raise TypeError("Patterns must be all str or all bytes")
+
+        # Классы символов: 0 — «любой другой символ», далее символы образцов по порядку
+        alphabet = sorted({ch for p in self.patterns for ch in p})
+        self.sigma = len(alphabet) + 1
+        self.char_class = {ch: index + 1 for index, ch in enumerate(alphabet)}
+
+        if self.is_bytes:
+            table = bytearray(256)
+            for ch, cls in self.char_class.items():
+                table[ch] = cls
+            self._byte_table = bytes(table)
+        elif self.sigma <= 256:
+            self._str_table = _ClassTable({ord(ch): chr(cls) for ch, cls in self.char_class.items()})
+        else:
+            self._str_table = None  # Классов больше 256 — переводим символы по одному
+
+        self._build()
+
+    def _build(self) -> None:
+        """
+        Строит бор образцов, суффиксные ссылки и плотную таблицу переходов (обход в ширину).
+        """
+        sigma = self.sigma
+        goto = [{}]  # Рёбра бора: состояние -> {класс: состояние}
+        terminal = [[]]  # Номера образцов, оканчивающихся в состоянии
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                cls = self.char_class[ch]
+                nxt = goto[state].get(cls)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][cls] = nxt
+                    goto.append({})
+                    terminal.append([])
+                state = nxt
+            terminal[state].append(index)
+
+        states = len(goto)
+        fail = [0] * states
+        dict_link = [-1] * states  # Ближайшее по суффиксным ссылкам состояние с выходом
+        delta = [0] * (states * sigma)
+
+        queue = deque()
+        for cls in range(sigma):
+            child = goto[0].get(cls, 0)
+            delta[cls] = child
+            if child:
+                queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            base, fail_base = state * sigma, fail[state] * sigma
+            for cls in range(sigma):
+                child = goto[state].get(cls)
+                if child is None:
+                    delta[base + cls] = delta[fail_base + cls]
+                    continue
+                delta[base + cls] = child
+                fail[child] = delta[fail_base + cls]
+                target = fail[child]
+                dict_link[child] = target if terminal[target] else dict_link[target]
+                queue.append(child)
+
+        # В таблице храним сразу смещение строки следующего состояния (state * sigma),
+        # а переход в состояние с выходом помечаем инверсией битов — в цикле поиска
+        # остаются одно сложение, одно обращение к массиву и одно сравнение со знаком.
+        has_output = [bool(terminal[s]) or dict_link[s] != -1 for s in range(states)]
+        self._delta = array('i', (~(t * sigma) if has_output[t] else t * sigma for t in delta))
+        self._terminal = terminal
+        self._dict_link = dict_link
+        self.state_count = states
+
+    def _classes(self, chunk: Text):
+        """
+        Переводит фрагмент текста в последовательность номеров классов.
+        """
+        if self.is_bytes:
+            return bytes(chunk).translate(self._byte_table)
+        if self._str_table is not None:
+            return chunk.translate(self._str_table).encode('latin-1')
+        char_class = self.char_class
+        return [char_class.get(ch, 0) for ch in chunk]
+
+    def _emit(self, state: int, end: int, hits: list) -> None:
+        """
+        Добавляет в hits все образцы, оканчивающиеся в позиции end (включительно).
+        """
+        patterns, terminal, dict_link = self.patterns, self._terminal, self._dict_link
+        while state != -1:
+            for index in terminal[state]:
+                pattern = patterns[index]
+                hits.append((pattern, end - len(pattern) + 1))
+            state = dict_link[state]
+
+    def scanner(self) -> 'StreamScanner':
+        """
+        Создаёт сканер для потокового поиска по фрагментам текста.
+        """
+        return StreamScanner(self)
+
+    def finditer(self, text: Text) -> Iterator[tuple[Text, int]]:
+        """
+        Находит все вхождения всех образцов в тексте.
+
+        Возвращает:
+            Iterator[tuple[Text, int]]: Пары (образец, индекс начала вхождения).
+        """
+        return iter(self.scanner().feed(text))
+
+    def stream(self, chunks: Iterable[Text]) -> Iterator[tuple[Text, int]]:
+        """
+        Ищет образцы в тексте, поступающем фрагментами (например, блоками файла).
+
+        Вхождения, пересекающие границу фрагментов, тоже находятся; индексы глобальные.
+        """
+        scanner = self.scanner()
+        for chunk in chunks:
+            yield from scanner.feed(chunk)
+
+
+class StreamScanner:
+    """
+    Состояние поиска, переносимое между фрагментами текста.
+    """
+
+    def __init__(self, automaton: AhoCorasick):
+        self.automaton = automaton
+        self.state = 0  # Смещение строки текущего состояния в таблице переходов
+        self.position = 0  # Сколько символов уже обработано
+
+    def feed(self, chunk: Text) -> list[tuple[Text, int]]:
+        """
+        Обрабатывает очередной фрагмент и возвращает найденные в нём вхождения.
+
+        Вхождение считается найденным во фрагменте, где оно заканчивается;
+        индекс начала может указывать на один из предыдущих фрагментов.
+        """
+        automaton = self.automaton
+        delta, sigma = automaton._delta, automaton.sigma
+        state, offset = self.state, self.position
+        hits = []
+
+        for pos, cls in enumerate(automaton._classes(chunk)):
+            state = delta[state + cls]
+            if state < 0:
+                state = ~state
+                automaton._emit(state // sigma, offset + pos, hits)
+
+        self.state = state
+        self.position = offset + len(chunk)
+        return hits
+
+
+if __name__ == "__main__":
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    print(list(automaton.finditer("ahishers")))  # Ожидается: his@1, she@3, he@4, hers@4
+
+    # Тот же результат, если текст приходит по частям
+    print(list(automaton.stream(["ahi", "sh", "ers"])))
+
+    signatures = AhoCorasick([b"abaaba", b"abca"])
+    print(list(signatures.finditer(b"abcababdabaabaabca")))
@@ -0,0 +1,198 @@
+import math
+from typing import Sequence
+
+from Lab1_Greham import Point, cross_product
+
+
+def build_chains(points: Sequence, keep_collinear: bool = False) -> tuple[list, list]:
+    """
+    Строит нижнюю и верхнюю цепи по точкам, отсортированным по (x, y) без повторов.
+
+    Поворот определяется только знаком векторного произведения, без углов и atan2.
+    При keep_collinear точки на рёбрах оболочки остаются в цепях.
+
+    Возвращает:
+        tuple[list, list]: Нижняя цепь слева направо и верхняя цепь справа налево.
+    """
+    def is_bad_turn(o, a, b) -> bool:
+        turn = cross_product(o, a, b)
+        return turn < 0 if keep_collinear else turn <= 0
+
+    lower = []
+    for p in points:
+        while len(lower) >= 2 and is_bad_turn(lower[-2], lower[-1], p):
+            lower.pop()
+        lower.append(p)
+
+    upper = []
+    for p in reversed(points):
+        while len(upper) >= 2 and is_bad_turn(upper[-2], upper[-1], p):
+            upper.pop()
+        upper.append(p)
+
+    return lower, upper
+
+
+def _chain(points: Sequence, keep_collinear: bool) -> list:
+    """
+    Склеивает цепи из build_chains в оболочку против часовой стрелки.
+    """
+    if len(points) <= 2:
+        return list(points)
+
+    if keep_collinear:
+        # Все точки на одной прямой — оболочка вырождается в отрезок со всеми точками
+        first, last = points[0], points[-1]
+        if all(cross_product(first, last, p) == 0 for p in points):
+            return list(points)
+
+    lower, upper = build_chains(points, keep_collinear)
+    # Последняя точка каждой цепи совпадает с первой точкой другой
+    return lower[:-1] + upper[:-1]
+
+
+def monotone_chain(points: list[Point], keep_collinear: bool = False) -> list[Point]:
+    """
+    Строит выпуклую оболочку алгоритмом Эндрю (монотонные цепи).
+
+    Алгоритм:
+    1. Удаляет повторяющиеся точки и сортирует оставшиеся по (x, y) — сравнение точное.
+    2. Строит нижнюю цепь слева направо и верхнюю справа налево,
+       удаляя точки, образующие поворот по часовой стрелке.
+    3. Склеивает цепи.
+
+    В отличие от graham_scan, работает с любым количеством точек (в том числе с 0, 1 и 2)
+    и корректно обрабатывает совпадающие и коллинеарные точки.
+
+    Аргументы:
+        points (list[Point]): Список точек.
+        keep_collinear (bool): Оставлять ли точки, лежащие на рёбрах оболочки.
+
+    Возвращает:
+        list[Point]: Вершины оболочки против часовой стрелки, начиная с самой левой (и нижней) точки.
+    """
+    return _chain(sorted(set(points)), keep_collinear)
+
+
+def akl_toussaint_mask(points, directions: int = 8):
+    """
+    Предварительный фильтр Экла–Туссена для массива точек формы (N, 2).
+
+    Находит крайние точки в `directions` равномерно распределённых направлениях
+    (при 8 — min/max по x, y, x + y и x - y). Они образуют выпуклый многоугольник,
+    вписанный в оболочку; точки строго внутри него не могут быть вершинами оболочки.
+    Точки на границе многоугольника сохраняются, поэтому фильтр безопасен и для keep_collinear.
+
+    Аргументы:
+        points (np.ndarray): Массив точек формы (N, 2).
+        directions (int): Число направлений; больше направлений — больше отброшенных точек.
+
+    Возвращает:
+        np.ndarray: Булева маска точек, которые нужно оставить.
+    """
+    import numpy as np
+
+    xs, ys = points[:, 0], points[:, 1]
+    keep = np.ones(len(points), dtype=bool)
+    if len(points) < 4:
+        return keep
+
+    # Крайние точки в порядке возрастания угла направления идут против часовой стрелки
+    polygon = []
+    for k in range(directions):
+        angle = 2 * math.pi * k / directions
+        index = int(np.argmax(xs * math.cos(angle) + ys * math.sin(angle)))
+        if not polygon or polygon[-1] != index:
+            polygon.append(index)
+    while len(polygon) > 1 and polygon[-1] == polygon[0]:
+        polygon.pop()
+    if len(polygon) < 3:
+        return keep
+
+    # Проверяем рёбра по очереди, каждый раз только среди точек, ещё считающихся внутренними
+    candidates = np.arange(len(points))
+    for a, b in zip(polygon, polygon[1:] + polygon[:1]):
+        ax, ay = points[a]
+        bx, by = points[b]
+        cx, cy = xs[candidates], ys[candidates]
+        inside = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) > 0
+        candidates = candidates[inside]
+        if not len(candidates):
+            break
+
+    keep[candidates] = False
+    return keep
+
+
+def convex_hull_array(points, keep_collinear: bool = False, prefilter: bool = True, directions: int = 8):
+    """
+    Векторизованное построение выпуклой оболочки для массива NumPy формы (N, 2).
+
+    Алгоритм:
+    1. (Опционально) отбрасывает внутренние точки фильтром Экла–Туссена.
+    2. Сортирует оставшиеся точки через np.lexsort и удаляет повторы.
+    3. Строит монотонные цепи по отсортированным точкам.
+
+    Целочисленные координаты обрабатываются в int64, поэтому знак поворота вычисляется точно.
+
+    Аргументы:
+        points (array-like): Точки формы (N, 2).
+        keep_collinear (bool): Оставлять ли точки, лежащие на рёбрах оболочки.
+        prefilter (bool): Применять ли фильтр Экла–Туссена.
+        directions (int): Число направлений для фильтра.
+
+    Возвращает:
+        np.ndarray: Вершины оболочки формы (H, 2) против часовой стрелки.
+    """
+    import numpy as np
+
+    points = np.asarray(points)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError("Expected an array of shape (N, 2)")
+    points = points.astype(np.int64 if np.issubdtype(points.dtype, np.integer) else np.float64, copy=False)
+
+    if prefilter:
+        points = points[akl_toussaint_mask(points, directions)]
+
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    points = points[order]
+    if len(points) > 1:
+        distinct = np.empty(len(points), dtype=bool)
+        distinct[0] = True
+        np.any(points[1:] != points[:-1], axis=1, out=distinct[1:])
+        points = points[distinct]
+
+    hull = _chain([tuple(p) for p in points.tolist()], keep_collinear)
+    return np.array(hull, dtype=points.dtype).reshape(-1, 2)
+
+
+def convex_hull(points, keep_collinear: bool = False):
+    """
+    Общая точка входа: массив NumPy обрабатывается векторизованно, список — монотонными цепями.
+
+    Аргументы:
+        points: Список точек или массив формы (N, 2).
+        keep_collinear (bool): Оставлять ли точки, лежащие на рёбрах оболочки.
+
+    Возвращает:
+        Вершины оболочки против часовой стрелки (в том же виде, что и вход).
+    """
+    if hasattr(points, "shape"):
+        return convex_hull_array(points, keep_collinear)
+    return monotone_chain(points, keep_collinear)
+
+
+if __name__ == "__main__":
+    import time
+
+    points = [(0, 0), (2, 0), (1, 1), (2, 2), (0, 2), (1, 0), (1, 1)]
+    print("Convex hull:", monotone_chain(points))
+    print("Convex hull with collinear points:", monotone_chain(points, keep_collinear=True))
+
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    cloud = rng.normal(size=(10 ** 7, 2))
+    start = time.perf_counter()
+    hull = convex_hull_array(cloud)
+    print(f"Hull of {len(cloud)} points: {len(hull)} vertices in {time.perf_counter() - start:.2f} s")
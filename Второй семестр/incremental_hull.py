@@ -0,0 +1,145 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Iterable
+
+from Lab1_Greham import Point, cross_product
+from convex_hull import build_chains
+
+
+class IncrementalHull:
+    """
+    Выпуклая оболочка потока точек, обновляемая по мере поступления данных.
+
+    Хранит только вершины оболочки в виде двух цепей, отсортированных по (x, y):
+    нижней и верхней (обе слева направо). Поэтому память ограничена размером оболочки,
+    а не длиной потока. Точки, попавшие внутрь, сразу забываются.
+    Коллинеарные точки на рёбрах не хранятся.
+    """
+
+    def __init__(self, points: Iterable[Point] = ()):
+        self._lower: list[Point] = []
+        self._upper: list[Point] = []
+        self.merge(points)
+
+    def __len__(self) -> int:
+        return len(self.vertices())
+
+    def add(self, point: Point) -> bool:
+        """
+        Добавляет одну точку.
+
+        Место в цепи находится двоичным поиском за O(log h); вершины, ставшие внутренними,
+        удаляются, и каждая вершина удаляется не более одного раза. Цепи — списки Python,
+        поэтому вставка и удаление сдвигают хвост: O(h) на точку, изменившую оболочку
+        (сдвиг — один memmove, на практике быстрый). Точка внутри оболочки стоит O(log h).
+
+        Возвращает:
+            bool: True, если оболочка изменилась.
+        """
+        point = tuple(point)
+        added_lower = self._insert(self._lower, point, 1)
+        added_upper = self._insert(self._upper, point, -1)
+        return added_lower or added_upper
+
+    @staticmethod
+    def _insert(chain: list, point: Point, sign: int) -> bool:
+        """
+        Вставляет точку в одну цепь: sign = 1 для нижней, -1 для верхней.
+
+        Для нижней цепи внутренняя часть оболочки лежит слева от рёбер (векторное
+        произведение > 0), для верхней — справа; sign приводит оба случая к одному.
+        """
+        i = bisect_left(chain, point)
+        if i < len(chain) and chain[i] == point:
+            return False  # Точка уже является вершиной
+        if 0 < i < len(chain) and sign * cross_product(chain[i - 1], chain[i], point) >= 0:
+            return False  # Точка внутри оболочки или на ребре
+
+        chain.insert(i, point)
+
+        # Удаляем вершины справа, которые больше не образуют выпуклый угол
+        end = i + 1
+        while end + 1 < len(chain) and sign * cross_product(point, chain[end], chain[end + 1]) <= 0:
+            end += 1
+        del chain[i + 1:end]
+
+        # И слева
+        start = i
+        while start >= 2 and sign * cross_product(chain[start - 2], chain[start - 1], point) <= 0:
+            start -= 1
+        del chain[start:i]
+        return True
+
+    def merge(self, points: Iterable[Point]) -> None:
+        """
+        Добавляет пачку точек сразу.
+
+        Сортирует только новую пачку (O(k log k)), затем сливает её с вершинами текущей
+        оболочки и перестраивает цепи за один линейный проход — O(h + k log k) вместо k вставок.
+        """
+        chunk = sorted(set(map(tuple, points)))
+        if not chunk:
+            return
+        current = sorted(set(self._lower) | set(self._upper))
+
+        merged = []
+        for point in heapq.merge(current, chunk):
+            if not merged or merged[-1] != point:
+                merged.append(point)
+
+        lower, upper = build_chains(merged)
+        upper.reverse()
+        self._lower, self._upper = lower, upper
+
+    def contains(self, point: Point) -> bool:
+        """
+        Проверяет, лежит ли точка внутри оболочки или на её границе, за O(log h).
+
+        Находит двоичным поиском ребро нижней и ребро верхней цепи над координатой x точки
+        и проверяет, что точка лежит не ниже первого и не выше второго.
+        """
+        lower, upper = self._lower, self._upper
+        if not lower:
+            return False
+        x, y = point
+
+        # Нижняя граница: первая вершина с абсциссой >= x
+        i = bisect_left(lower, (x, float('-inf')))
+        if i == len(lower):
+            return False
+        if lower[i][0] == x:
+            if y < lower[i][1]:
+                return False
+        elif i == 0 or cross_product(lower[i - 1], lower[i], point) < 0:
+            return False
+
+        # Верхняя граница: последняя вершина с абсциссой <= x
+        j = bisect_right(upper, (x, float('inf'))) - 1
+        if j < 0:
+            return False
+        if upper[j][0] == x:
+            return y <= upper[j][1]
+        return j + 1 < len(upper) and cross_product(upper[j], upper[j + 1], point) <= 0
+
+    def vertices(self) -> list[Point]:
+        """
+        Возвращает вершины оболочки против часовой стрелки, начиная с самой левой (и нижней) точки,
+        в том же порядке, что и convex_hull.monotone_chain.
+        """
+        if len(self._lower) <= 1:
+            return list(self._lower)
+        return self._lower[:-1] + self._upper[:0:-1]
+
+
+if __name__ == "__main__":
+    hull = IncrementalHull([(0, 0), (4, 0), (0, 4)])
+    print("Initial hull:", hull.vertices())
+
+    hull.add((4, 4))
+    print("After adding (4, 4):", hull.vertices())
+
+    hull.merge([(2, 2), (1, 3), (6, 2), (2, -1)])
+    print("After merging a batch:", hull.vertices())
+
+    for point in [(2, 2), (6, 2), (7, 2), (0, 5)]:
+        print(f"Point {point} inside hull:", hull.contains(point))
@@ -0,0 +1,234 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from itertools import combinations
+from typing import Iterator
+
+from Lab2 import (Point, Segment, points_to_line, line_intersection, is_point_on_segment, scaled_uncertainty,
+                  segments_intersection)
+
+
+def _normalize(segments: list[Segment]) -> list[Segment]:
+    """
+    Упорядочивает концы каждого отрезка: левый (при равенстве x — нижний) идёт первым.
+    """
+    return [tuple(sorted(segment)) for segment in segments]
+
+
+def _is_vertical(segment: Segment, eps: float) -> bool:
+    """
+    Вертикален ли отрезок (точка тоже считается вертикальным отрезком).
+    """
+    (x1, _), (x2, _) = segment
+    return abs(x2 - x1) < eps
+
+
+def _slope(segment: Segment) -> float:
+    """
+    Наклон невертикального отрезка.
+    """
+    (x1, y1), (x2, y2) = segment
+    return (y2 - y1) / (x2 - x1)
+
+
+def _same_point(a: Point, b: Point, eps: float) -> bool:
+    """
+    Совпадают ли точки с учётом погрешности.
+    """
+    return abs(a[0] - b[0]) <= eps and abs(a[1] - b[1]) <= eps
+
+
+def _is_after(pt: Point, event: Point, eps: float) -> bool:
+    """
+    Лежит ли точка строго правее события (или выше при той же абсциссе) с учётом погрешности.
+    """
+    return pt[0] > event[0] + eps or (abs(pt[0] - event[0]) <= eps and pt[1] > event[1] + eps)
+
+
+def _sweep(segments: list[Segment], first_only: bool) -> Iterator[tuple[Point, list[int]]]:
+    """
+    Заметающая прямая Бентли–Оттмана, движущаяся слева направо.
+
+    Состояние прямой — список индексов невертикальных отрезков, упорядоченных по ординате
+    в текущей абсциссе; поиск в нём двоичный, проверяются только соседние отрезки.
+    Сравнений O((N + K) log N), где K — количество пересечений; вставка и удаление в списке
+    сдвигают его хвост, так что в худшем случае добавляется O(N) на событие.
+
+    Вертикальные отрезки в состояние не попадают: в событии нижнего конца отрезки состояния
+    с ординатой в его диапазоне ищутся двоичным поиском, и для каждого ставится событие
+    точно на этой вертикали. Пока вертикаль «открыта», она добавляется ко всем событиям
+    на ней. Абсциссы точек пересечения притягиваются к абсциссам концов, если отличаются
+    меньше чем на погрешность, — тогда совпадающие с погрешностью события идут в куче подряд.
+
+    Погрешность одна на весь набор — scaled_uncertainty по всем координатам, как
+    в is_point_on_segment: при координатах порядка 10^6 точка пересечения, посчитанная
+    line_intersection, отличается от точной больше чем на UNCERTAINTY.
+
+    При first_only поиск останавливается на первом найденном пересечении (алгоритм Шамоса–Хоя).
+    """
+    segments = _normalize(segments)
+    if not segments:
+        return
+    eps = scaled_uncertainty(*(c for segment in segments for point in segment for c in point))
+    lines = [points_to_line(*segment) for segment in segments]  # Уравнения прямых считаем один раз
+    vertical = [_is_vertical(segment, eps) for segment in segments]
+    slopes = [0.0 if vertical[i] else _slope(segment) for i, segment in enumerate(segments)]
+    xs = sorted({x for segment in segments for x, _ in segment})
+
+    starts: dict[Point, list[int]] = {}
+    events = []
+    for index, (left, right) in enumerate(segments):
+        starts.setdefault(left, []).append(index)
+        events.append(left)
+        events.append(right)
+    heapq.heapify(events)
+
+    status: list[int] = []
+    opened: list[int] = []  # Вертикальные отрезки, через абсциссу которых проходит прямая
+    current = (0.0, 0.0)  # Текущее событие — по нему считаются ключи отрезков в status
+
+    def y_at(index: int) -> float:
+        (x1, y1), (x2, y2) = segments[index]
+        return y1 + (y2 - y1) * (current[0] - x1) / (x2 - x1)
+
+    def snap(pt: Point) -> Point:
+        i = bisect_left(xs, pt[0] - eps)
+        if i < len(xs) and xs[i] <= pt[0] + eps:
+            return xs[i], pt[1]
+        return pt
+
+    def intersect(i: int, j: int):
+        pt = line_intersection(lines[i], lines[j])
+        if pt and is_point_on_segment(pt, segments[i]) and is_point_on_segment(pt, segments[j]):
+            return snap(pt)
+        return None
+
+    def check(i: int, j: int):
+        pt = intersect(i, j)
+        if pt is None:
+            return None
+        if first_only:
+            return pt, sorted((i, j))
+        if _is_after(pt, current, eps):
+            heapq.heappush(events, pt)
+        return None
+
+    while events:
+        current = heapq.heappop(events)
+        upper = list(starts.pop(current, ()))
+
+        # Сливаем события, совпадающие с текущим с учётом погрешности
+        while events and _same_point(events[0], current, eps):
+            upper.extend(starts.pop(heapq.heappop(events), ()))
+
+        # Вертикали закрываются, когда прямая ушла с их абсциссы или выше их верхнего конца
+        opened = [i for i in opened if abs(segments[i][0][0] - current[0]) <= eps
+                  and segments[i][1][1] >= current[1] - eps]
+        covering = list(opened)
+        new_vertical = [i for i in upper if vertical[i]]
+        upper = [i for i in upper if not vertical[i]]
+
+        # Отрезки, проходящие через событие или заканчивающиеся в нём, идут в status подряд
+        lo = bisect_left(status, current[1] - eps, key=y_at)
+        hi = bisect_right(status, current[1] + eps, key=y_at)
+        through = status[lo:hi]
+
+        # Новые вертикали: отрезки состояния в их диапазоне ординат дают события на вертикали
+        for i in new_vertical:
+            top = segments[i][1][1]
+            end = bisect_right(status, top + eps, key=y_at)
+            for j in status[hi:end]:
+                if first_only:
+                    yield (current[0], y_at(j)), sorted((i, j))
+                    return
+                heapq.heappush(events, (current[0], y_at(j)))
+            opened.append(i)
+
+        ending = [i for i in through if _same_point(segments[i][1], current, eps)]
+        crossing = [i for i in through if i not in ending]
+
+        # Как и в segments_intersection, параллельные (в том числе наложенные) отрезки
+        # пересечением не считаются: событие нужно, если в нём сходятся непараллельные
+        involved = sorted(upper + through + covering + new_vertical)
+        if any(line_intersection(lines[i], lines[j]) for i, j in combinations(involved, 2)):
+            yield current, involved
+            if first_only:
+                return
+
+        # Отрезки, которые продолжаются правее события, в порядке возрастания наклона
+        continuing = sorted(upper + crossing, key=lambda i: slopes[i])
+        status[lo:hi] = continuing
+
+        if not continuing:
+            if 0 < lo < len(status):
+                found = check(status[lo - 1], status[lo])
+                if found:
+                    yield found
+                    return
+            continue
+
+        if lo > 0:
+            found = check(status[lo - 1], continuing[0])
+            if found:
+                yield found
+                return
+        after = lo + len(continuing)
+        if after < len(status):
+            found = check(continuing[-1], status[after])
+            if found:
+                yield found
+                return
+
+
+def segment_intersections(segments: list[Segment]) -> Iterator[tuple[Point, list[int]]]:
+    """
+    Находит все точки пересечения набора отрезков алгоритмом Бентли–Оттмана.
+
+    Касание концами тоже считается пересечением, а параллельные отрезки — нет,
+    как в segments_intersection. Точки, совпадающие с точностью до погрешности
+    (scaled_uncertainty по координатам набора), объединяются в одну.
+
+    Аргументы:
+        segments (list[Segment]): Список отрезков.
+
+    Возвращает:
+        Iterator[tuple[Point, list[int]]]: Точки пересечения слева направо и индексы
+        всех отрезков, проходящих через каждую из них.
+    """
+    return _sweep(segments, first_only=False)
+
+
+def intersecting_pairs(segments: list[Segment]) -> set[tuple[int, int]]:
+    """
+    Возвращает множество пар индексов пересекающихся отрезков.
+
+    Пары из одного события сверяются segments_intersection: в событие попадают и отрезки,
+    прошедшие ближе погрешности от точки, и параллельные отрезки — в пару они не входят.
+    """
+    pairs = set()
+    for _, indices in segment_intersections(segments):
+        pairs.update(pair for pair in combinations(indices, 2)
+                     if segments_intersection(segments[pair[0]], segments[pair[1]]))
+    return pairs
+
+
+def any_segments_intersect(segments: list[Segment]) -> bool:
+    """
+    Проверяет, пересекаются ли хотя бы два отрезка (алгоритм Шамоса–Хоя, O(N log N)).
+
+    Останавливается на первом пересечении соседних отрезков, не обрабатывая точки пересечения.
+    """
+    return next(_sweep(segments, first_only=True), None) is not None
+
+
+if __name__ == "__main__":
+    segments = [
+        ((0, 0), (4, 4)),
+        ((0, 4), (4, 0)),
+        ((1, 3), (3, 3)),
+        ((2, -1), (2, 5)),
+        ((5, 5), (6, 6)),
+    ]
+    for point, indices in segment_intersections(segments):
+        print(f"Point {point}: segments {indices}")
+    print("Any intersection:", any_segments_intersect(segments))
+    print("Any intersection:", any_segments_intersect([((0, 0), (1, 0)), ((0, 1), (1, 1))]))
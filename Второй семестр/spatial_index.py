@@ -0,0 +1,377 @@
+import heapq
+import math
+from collections import defaultdict
+from itertools import combinations
+from typing import Callable, Iterator, NewType, Optional
+
+from Lab2 import Point, Segment, Circle, Triangle, distance, circles_intersection
+
+Box = NewType("Box", tuple[float, float, float, float])  # (xmin, ymin, xmax, ymax)
+
+
+def point_box(pt: Point) -> Box:
+    """
+    Ограничивающий прямоугольник точки (вырожденный).
+    """
+    x, y = pt
+    return (x, y, x, y)
+
+
+def segment_box(segment: Segment) -> Box:
+    """
+    Ограничивающий прямоугольник отрезка.
+    """
+    (x1, y1), (x2, y2) = segment
+    return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
+
+def circle_box(circle: Circle) -> Box:
+    """
+    Ограничивающий прямоугольник окружности.
+    """
+    (x, y), r = circle
+    return (x - r, y - r, x + r, y + r)
+
+
+def triangle_box(triangle: Triangle) -> Box:
+    """
+    Ограничивающий прямоугольник треугольника.
+    """
+    xs = [p[0] for p in triangle]
+    ys = [p[1] for p in triangle]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def boxes_overlap(a: Box, b: Box) -> bool:
+    """
+    Пересекаются ли прямоугольники (касание тоже считается пересечением).
+    """
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def box_distance(box: Box, pt: Point) -> float:
+    """
+    Расстояние от точки до прямоугольника (0, если точка внутри).
+    """
+    dx = max(box[0] - pt[0], 0, pt[0] - box[2])
+    dy = max(box[1] - pt[1], 0, pt[1] - box[3])
+    return math.hypot(dx, dy)
+
+
+def _union(boxes: list[Box]) -> Box:
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+class STRtree:
+    """
+    R-дерево, построенное пакетной загрузкой Sort-Tile-Recursive (STR).
+
+    Прямоугольники сортируются по x, режутся на вертикальные полосы, внутри полосы
+    сортируются по y и группируются по node_capacity. Затем то же повторяется для
+    прямоугольников узлов, пока не останется один корень. Дерево статическое:
+    построение O(n log n), запрос по прямоугольнику — O(log n + k).
+    """
+
+    def __init__(self, boxes: list[Box], node_capacity: int = 16):
+        self.boxes = list(boxes)
+        self.node_capacity = node_capacity
+        # levels[0] — листья (дети — индексы объектов), levels[-1] — корень
+        self.levels: list[tuple[list[Box], list[list[int]]]] = []
+
+        entries = list(enumerate(self.boxes))
+        while entries:
+            level = self._pack(entries)
+            self.levels.append(level)
+            if len(level[0]) == 1:
+                break
+            entries = list(enumerate(level[0]))
+
+    def _pack(self, entries: list[tuple[int, Box]]) -> tuple[list[Box], list[list[int]]]:
+        """
+        Группирует прямоугольники одного уровня в узлы следующего.
+        """
+        capacity = self.node_capacity
+        node_count = math.ceil(len(entries) / capacity)
+        slice_size = math.ceil(math.sqrt(node_count)) * capacity
+
+        entries.sort(key=lambda e: e[1][0] + e[1][2])
+        node_boxes, node_children = [], []
+        for start in range(0, len(entries), slice_size):
+            strip = sorted(entries[start:start + slice_size], key=lambda e: e[1][1] + e[1][3])
+            for offset in range(0, len(strip), capacity):
+                group = strip[offset:offset + capacity]
+                node_boxes.append(_union([box for _, box in group]))
+                node_children.append([index for index, _ in group])
+        return node_boxes, node_children
+
+    def query(self, box: Box) -> list[int]:
+        """
+        Возвращает индексы объектов, чьи прямоугольники пересекают box.
+        """
+        if not self.levels:
+            return []
+        result = []
+        top = len(self.levels) - 1
+        stack = [(top, 0)]
+        while stack:
+            level, node = stack.pop()
+            node_boxes, node_children = self.levels[level]
+            if not boxes_overlap(node_boxes[node], box):
+                continue
+            if level == 0:
+                result.extend(i for i in node_children[node] if boxes_overlap(self.boxes[i], box))
+            else:
+                stack.extend((level - 1, child) for child in node_children[node])
+        return result
+
+    def nearest(self, pt: Point, k: int = 1,
+                item_distance: Optional[Callable[[int, Point], float]] = None) -> list[tuple[float, int]]:
+        """
+        Поиск k ближайших объектов обходом «лучший-первый».
+
+        Расстояние до прямоугольника — нижняя оценка; точное расстояние до объекта
+        считается функцией item_distance(index, pt) только когда объект достаётся из кучи.
+        По умолчанию используется расстояние до прямоугольника, что для точек совпадает с distance.
+
+        Возвращает:
+            list[tuple[float, int]]: Пары (расстояние, индекс) по возрастанию расстояния.
+        """
+        if not self.levels:
+            return []
+        top = len(self.levels) - 1
+        heap = [(0.0, 0, top, 0)]  # (оценка, вид: 0 — узел, 1 — объект с оценкой, 2 — точное)
+        result = []
+        while heap and len(result) < k:
+            dist, kind, level, index = heapq.heappop(heap)
+            if kind == 2:
+                result.append((dist, index))
+            elif kind == 1:
+                exact = item_distance(index, pt) if item_distance else dist
+                heapq.heappush(heap, (exact, 2, -1, index))
+            else:
+                node_boxes, node_children = self.levels[level]
+                for child in node_children[index]:
+                    if level == 0:
+                        heapq.heappush(heap, (box_distance(self.boxes[child], pt), 1, -1, child))
+                    else:
+                        heapq.heappush(heap, (box_distance(self.levels[level - 1][0][child], pt), 0, level - 1, child))
+        return result
+
+    def pairs(self) -> Iterator[tuple[int, int]]:
+        """
+        Широкая фаза: все пары (i, j), i < j, с пересекающимися прямоугольниками.
+
+        Дерево соединяется само с собой: спускаемся одновременно по парам узлов одного
+        уровня и отбрасываем пары, чьи прямоугольники не пересекаются.
+        """
+        if not self.levels:
+            return
+        boxes = self.boxes
+        stack = [(len(self.levels) - 1, 0, 0)]
+        while stack:
+            level, a, b = stack.pop()
+            node_children = self.levels[level][1]
+            if level == 0:
+                if a == b:
+                    candidates = combinations(node_children[a], 2)
+                else:
+                    candidates = ((i, j) for i in node_children[a] for j in node_children[b])
+                for i, j in candidates:
+                    if boxes_overlap(boxes[i], boxes[j]):
+                        yield (i, j) if i < j else (j, i)
+                continue
+
+            child_boxes = self.levels[level - 1][0]
+            first, second = node_children[a], node_children[b]
+            for offset, x in enumerate(first):
+                for y in (first[offset:] if a == b else second):
+                    if boxes_overlap(child_boxes[x], child_boxes[y]):
+                        stack.append((level - 1, x, y))
+
+
+class UniformGrid:
+    """
+    Равномерная сетка-хеш: каждая клетка хранит индексы объектов, чьи прямоугольники её задевают.
+
+    Хорошо работает, когда объекты примерно одного размера: размер клетки по умолчанию
+    равен среднему размеру прямоугольника, и каждый объект попадает в O(1) клеток.
+    """
+
+    def __init__(self, boxes: list[Box], cell_size: Optional[float] = None):
+        self.boxes = list(boxes)
+        if cell_size is None:
+            cell_size = self._default_cell_size()
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for index, box in enumerate(self.boxes):
+            x0, y0, x1, y1 = self._cell_range(box)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    self.cells[(cx, cy)].append(index)
+        # Границы занятых клеток — дальше последнего кольца поиск ближайших не идёт
+        if self.cells:
+            xs = [cx for cx, _ in self.cells]
+            ys = [cy for _, cy in self.cells]
+            self._cell_bounds = (min(xs), min(ys), max(xs), max(ys))
+
+    def _default_cell_size(self) -> float:
+        if not self.boxes:
+            return 1.0
+        mean_extent = sum(max(b[2] - b[0], b[3] - b[1]) for b in self.boxes) / len(self.boxes)
+        if mean_extent > 0:
+            return mean_extent
+        # Точки: клетка, в которой в среднем оказывается около одной точки
+        extent = _union(self.boxes)
+        side = max(extent[2] - extent[0], extent[3] - extent[1])
+        return side / math.sqrt(len(self.boxes)) if side > 0 else 1.0
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _cell_range(self, box: Box) -> tuple[int, int, int, int]:
+        x0, y0 = self._cell(box[0], box[1])
+        x1, y1 = self._cell(box[2], box[3])
+        return x0, y0, x1, y1
+
+    def query(self, box: Box) -> list[int]:
+        """
+        Возвращает индексы объектов, чьи прямоугольники пересекают box.
+        """
+        x0, y0, x1, y1 = self._cell_range(box)
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for i in self.cells.get((cx, cy), ()):
+                    if i not in found and boxes_overlap(self.boxes[i], box):
+                        found.add(i)
+        return list(found)
+
+    @staticmethod
+    def _ring(cx: int, cy: int, ring: int) -> Iterator[tuple[int, int]]:
+        """
+        Клетки на границе квадрата радиуса ring вокруг (cx, cy) — 8 · ring клеток.
+        """
+        if ring == 0:
+            yield cx, cy
+            return
+        for x in range(cx - ring, cx + ring + 1):
+            yield x, cy - ring
+            yield x, cy + ring
+        for y in range(cy - ring + 1, cy + ring):
+            yield cx - ring, y
+            yield cx + ring, y
+
+    def nearest(self, pt: Point, k: int = 1,
+                item_distance: Optional[Callable[[int, Point], float]] = None) -> list[tuple[float, int]]:
+        """
+        Поиск k ближайших объектов обходом колец клеток вокруг точки.
+
+        Кольцо r отстоит от точки не меньше чем на (r - 1) * cell_size, поэтому обход
+        прекращается, как только k-е найденное расстояние не превышает этой границы.
+        Обход начинается с первого кольца, задевающего занятые клетки. Когда в кольце
+        становится больше клеток, чем занятых клеток в сетке (точка далеко или сетка
+        разрежена), оставшиеся занятые клетки перебираются напрямую по удалённости.
+
+        Возвращает:
+            list[tuple[float, int]]: Пары (расстояние, индекс) по возрастанию расстояния.
+        """
+        if not self.cells or k <= 0:
+            return []
+        measure = item_distance or (lambda i, p: box_distance(self.boxes[i], p))
+        cx, cy = self._cell(*pt)
+        x0, y0, x1, y1 = self._cell_bounds
+        max_ring = max(cx - x0, x1 - cx, cy - y0, y1 - cy)
+        first_ring = max(x0 - cx, cx - x1, y0 - cy, cy - y1, 0)
+
+        seen = set()
+        best = []  # Куча с обратным знаком: k лучших на данный момент
+
+        def done(ring: int) -> bool:
+            return len(best) == k and -best[0][0] <= (ring - 1) * self.cell_size
+
+        def visit(cell: tuple[int, int]) -> None:
+            for i in self.cells.get(cell, ()):
+                if i in seen:
+                    continue
+                seen.add(i)
+                d = measure(i, pt)
+                if len(best) < k:
+                    heapq.heappush(best, (-d, i))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, i))
+
+        for ring in range(first_ring, max_ring + 1):
+            if done(ring):
+                break
+            if 8 * ring >= len(self.cells):
+                rest = sorted((max(abs(x - cx), abs(y - cy)), (x, y)) for x, y in self.cells)
+                for cell_ring, cell in rest:
+                    if cell_ring < ring:
+                        continue  # Кольцо уже пройдено
+                    if done(cell_ring):
+                        break
+                    visit(cell)
+                break
+            for cell in self._ring(cx, cy, ring):
+                visit(cell)
+        return sorted((-d, i) for d, i in best)
+
+    def pairs(self) -> Iterator[tuple[int, int]]:
+        """
+        Широкая фаза: все пары (i, j), i < j, с пересекающимися прямоугольниками.
+
+        Пара, задевающая несколько общих клеток, выдаётся только в клетке, где лежит
+        левый нижний угол пересечения их прямоугольников, — без множества уже выданных пар.
+        """
+        boxes = self.boxes
+        for cell, members in self.cells.items():
+            for i, j in combinations(sorted(members), 2):
+                a, b = boxes[i], boxes[j]
+                if not boxes_overlap(a, b):
+                    continue
+                if self._cell(max(a[0], b[0]), max(a[1], b[1])) == cell:
+                    yield i, j
+
+
+def nearest_points(points: list[Point], query: Point, k: int = 1) -> list[tuple[float, int]]:
+    """
+    k ближайших к query точек по расстоянию distance из Lab2 (через STR R-дерево).
+    """
+    tree = STRtree([point_box(p) for p in points])
+    return tree.nearest(query, k, item_distance=lambda i, p: distance(points[i], p))
+
+
+def intersecting_circles(circles: list[Circle], index: str = "grid") -> Iterator[tuple[int, int, list[Point]]]:
+    """
+    Находит пары окружностей с общими точками.
+
+    Широкая фаза отбирает пары с пересекающимися прямоугольниками через сетку ("grid")
+    или R-дерево ("rtree"); точная проверка — circles_intersection из Lab2.
+
+    Возвращает:
+        Iterator[tuple[int, int, list[Point]]]: Индексы пары и точки пересечения.
+    """
+    boxes = [circle_box(c) for c in circles]
+    structure = UniformGrid(boxes) if index == "grid" else STRtree(boxes)
+    for i, j in structure.pairs():
+        points = circles_intersection(circles[i], circles[j])
+        if points:
+            yield i, j, points
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    random.seed(0)
+    n = 10 ** 5
+    circles = [((random.uniform(0, 1000), random.uniform(0, 1000)), random.uniform(0.5, 2)) for _ in range(n)]
+
+    for kind in ("grid", "rtree"):
+        start = time.perf_counter()
+        count = sum(1 for _ in intersecting_circles(circles, kind))
+        print(f"{kind}: {count} intersecting pairs among {n} circles in {time.perf_counter() - start:.2f} s")
+
+    points = [c[0] for c in circles]
+    print("3 nearest points to (500, 500):", nearest_points(points, (500, 500), k=3))
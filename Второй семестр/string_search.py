@@ -0,0 +1,170 @@
+import mmap
+import random
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterator, Sequence, Union
+
+from Lab3_automat import finite_automata_iter
+from Lab4 import KMPMatcher
+from Lab5 import boyer_moore_iter, horspool_iter, sunday_iter
+from Lab6 import rk_iter
+
+Text = Union[str, bytes, bytearray, memoryview, mmap.mmap, Sequence]
+
+# Пороги автоматического выбора. Обоснование — замеры на benchmark_corpus()
+# (python string_search.py печатает ту же таблицу):
+# - для str / bytes / bytearray / mmap встроенный find (реализован на C) быстрее любого
+#   из алгоритмов Lab3–Lab6 в 10–1000 раз на всех корпусах и длинах образца;
+# - для прочих последовательностей (списки токенов, memoryview) при m <= 4 выигрывает
+#   КМП: у Хорспула и Санди сдвиги не больше m, а подготовка таблицы не окупается;
+# - на алфавите из двух символов сдвиги по плохому символу почти бесполезны: до m = 64
+#   остаётся быстрее КМП, с m >= 64 — полный Бойер-Мур за счёт правила хорошего суффикса;
+# - в остальных случаях быстрее всех Хорспул (Санди — в пределах погрешности).
+# Размер текста на порядок алгоритмов не влиял (проверено для n от 64 до 2·10^5),
+# поэтому порога по нему нет: короткий текст лишь отсекается, если он короче образца.
+SHORT_PATTERN = 4
+LONG_PATTERN = 64
+SMALL_ALPHABET = 2
+
+_NATIVE = (str, bytes, bytearray, mmap.mmap)
+
+
+def find_iter(text: Text, pattern: Text) -> Iterator[int]:
+    """
+    Перебирает вхождения встроенным методом find (включая перекрывающиеся).
+    """
+    i = text.find(pattern)
+    while i != -1:
+        yield i
+        i = text.find(pattern, i + 1)
+
+
+def kmp_iter(text: Text, pattern: Text) -> Iterator[int]:
+    """
+    Вхождения алгоритмом КМП (Lab4.KMPMatcher на одном фрагменте).
+    """
+    return KMPMatcher(pattern).feed(text)
+
+
+ALGORITHMS: Dict[str, Callable[[Text, Text], Iterator[int]]] = {
+    "find": find_iter,
+    "automaton": finite_automata_iter,
+    "kmp": kmp_iter,
+    "boyer_moore": boyer_moore_iter,
+    "horspool": horspool_iter,
+    "sunday": sunday_iter,
+    "rabin_karp": rk_iter,
+}
+
+
+def choose_algorithm(text: Text, pattern: Text) -> str:
+    """
+    Выбирает алгоритм по типу текста, длине образца и размеру его алфавита.
+
+    Размер алфавита оценивается по образцу (число различных символов в нём):
+    это O(m) и не требует просмотра текста.
+    """
+    if isinstance(text, _NATIVE):
+        return "find"
+    m = len(pattern)
+    if m <= SHORT_PATTERN:
+        return "kmp"
+    if len(set(pattern)) <= SMALL_ALPHABET:
+        return "boyer_moore" if m >= LONG_PATTERN else "kmp"
+    return "horspool"
+
+
+def search(text: Text, pattern: Text, *, all: bool = True, algorithm: str = "auto") -> Iterator[int]:
+    """
+    Единая точка входа для поиска подстроки.
+
+    Все алгоритмы возвращают ленивый итератор индексов начала вхождений (перекрывающиеся
+    вхождения тоже выдаются), поэтому при all=False поиск останавливается на первом
+    вхождении, а не просматривает весь текст.
+
+    Аргументы:
+        text: Текст — str, bytes-подобный объект, mmap или последовательность токенов.
+        pattern: Образец того же вида (непустой).
+        all (bool): Все вхождения (True) или только первое (False).
+        algorithm (str): "auto" или одно из имён ALGORITHMS; "find" — только для str, bytes,
+            bytearray и mmap (у остальных последовательностей нет метода find).
+
+    Возвращает:
+        Iterator[int]: Индексы начала вхождений по возрастанию.
+    """
+    if not len(pattern):
+        raise ValueError("Pattern must not be empty")
+    if algorithm == "auto":
+        algorithm = choose_algorithm(text, pattern)
+    elif algorithm == "find" and not isinstance(text, _NATIVE):
+        raise ValueError(f"Algorithm 'find' needs str, bytes, bytearray or mmap text, not {type(text).__name__}")
+    try:
+        found = ALGORITHMS[algorithm](text, pattern)
+    except KeyError:
+        raise ValueError(f"Unknown algorithm: {algorithm}") from None
+    return found if all else islice(found, 1)
+
+
+def benchmark_corpus(size: int = 200_000, seed: int = 0) -> Dict[str, tuple]:
+    """
+    Общий корпус для замеров: тексты с разными алфавитами и образцы разной длины.
+
+    Образцы вырезаются из самого текста, поэтому хотя бы одно вхождение есть всегда.
+
+    Возвращает:
+        Dict[str, tuple]: Имя корпуса -> (текст, список образцов).
+    """
+    rng = random.Random(seed)
+    words = ("алгоритм поиска подстроки в строке работает быстрее если образец длинный "
+             "а алфавит текста достаточно велик для больших сдвигов").split()
+    texts = {
+        "binary": "".join(rng.choices("01", k=size)),
+        "dna": "".join(rng.choices("ACGT", k=size)),
+        "russian": " ".join(rng.choice(words) for _ in range(size // 7))[:size],
+        "bytes": bytes(rng.randrange(256) for _ in range(size)),
+        "binary tokens": rng.choices(range(2), k=size),
+        "tokens": rng.choices(range(1000), k=size),
+    }
+    corpus = {}
+    for name, text in texts.items():
+        patterns = []
+        for m in (2, 4, 8, 16, 64, 256):
+            start = rng.randrange(len(text) - m)
+            patterns.append(text[start:start + m])
+        corpus[name] = (text, patterns)
+    return corpus
+
+
+def benchmark(corpus: Dict[str, tuple], algorithms: Sequence[str] = tuple(ALGORITHMS)) -> list[tuple]:
+    """
+    Замеряет время поиска всех вхождений каждым алгоритмом.
+
+    Возвращает:
+        list[tuple]: Строки (корпус, длина образца, {алгоритм: секунды}, выбор auto).
+    """
+    rows = []
+    for name, (text, patterns) in corpus.items():
+        for pattern in patterns:
+            timings = {}
+            for algorithm in algorithms:
+                if algorithm == "find" and not isinstance(text, _NATIVE):
+                    continue
+                start = time.perf_counter()
+                for _ in search(text, pattern, algorithm=algorithm):
+                    pass
+                timings[algorithm] = time.perf_counter() - start
+            rows.append((name, len(pattern), timings, choose_algorithm(text, pattern)))
+    return rows
+
+
+if __name__ == "__main__":
+    text = "abcababdabaabaabca"
+    print(f"All occurrences of 'aba': {list(search(text, 'aba'))}")  # Ожидается: [3, 8, 11]
+    print(f"First occurrence via KMP: {list(search(text, 'aba', all=False, algorithm='kmp'))}")
+    print(f"Token sequence: {list(search([1, 2, 1, 2, 1], [1, 2, 1]))}")  # Ожидается: [0, 2]
+
+    print("\ncorpus          m    auto         fastest      times, ms")
+    for name, m, timings, chosen in benchmark(benchmark_corpus()):
+        fastest = min(timings, key=timings.get)
+        times = " ".join(f"{algorithm}={seconds * 1000:.1f}" for algorithm, seconds in timings.items())
+        print(f"{name:<15} {m:<4} {chosen:<12} {fastest:<12} {times}")
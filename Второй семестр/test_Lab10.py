@@ -0,0 +1,74 @@
+import random
+from functools import lru_cache
+
+import pytest
+
+from Lab10 import drop_strategy, egg_drop, floors_covered, min_throws, min_throws_many
+
+
+@lru_cache(maxsize=None)
+def classic(eggs, floors):
+    # Классическая рекуррентность: бросок с этажа x делит задачу на две части
+    if floors == 0:
+        return 0
+    if eggs == 1:
+        return floors
+    return 1 + min(max(classic(eggs - 1, x - 1), classic(eggs, floors - x)) for x in range(1, floors + 1))
+
+
+def run(eggs, floors, critical):
+    """
+    Проводит стратегию при заданном критическом этаже; возвращает (ответ, броски, разбитые яйца).
+    """
+    strategy = drop_strategy(eggs, floors)
+    throws = broken = 0
+    try:
+        floor = next(strategy)
+        while True:
+            throws += 1
+            breaks = floor > critical
+            broken += breaks
+            floor = strategy.send(breaks)
+    except StopIteration as stop:
+        return stop.value, throws, broken
+
+
+def test_min_throws_matches_classic_dp():
+    for eggs in range(1, 6):
+        for floors in range(0, 60):
+            assert min_throws(eggs, floors) == egg_drop(eggs, floors) == classic(eggs, floors), (eggs, floors)
+    assert min_throws(0, 10) == -1 and min_throws(0, 0) == 0
+
+
+def test_floors_covered_is_inverse_of_min_throws():
+    rng = random.Random(48)
+    for _ in range(500):
+        eggs, floors = rng.randint(1, 70), rng.randint(1, 10 ** 18)
+        throws = min_throws(eggs, floors)
+        assert floors_covered(eggs, throws) >= floors > floors_covered(eggs, throws - 1)
+
+
+def test_strategy_finds_every_critical_floor():
+    for eggs in range(1, 5):
+        for floors in range(0, 40):
+            for critical in range(floors + 1):
+                found, throws, broken = run(eggs, floors, critical)
+                assert found == critical
+                assert throws <= min_throws(eggs, floors) and broken <= eggs
+
+
+def test_strategy_on_huge_building():
+    rng = random.Random(480)
+    for _ in range(50):
+        # С 1–2 яйцами бросков порядка n или sqrt(n), поэтому огромные здания — от трёх яиц
+        eggs, floors = rng.randint(3, 40), rng.randint(1, 10 ** 12)
+        critical = rng.randint(0, floors)
+        found, throws, broken = run(eggs, floors, critical)
+        assert found == critical and throws <= min_throws(eggs, floors) and broken <= eggs
+
+
+def test_many_queries_and_errors():
+    queries = [(2, 100), (3, 1000), (2, 100), (1, 7)]
+    assert min_throws_many(queries) == [min_throws(*query) for query in queries]
+    with pytest.raises(ValueError):
+        next(drop_strategy(0, 10))
@@ -0,0 +1,102 @@
+import random
+import time
+from itertools import product
+
+import pytest
+
+from Lab11 import can_color, color_graph, find_min_colors
+
+
+def random_graph(rng, n, p):
+    graph = {v: [] for v in range(n)}
+    for v in range(n):
+        for u in range(v + 1, n):
+            if rng.random() < p:
+                graph[v].append(u)
+                graph[u].append(v)
+    return graph
+
+
+def chromatic_number(graph):
+    nodes = list(graph)
+    for k in range(1, len(nodes) + 1):
+        for colors in product(range(k), repeat=len(nodes)):
+            coloring = dict(zip(nodes, colors))
+            if all(coloring[v] != coloring[u] for v in graph for u in graph[v]):
+                return k
+    return 0
+
+
+def is_proper(graph, coloring, k):
+    return (all(1 <= coloring[v] <= k for v in graph)
+            and all(coloring[v] != coloring[u] for v in graph for u in graph[v]))
+
+
+def test_matches_brute_force():
+    rng = random.Random(49)
+    for _ in range(150):
+        graph = random_graph(rng, rng.randint(1, 7), rng.random())
+        expected = chromatic_number(graph)
+        k, coloring = find_min_colors(graph)
+        assert k == expected and is_proper(graph, coloring, k), graph
+        for limit in range(1, len(graph) + 1):
+            found = can_color(graph, limit)
+            assert (found is not None) == (limit >= expected), (graph, limit)
+            assert found is None or is_proper(graph, found, limit)
+
+
+def test_parallel_search_matches_serial():
+    rng = random.Random(50)
+    for _ in range(3):
+        graph = random_graph(rng, 40, 0.5)
+        serial = color_graph(graph)
+        parallel = color_graph(graph, processes=2)
+        assert parallel.count == serial.count and parallel.optimal
+        assert is_proper(graph, parallel.colors, parallel.count)
+        assert can_color(graph, serial.count - 1, processes=2) is None
+
+
+def test_interval_graph_needs_no_search():
+    # Интервальный граф хордален: клика из порядка максимальной мощности равна ω
+    rng = random.Random(5)
+    intervals = [(a, a + rng.uniform(0, 30)) for a in (rng.uniform(0, 1000) for _ in range(1000))]
+    graph = {i: [j for j, (c, d) in enumerate(intervals) if j != i and a <= d and c <= b]
+             for i, (a, b) in enumerate(intervals)}
+    points = sorted({a for a, _ in intervals})
+    omega = max(sum(a <= x <= b for a, b in intervals) for x in points)
+    result = color_graph(graph, time_limit=5)
+    assert result.optimal and result.count == result.lower_bound == omega
+
+
+def sparse_random_graph():
+    rng = random.Random(0)
+    n = 3000
+    graph = {v: [] for v in range(n)}
+    for _ in range(n * 9 // 2):
+        v, u = rng.sample(range(n), 2)
+        graph[v].append(u)
+        graph[u].append(v)
+    return graph
+
+
+def test_can_color_time_limit():
+    graph = sparse_random_graph()
+    result = color_graph(graph, time_limit=0.5)
+    assert is_proper(graph, result.colors, result.count)
+    assert result.lower_bound < result.count - 1
+    with pytest.raises(TimeoutError):
+        can_color(graph, result.lower_bound + 1, time_limit=0.5)
+
+
+def test_parallel_time_limit():
+    # Подзадачи на пуле процессов тоже должны укладываться в time_limit
+    graph = sparse_random_graph()
+    start = time.monotonic()
+    result = color_graph(graph, time_limit=0.5, processes=2)
+    assert time.monotonic() - start < 3
+    assert not result.optimal and is_proper(graph, result.colors, result.count)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        can_color(graph, result.lower_bound + 1, time_limit=0.5, processes=2)
+    assert time.monotonic() - start < 3
@@ -0,0 +1,95 @@
+import math
+import random
+from fractions import Fraction
+from itertools import combinations
+
+import pytest
+
+from Lab2 import (circle_line_discriminant_sign, circles_intersection, find_nested_triangles, is_point_inside_triangle,
+                  is_triangle_inside, line_circle_intersection, line_intersection, line_segment_intersection,
+                  points_to_line, segments_intersection, triangle_exists)
+
+
+def brute_force_nested(points):
+    triangles = [t for t in combinations(points, 3) if triangle_exists(t)]
+    return any(is_triangle_inside(a, b) or is_triangle_inside(b, a) for a, b in combinations(triangles, 2))
+
+
+def test_nested_triangles_match_brute_force():
+    rng = random.Random(31)
+    for _ in range(2000):
+        points = [(rng.randint(0, 4), rng.randint(0, 4)) for _ in range(rng.randint(0, 7))]
+        expected = brute_force_nested(points)
+        assert find_nested_triangles(points) == expected, points
+        pair = find_nested_triangles(points, witness=True)
+        assert (pair is not None) == expected
+        if pair:
+            inner, outer = pair
+            assert triangle_exists(inner) and triangle_exists(outer)
+            assert is_triangle_inside(inner, outer)
+            assert set(inner) | set(outer) <= set(points)
+
+
+def test_touching_segments_at_any_scale():
+    # Конец второго отрезка лежит на первом: результат не должен зависеть от масштаба
+    rng = random.Random(35)
+    for _ in range(500):
+        a, b, q = [(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(3)]
+        t = rng.uniform(0.1, 0.9)
+        p = (a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1]))
+        for scale in (1.0, 1e6):
+            first = ((a[0] * scale, a[1] * scale), (b[0] * scale, b[1] * scale))
+            second = ((p[0] * scale, p[1] * scale), (q[0] * scale, q[1] * scale))
+            assert segments_intersection(first, second) is not None, (first, second)
+            assert line_segment_intersection(points_to_line(*second), first) is not None
+            assert line_intersection(points_to_line(*first), points_to_line(*second)) is not None
+
+
+def exact_sign(line, circle):
+    (A, B, C), ((cx, cy), R) = line, circle
+    A, B, C, cx, cy, R = map(Fraction, (A, B, C, cx, cy, R))
+    value = R * R * (A * A + B * B) - (A * cx + B * cy + C) ** 2
+    return (value > 0) - (value < 0)
+
+
+@pytest.mark.parametrize("scale", [1, 10 ** 3, 10 ** 6, 10 ** 9])
+def test_line_circle_count_is_exact(scale):
+    # Касательные строятся по пифагоровым тройкам, поэтому касание точное и в целых числах
+    rng = random.Random(350)
+    for _ in range(500):
+        cx, cy, R = rng.randint(-9, 9) * scale, rng.randint(-9, 9) * scale, rng.randint(1, 9) * scale
+        a, b, c = rng.choice(((3, 4, 5), (5, 12, 13), (8, 15, 17), (1, 0, 1)))
+        shift = rng.choice((-1, 0, 1))  # Сдвиг на единицу даёт почти касание
+        line = (a, b, c * R - a * cx - b * cy + shift)
+        circle = ((cx, cy), R)
+        sign = circle_line_discriminant_sign(line, circle)
+        assert sign == exact_sign(line, circle), (line, circle)
+
+        points = line_circle_intersection(line, circle)
+        assert len(points) == sign + 1
+        for x, y in points:
+            assert math.hypot(x - cx, y - cy) == pytest.approx(R, rel=1e-9)
+            assert abs(a * x + b * y + line[2]) <= 1e-9 * c * max(abs(x), abs(y), 1)
+
+
+@pytest.mark.parametrize("scale", [1.0, 1e3, 1e6, 1e7])
+def test_tangent_circles_and_edge_points_at_any_scale(scale):
+    rng = random.Random(3500)
+    for _ in range(300):
+        # Центры на расстоянии c·k по пифагоровой тройке, сумма или разность радиусов равна ему
+        (cx, cy), k = (rng.uniform(-1, 1) * scale, rng.uniform(-1, 1) * scale), rng.uniform(0.01, 0.1) * scale
+        a, b, c = rng.choice(((3, 4, 5), (5, 12, 13), (8, 15, 17)))
+        r1 = rng.uniform(0.1, 0.9) * c * k
+        other = (cx + a * k, cy + b * k)
+        assert len(circles_intersection(((cx, cy), r1), (other, c * k - r1))) == 1
+        assert len(circles_intersection(((cx, cy), r1 + c * k), (other, r1))) == 1
+
+        # Точка на стороне треугольника считается внутри
+        tri = tuple((rng.uniform(-1, 1) * scale, rng.uniform(-1, 1) * scale) for _ in range(3))
+        t = rng.random()
+        edge_point = (tri[0][0] + t * (tri[1][0] - tri[0][0]), tri[0][1] + t * (tri[1][1] - tri[0][1]))
+        assert is_point_inside_triangle(edge_point, tri)
+        centroid = (sum(p[0] for p in tri) / 3, sum(p[1] for p in tri) / 3)
+        assert is_point_inside_triangle(centroid, tri)
+        outside = (2 * tri[0][0] - centroid[0], 2 * tri[0][1] - centroid[1])
+        assert not is_point_inside_triangle(outside, tri)
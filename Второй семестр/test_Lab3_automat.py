@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from Lab3_automat import finite_automata, finite_automata_iter
+
+
+def naive(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "abc", "abcxyz"])
+def test_str_matches_naive(alphabet):
+    rng = random.Random(37)
+    for _ in range(1000):
+        pattern = "".join(rng.choice(alphabet[:3]) for _ in range(rng.randint(1, 6)))
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 50)))
+        expected = naive(text, pattern)
+        assert list(finite_automata_iter(text, pattern)) == expected, (text, pattern)
+        assert finite_automata(text, pattern) == (expected[0] if expected else None)
+
+
+def test_bytes_matches_naive():
+    rng = random.Random(370)
+    for _ in range(500):
+        pattern = bytes(rng.choice(b"\x00\x80\xff") for _ in range(rng.randint(1, 5)))
+        text = bytes(rng.choice(b"\x00\x01\x80\xff") for _ in range(rng.randint(0, 50)))
+        assert list(finite_automata_iter(text, pattern)) == naive(text, pattern)
+
+
+def test_pattern_with_many_distinct_characters():
+    # 300 различных символов — перевод в классы идёт поэлементно, а не через str.translate
+    rng = random.Random(3700)
+    pattern = "".join(chr(0x400 + i) for i in range(300))
+    text = "".join(rng.choice(pattern[:5]) for _ in range(1000)) + pattern + pattern[:100] + pattern
+    assert list(finite_automata_iter(text, pattern)) == naive(text, pattern)
+
+
+def test_empty_pattern():
+    assert finite_automata("abc", "") == 0
+    assert list(finite_automata_iter("abc", "")) == naive("abc", "") == [0, 1, 2, 3]
+    assert list(finite_automata_iter(b"", b"")) == [0]
@@ -0,0 +1,54 @@
+import mmap
+import random
+from array import array
+
+import numpy as np
+
+from Lab4 import KMPMatcher, kmp_algorithm, kmp_stream
+
+
+def naive(text, pattern):
+    m = len(pattern)
+    return [i for i in range(len(text) - m + 1) if list(text[i:i + m]) == list(pattern)]
+
+
+def split(rng, text):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(3, len(text) + 1)))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+
+def test_kmp_algorithm_matches_naive():
+    rng = random.Random(38)
+    for _ in range(500):
+        text = "".join(rng.choices("ab", k=rng.randint(0, 30)))
+        pattern = "".join(rng.choices("ab", k=rng.randint(1, 4)))
+        assert kmp_algorithm(text, pattern) == naive(text, pattern)
+
+
+def test_stream_matches_naive_for_all_chunk_types():
+    rng = random.Random(380)
+    for _ in range(200):
+        values = rng.choices(range(3), k=rng.randint(0, 40))
+        pattern = rng.choices(range(3), k=rng.randint(1, 4))
+        expected = naive(values, pattern)
+        raw = bytes(values)
+        for text in (raw, bytearray(raw), memoryview(raw), values, array('i', values),
+                     np.array(values, dtype=np.int64)):
+            assert list(kmp_stream(split(rng, text), pattern)) == expected
+        assert list(kmp_stream(split(rng, raw), bytes(pattern))) == expected
+        assert list(kmp_stream(split(rng, np.array(values)), np.array(pattern))) == expected
+
+
+def test_wide_buffers_are_not_read_as_bytes():
+    matcher = KMPMatcher([1, 2, 3])
+    assert list(matcher.feed(array('i', [1, 2, 3, 1, 2, 3]))) == [0, 3]
+    assert matcher.position == 6
+
+
+def test_mmap_chunks(tmp_path):
+    path = tmp_path / "text.bin"
+    path.write_bytes(b"abcabcab" * 10)
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        expected = naive(b"abcabcab" * 10, b"cab")
+        assert list(kmp_stream([data], b"cab")) == expected
+        assert list(kmp_stream([data[:13], memoryview(data)[13:]], b"cab")) == expected
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from Lab5 import bm_algorithm_bad_character, boyer_moore, horspool, sunday
+
+SEARCHES = [bm_algorithm_bad_character, boyer_moore, horspool, sunday]
+
+
+def naive(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+@pytest.mark.parametrize("search", SEARCHES)
+@pytest.mark.parametrize("alphabet", ["ab", "abc", "abcdefgh"])
+def test_str_matches_naive(search, alphabet):
+    rng = random.Random(39)
+    for _ in range(1000):
+        pattern = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 7)))
+        text = "".join(rng.choice(alphabet + "z") for _ in range(rng.randint(0, 60)))
+        assert search(text, pattern) == naive(text, pattern), (text, pattern)
+
+
+@pytest.mark.parametrize("search", [boyer_moore, horspool, sunday])
+def test_bytes_matches_naive(search):
+    rng = random.Random(390)
+    for _ in range(500):
+        pattern = bytes(rng.choice(b"\x00\x01\xff") for _ in range(rng.randint(1, 6)))
+        text = bytes(rng.choice(b"\x00\x01\x02\xff") for _ in range(rng.randint(0, 60)))
+        assert search(text, pattern) == naive(text, pattern)
+
+
+@pytest.mark.parametrize("search", [boyer_moore, horspool, sunday])
+def test_pattern_longer_than_text(search):
+    assert search("ab", "abc") == []
+    assert search("", "a") == []
+
+
+class CountingText(str):
+    reads = 0
+
+    def __getitem__(self, index):
+        CountingText.reads += 1
+        return str.__getitem__(self, index)
+
+
+def test_galil_rule_keeps_periodic_search_linear():
+    text = CountingText("a" * 10000)
+    CountingText.reads = 0
+    assert boyer_moore(text, "a" * 50) == list(range(10000 - 49))
+    assert CountingText.reads <= 2 * len(text)
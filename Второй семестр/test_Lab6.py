@@ -0,0 +1,97 @@
+import random
+from array import array
+
+import numpy as np
+import pytest
+
+from Lab6 import fingerprint, rk_2d, rk_algorithm, rk_iter, rk_multi, rolling_keys, winnow
+
+
+def naive(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+def random_text(rng, alphabet, low, high):
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(low, high)))
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "abcd"])
+def test_single_pattern_matches_naive(alphabet):
+    rng = random.Random(40)
+    for _ in range(1000):
+        pattern, text = random_text(rng, alphabet, 1, 6), random_text(rng, alphabet, 0, 60)
+        assert rk_algorithm(text, pattern) == naive(text, pattern), (text, pattern)
+        assert list(rk_iter(text.encode(), pattern.encode())) == naive(text, pattern)
+        codes, pattern_codes = [ord(ch) for ch in text], [ord(ch) for ch in pattern]
+        assert list(rk_iter(codes, pattern_codes)) == naive(text, pattern)
+        assert list(rk_iter(array('i', codes), pattern_codes)) == naive(text, pattern)
+        assert list(rk_iter(np.array(codes), np.array(pattern_codes))) == naive(text, pattern)
+
+
+def test_multi_pattern_matches_naive():
+    rng = random.Random(400)
+    for _ in range(500):
+        patterns = [random_text(rng, "abc", 1, 4) for _ in range(rng.randint(1, 8))]
+        text = random_text(rng, "abc", 0, 60)
+        expected = sorted((p, i) for p in patterns for i in naive(text, p))
+        assert sorted(rk_multi(text, patterns)) == expected, (text, patterns)
+        tokens = np.array([ord(ch) for ch in text])
+        found = rk_multi(tokens, [np.array([ord(ch) for ch in p]) for p in patterns])
+        assert sorted((bytes(p.tolist()).decode(), i) for p, i in found) == expected
+
+
+def test_2d_matches_naive():
+    rng = random.Random(4000)
+    for _ in range(300):
+        rows, columns = rng.randint(1, 8), rng.randint(1, 8)
+        grid = [random_text(rng, "ab", columns, columns) for _ in range(rows)]
+        h, w = rng.randint(1, 3), rng.randint(1, 3)
+        pattern = [random_text(rng, "ab", w, w) for _ in range(h)]
+        expected = [(r, c) for r in range(rows - h + 1) for c in range(columns - w + 1)
+                    if all(grid[r + i][c:c + w] == pattern[i] for i in range(h))]
+        assert rk_2d(grid, pattern) == expected, (grid, pattern)
+        as_array = lambda rows: np.array([[ord(ch) for ch in row] for row in rows])
+        assert rk_2d(as_array(grid), as_array(pattern)) == expected
+
+
+def brute_winnow(text, k, window):
+    keys = [fingerprint(text[i:i + k]) for i in range(len(text) - k + 1)]
+    if not keys:
+        return []
+    if len(keys) < window:
+        position = min(range(len(keys)), key=lambda i: (keys[i], -i))
+        return [(keys[position], position)]
+    selected = []
+    for start in range(len(keys) - window + 1):
+        # Минимум окна, самый правый при равенстве
+        position = min(range(start, start + window), key=lambda i: (keys[i], -i))
+        if not selected or selected[-1][1] != position:
+            selected.append((keys[position], position))
+    return selected
+
+
+def test_winnow_matches_brute_force():
+    rng = random.Random(40000)
+    for _ in range(500):
+        text = random_text(rng, "ab", 0, 40)
+        k, window = rng.randint(1, 4), rng.randint(1, 5)
+        assert list(rolling_keys(text, k)) == [fingerprint(text[i:i + k]) for i in range(len(text) - k + 1)]
+        assert winnow(text, k, window) == brute_winnow(text, k, window), (text, k, window)
+
+
+def test_mixed_buffer_types_match_naive():
+    # Текст и образец могут быть разными байтовыми буферами или последовательностями чисел
+    texts = [bytes, bytearray, memoryview, lambda b: array('B', b), lambda b: array('i', list(b)),
+             lambda b: np.frombuffer(b, dtype=np.uint8), lambda b: np.array(list(b)), list]
+    patterns = [bytes, lambda b: array('B', b), lambda b: np.array(list(b)), list]
+    rng = random.Random(400000)
+    for _ in range(200):
+        raw = random_text(rng, "abc", 0, 40).encode()
+        needles = [random_text(rng, "abc", 1, 3).encode() for _ in range(3)]
+        for make_text in texts:
+            for make_pattern in patterns:
+                text, pattern = make_text(raw), make_pattern(needles[0])
+                assert list(rk_iter(text, pattern)) == naive(raw, needles[0])
+                found = rk_multi(text, [make_pattern(needle) for needle in needles])
+                assert sorted(i for _, i in found) == sorted(i for needle in needles for i in naive(raw, needle))
+    assert list(rk_iter(b"abc", [0x100])) == []  # Код вне байта в байтовом тексте не встречается
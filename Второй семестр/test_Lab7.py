@@ -0,0 +1,94 @@
+import random
+from array import array
+
+import numpy as np
+import pytest
+
+from Lab7 import bounded_window, chunked, combine, kadane, max_subrectangle, parallel_kadane, summarize
+
+
+def random_values(rng, low=0):
+    return [rng.randint(-10, 10) for _ in range(rng.randint(low, 30))]
+
+
+def brute(values, min_len=1, max_len=None):
+    lengths = range(min_len, (max_len or len(values)) + 1)
+    sums = [sum(values[i:i + k]) for k in lengths for i in range(len(values) - k + 1)]
+    return max(sums, default=float('-inf'))
+
+
+def check(values, result, min_len=1, max_len=None):
+    best, start, end = result
+    assert best == brute(values, min_len, max_len), values
+    if best != float('-inf'):
+        assert min_len <= end - start + 1 <= (max_len or len(values))
+        assert sum(values[start:end + 1]) == best
+
+
+def test_kadane_matches_brute_force():
+    rng = random.Random(43)
+    for _ in range(2000):
+        values = random_values(rng)
+        check(values, kadane(values))
+        check(values, kadane(iter(values)))
+    assert kadane([]) == (float('-inf'), 0, -1)
+
+
+def test_summaries_combine_to_the_whole_array():
+    rng = random.Random(430)
+    for _ in range(1000):
+        values = random_values(rng, low=1)
+        cut = rng.randint(1, len(values))
+        for convert in (list, lambda chunk: array('q', chunk)):
+            whole = summarize(convert(values))
+            if cut < len(values):
+                left, right = summarize(convert(values[:cut])), summarize(convert(values[cut:]), cut)
+                merged = combine(left, right)
+                assert (merged.total, merged.prefix, merged.suffix, merged.best) == \
+                       (whole.total, whole.prefix, whole.suffix, whole.best)
+            check(values, (whole.best, whole.best_start, whole.best_end))
+            assert whole.prefix == max(sum(values[:k]) for k in range(1, len(values) + 1))
+            assert whole.suffix == max(sum(values[k:]) for k in range(len(values)))
+
+
+def test_parallel_kadane_matches_brute_force():
+    rng = random.Random(4300)
+    for _ in range(5):
+        values = random_values(rng, low=1) * 20
+        size = rng.randint(1, 50)
+        check(values, parallel_kadane(chunked(values, size), processes=2, max_pending=3))
+        check(values, parallel_kadane((np.array(chunk) for chunk in chunked(values, size)), processes=2))
+    assert parallel_kadane([], processes=1) == (float('-inf'), 0, -1)
+
+
+def test_bounded_window_matches_brute_force():
+    rng = random.Random(44)
+    for _ in range(2000):
+        values = random_values(rng)
+        min_len = rng.randint(1, 5)
+        max_len = rng.choice((None, rng.randint(min_len, 8)))
+        result = bounded_window(iter(values), min_len, max_len)
+        if min_len > len(values):
+            assert result == (float('-inf'), 0, -1)
+        else:
+            check(values, result, min_len, max_len)
+
+
+def test_bounded_window_rejects_bad_lengths():
+    with pytest.raises(ValueError):
+        bounded_window([1, 2], min_len=0)
+    with pytest.raises(ValueError):
+        bounded_window([1, 2], min_len=3, max_len=2)
+
+
+def test_max_subrectangle_matches_brute_force():
+    rng = random.Random(440)
+    for _ in range(300):
+        rows, cols = rng.randint(1, 6), rng.randint(1, 6)
+        matrix = [[rng.randint(-10, 10) for _ in range(cols)] for _ in range(rows)]
+        best, (top, left, bottom, right) = max_subrectangle(matrix)
+        expected = max(sum(sum(row[l:r + 1]) for row in matrix[t:b + 1])
+                       for t in range(rows) for b in range(t, rows) for l in range(cols) for r in range(l, cols))
+        assert best == expected, matrix
+        assert sum(sum(row[left:right + 1]) for row in matrix[top:bottom + 1]) == best
+    assert max_subrectangle([]) == (float('-inf'), (0, 0, -1, -1))
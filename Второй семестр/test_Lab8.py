@@ -0,0 +1,73 @@
+import random
+from collections import Counter
+from itertools import product
+
+import pytest
+
+from Lab8 import CoinChange, coin_exchange
+
+
+def brute_force(coins, counts, amount):
+    """
+    Перебор кратностей: (минимум монет или -1, число способов). Одинаковые номиналы — одна монета.
+    """
+    stock = {}
+    for coin, count in zip(coins, counts):
+        limit = amount // coin if count is None else count
+        stock[coin] = limit if coin not in stock else stock[coin] + limit
+    stock = {coin: min(limit, amount // coin) for coin, limit in stock.items()}
+    best, ways = -1, 0
+    for taken in product(*(range(limit + 1) for limit in stock.values())):
+        if sum(coin * k for coin, k in zip(stock, taken)) == amount:
+            ways += 1
+            if best < 0 or sum(taken) < best:
+                best = sum(taken)
+    return best, ways
+
+
+@pytest.mark.parametrize("bounded", [False, True])
+def test_matches_brute_force(bounded):
+    rng = random.Random(45)
+    for _ in range(150):
+        coins = [rng.randint(1, 9) for _ in range(rng.randint(1, 4))]
+        counts = [rng.choice([None, 0, 1, 2, 3]) for _ in coins] if bounded else [None] * len(coins)
+        max_amount = rng.randint(0, 25)
+        solver = CoinChange(coins, max_amount, counts if bounded else None)
+        for amount in range(max_amount + 1):
+            best, ways = brute_force(coins, counts, amount)
+            assert solver.min_coins(amount) == best, (coins, counts, amount)
+            assert solver.ways(amount) == ways, (coins, counts, amount)
+            assert solver.ways(amount, modulus=7) == ways % 7
+            change = solver.change(amount)
+            if best < 0:
+                assert change is None
+            else:
+                assert sum(change) == amount and len(change) == best
+                if bounded:
+                    stock = Counter()
+                    for coin, count in zip(coins, counts):
+                        stock[coin] += amount if count is None else count
+                    assert all(stock[coin] >= k for coin, k in Counter(change).items())
+        assert list(solver.min_coins_many(range(max_amount + 1))) == \
+            [solver.min_coins(a) for a in range(max_amount + 1)]
+
+
+def test_coin_exchange():
+    assert coin_exchange([1, 3, 4], 6) == 2
+    assert coin_exchange([3, 5], 7) == -1
+    assert coin_exchange([1, 2, 5], 100) == 20
+
+
+def test_duplicate_coins_are_one_denomination():
+    assert CoinChange([1, 2, 2], 10).ways(4) == 3
+    assert CoinChange([1, 2, 2], 10, counts=[None, 1, 1]).ways(4) == 3
+
+
+def test_amounts_out_of_range():
+    solver = CoinChange([1, 2], 10)
+    with pytest.raises(ValueError):
+        solver.min_coins_many([-1])
+    with pytest.raises(ValueError):
+        solver.min_coins_many([11])
+    with pytest.raises(ValueError):
+        solver.min_coins(-1)
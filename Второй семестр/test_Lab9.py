@@ -0,0 +1,36 @@
+import random
+from itertools import permutations
+
+import pytest
+
+from Lab9 import held_karp_memory, tsp_with_path
+
+
+def tour_cost(dist, path):
+    return sum(dist[a][b] for a, b in zip(path, path[1:]))
+
+
+def brute(dist, start):
+    others = [city for city in range(len(dist)) if city != start]
+    return min(tour_cost(dist, [start, *order, start]) for order in permutations(others))
+
+
+@pytest.mark.parametrize("integer", [True, False])
+def test_matches_permutation_brute_force(integer):
+    rng = random.Random(46)
+    for _ in range(300):
+        n = rng.randint(1, 7)
+        weight = (lambda: rng.randint(1, 50)) if integer else (lambda: rng.uniform(0.5, 50))
+        dist = [[0 if i == j else weight() for j in range(n)] for i in range(n)]  # Несимметричная
+        start = rng.randrange(n)
+        cost, path = tsp_with_path(dist, start)
+        assert cost == pytest.approx(brute(dist, start)), (dist, start)
+        assert path[0] == path[-1] == start and sorted(path[:-1]) == list(range(n))
+        assert tour_cost(dist, path) == pytest.approx(cost)
+
+
+def test_memory_limit():
+    dist = [[abs(i - j) for j in range(12)] for i in range(12)]
+    with pytest.raises(MemoryError):
+        tsp_with_path(dist, 0, memory_limit=held_karp_memory(12) - 1)
+    assert tsp_with_path(dist, 0, memory_limit=held_karp_memory(12))[0] == 22
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from aho_corasick import AhoCorasick
+
+
+def naive(patterns, text):
+    return sorted((p, i) for p in patterns for i in range(len(text) - len(p) + 1) if text[i:i + len(p)] == p)
+
+
+def random_split(rng, text):
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 5))))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "abc", "abcdefgh"])
+def test_str_matches_naive(alphabet):
+    rng = random.Random(36)
+    for _ in range(300):
+        patterns = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 6))]
+        # Символы текста вне алфавита образцов попадают в общий класс 0
+        text = "".join(rng.choice(alphabet + "xy") for _ in range(rng.randint(0, 60)))
+        automaton = AhoCorasick(patterns)
+        expected = naive(patterns, text)
+        assert sorted(automaton.finditer(text)) == expected, (patterns, text)
+        assert sorted(automaton.stream(random_split(rng, text))) == expected, (patterns, text)
+
+
+def test_bytes_matches_naive():
+    rng = random.Random(360)
+    for _ in range(300):
+        patterns = [bytes(rng.choice(b"\x00\x01\xff") for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 5))]
+        text = bytes(rng.choice(b"\x00\x01\x02\xff") for _ in range(rng.randint(0, 60)))
+        automaton = AhoCorasick(patterns)
+        assert sorted(automaton.finditer(text)) == naive(patterns, text)
+        assert sorted(automaton.stream(random_split(rng, text))) == naive(patterns, text)
+
+
+def test_large_alphabet():
+    # Больше 256 классов — символы переводятся по одному, без str.translate
+    rng = random.Random(3600)
+    alphabet = [chr(0x400 + i) for i in range(300)]
+    patterns = ["".join(rng.choice(alphabet) for _ in range(3)) for _ in range(200)]
+    text = "".join(rng.choice(alphabet[:20]) for _ in range(5000)) + "".join(patterns)
+    assert sorted(AhoCorasick(patterns).finditer(text)) == naive(patterns, text)
+
+
+def test_bad_patterns():
+    with pytest.raises(ValueError):
+        AhoCorasick([])
+    with pytest.raises(ValueError):
+        AhoCorasick(["a", ""])
+    with pytest.raises(TypeError):
+        AhoCorasick(["a", b"a"])
@@ -0,0 +1,70 @@
+import random
+
+import numpy as np
+import pytest
+
+from Lab1_Greham import cross_product
+from convex_hull import convex_hull, convex_hull_array, monotone_chain
+
+
+def brute_hull(points, keep_collinear):
+    points = sorted(set(points))
+    if len(points) < 2:
+        return set(points)
+    # Точка лежит на границе, если через неё проходит опорная прямая
+    boundary = {p for p in points
+                if any(all(cross_product(p, q, r) >= 0 for r in points) for q in points if q != p)}
+    if keep_collinear:
+        return boundary
+
+    def between(a, p, b):
+        return (cross_product(a, b, p) == 0 and min(a, b) < p < max(a, b))
+
+    return {p for p in boundary if not any(between(a, p, b) for a in boundary for b in boundary)}
+
+
+def random_points(rng):
+    size = rng.choice((3, 6, 20))
+    return [(rng.randint(-size, size), rng.randint(-size, size)) for _ in range(rng.randint(0, 25))]
+
+
+def is_counterclockwise(hull, keep_collinear):
+    if len(hull) < 3:
+        return True
+    turns = [cross_product(hull[i - 2], hull[i - 1], hull[i]) for i in range(len(hull))]
+    return all(turn >= 0 for turn in turns) if keep_collinear else all(turn > 0 for turn in turns)
+
+
+@pytest.mark.parametrize("keep_collinear", [False, True])
+def test_monotone_chain_matches_brute_force(keep_collinear):
+    rng = random.Random(29)
+    for _ in range(500):
+        points = random_points(rng)
+        hull = monotone_chain(points, keep_collinear)
+        assert len(hull) == len(set(hull))
+        assert set(hull) == brute_hull(points, keep_collinear), points
+        assert not hull or hull[0] == min(points)
+        assert is_counterclockwise(hull, keep_collinear), points
+
+
+@pytest.mark.parametrize("keep_collinear", [False, True])
+@pytest.mark.parametrize("prefilter", [False, True])
+def test_array_version_matches_list_version(keep_collinear, prefilter):
+    rng = random.Random(290)
+    for _ in range(300):
+        points = random_points(rng)
+        expected = monotone_chain(points, keep_collinear)
+        hull = convex_hull_array(np.array(points, dtype=np.int64).reshape(-1, 2), keep_collinear, prefilter)
+        assert [tuple(p) for p in hull.tolist()] == expected, points
+
+
+def test_prefilter_keeps_hull_of_float_cloud():
+    cloud = np.random.default_rng(2900).normal(size=(20000, 2))
+    expected = convex_hull_array(cloud, prefilter=False)
+    assert np.array_equal(convex_hull_array(cloud, prefilter=True), expected)
+    assert np.array_equal(convex_hull(cloud), expected)
+
+
+def test_bad_shape():
+    with pytest.raises(ValueError):
+        convex_hull_array(np.zeros((4, 3)))
@@ -0,0 +1,32 @@
+import random
+
+from Lab1_Greham import cross_product
+from convex_hull import monotone_chain
+from incremental_hull import IncrementalHull
+
+
+def inside_or_on(hull, point):
+    if len(hull) < 3:
+        return point in hull or (len(hull) == 2 and cross_product(hull[0], hull[1], point) == 0
+                                 and min(hull)[0] <= point[0] <= max(hull)[0]
+                                 and min(p[1] for p in hull) <= point[1] <= max(p[1] for p in hull))
+    return all(cross_product(hull[i - 1], hull[i], point) >= 0 for i in range(len(hull)))
+
+
+def test_stream_matches_monotone_chain():
+    rng = random.Random(30)
+    for _ in range(300):
+        hull, seen = IncrementalHull(), []
+        for _ in range(rng.randint(1, 8)):
+            batch = [(rng.randint(-6, 6), rng.randint(-6, 6)) for _ in range(rng.randint(1, 6))]
+            if rng.random() < 0.5:
+                hull.merge(batch)
+            else:
+                for point in batch:
+                    hull.add(point)
+            seen.extend(batch)
+            expected = monotone_chain(seen)
+            assert hull.vertices() == expected, seen
+            for _ in range(5):
+                query = (rng.randint(-7, 7), rng.randint(-7, 7))
+                assert hull.contains(query) == inside_or_on(expected, query), (seen, query)
@@ -0,0 +1,56 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from Lab2 import segments_intersection
+from segment_sweep import any_segments_intersect, intersecting_pairs
+
+
+def brute_force_pairs(segments):
+    return {(i, j) for i, j in combinations(range(len(segments)), 2)
+            if segments_intersection(segments[i], segments[j])}
+
+
+def random_segments(rng, n, coordinate, vertical_share):
+    segments = []
+    for _ in range(n):
+        x1, y1, y2 = coordinate(), coordinate(), coordinate()
+        x2 = x1 if rng.random() < vertical_share else coordinate()
+        segments.append(((x1, y1), (x2, y2)))
+    return segments
+
+
+def test_vertical_segments_regression():
+    segments = [((4.0, 4.95), (4.0, 3.78)), ((2.32, 8.2), (2.32, 4.63)), ((2.12, 7.15), (3.3, 5.94))]
+    assert intersecting_pairs(segments) == brute_force_pairs(segments) == {(1, 2)}
+
+
+def test_matches_brute_force_with_verticals():
+    rng = random.Random(32)
+    for _ in range(1000):
+        segments = random_segments(rng, rng.randint(2, 12), lambda: round(rng.uniform(0, 10), 2), 0.3)
+        expected = brute_force_pairs(segments)
+        assert intersecting_pairs(segments) == expected, segments
+        assert any_segments_intersect(segments) == bool(expected), segments
+
+
+def test_matches_brute_force_on_integer_grid():
+    # Много совпадающих концов, точек пересечения и вертикалей на одной абсциссе
+    rng = random.Random(320)
+    for _ in range(1000):
+        segments = random_segments(rng, rng.randint(2, 9), lambda: float(rng.randint(0, 6)), 0.3)
+        expected = brute_force_pairs(segments)
+        assert intersecting_pairs(segments) == expected, segments
+        assert any_segments_intersect(segments) == bool(expected), segments
+
+
+@pytest.mark.parametrize("low, high", [(0, 1e5), (0, 1e6), (1e6, 2e6)])
+def test_matches_brute_force_at_map_scale(low, high):
+    # Координаты порядка 10^6, как у слоёв карты: погрешность должна расти вместе с ними
+    rng = random.Random(3200)
+    for _ in range(300):
+        segments = random_segments(rng, rng.randint(2, 12), lambda: rng.uniform(low, high), 0.2)
+        expected = brute_force_pairs(segments)
+        assert intersecting_pairs(segments) == expected, segments
+        assert any_segments_intersect(segments) == bool(expected), segments
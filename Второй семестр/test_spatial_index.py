@@ -0,0 +1,50 @@
+import math
+import random
+import time
+from itertools import combinations
+
+import pytest
+
+from spatial_index import STRtree, UniformGrid, boxes_overlap, point_box
+
+
+def random_boxes(rng, n):
+    boxes = []
+    for _ in range(n):
+        x, y = rng.uniform(-5, 5), rng.uniform(-5, 5)
+        boxes.append((x, y, x + rng.uniform(0, 1), y + rng.uniform(0, 1)))
+    return boxes
+
+
+@pytest.mark.parametrize("make", [STRtree, UniformGrid, lambda boxes: UniformGrid(boxes, cell_size=0.05)])
+def test_queries_match_brute_force(make):
+    rng = random.Random(34)
+    for _ in range(100):
+        boxes = random_boxes(rng, rng.randint(1, 60))
+        index = make(boxes)
+        window = random_boxes(rng, 1)[0]
+        assert sorted(index.query(window)) == [i for i, b in enumerate(boxes) if boxes_overlap(b, window)]
+        expected = {(i, j) for i, j in combinations(range(len(boxes)), 2) if boxes_overlap(boxes[i], boxes[j])}
+        assert set(index.pairs()) == expected
+
+
+@pytest.mark.parametrize("cell_size", [None, 0.01, 1.0, 10.0])
+def test_grid_nearest_matches_brute_force(cell_size):
+    rng = random.Random(340)
+    for _ in range(200):
+        points = [(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(rng.randint(1, 100))]
+        grid = UniformGrid([point_box(p) for p in points], cell_size=cell_size)
+        query = (rng.uniform(-50, 50), rng.uniform(-50, 50))
+        k = rng.randint(1, 5)
+        expected = sorted(math.dist(p, query) for p in points)[:k]
+        assert [d for d, _ in grid.nearest(query, k)] == pytest.approx(expected)
+
+
+def test_grid_nearest_far_from_sparse_grid():
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 1), rng.uniform(0, 1)) for _ in range(11)]
+    grid = UniformGrid([point_box(p) for p in points], cell_size=0.01)
+    start = time.perf_counter()
+    (d, i), = grid.nearest((500, 500))
+    assert time.perf_counter() - start < 1
+    assert d == pytest.approx(min(math.dist(p, (500, 500)) for p in points))
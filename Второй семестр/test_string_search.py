@@ -0,0 +1,81 @@
+import mmap
+import random
+from array import array
+
+import numpy as np
+import pytest
+
+from string_search import ALGORITHMS, choose_algorithm, search
+
+SEQUENCE_ALGORITHMS = [name for name in ALGORITHMS if name != "find"]
+
+
+def naive(text, pattern):
+    text, pattern = list(text), list(pattern)
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+def random_case(rng):
+    alphabet = rng.choice(("ab", "abc", "abcdefgh"))
+    pattern = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+    text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+    return text, pattern
+
+
+@pytest.mark.parametrize("algorithm", list(ALGORITHMS))
+def test_native_text_matches_naive(algorithm):
+    rng = random.Random(41)
+    for _ in range(300):
+        text, pattern = random_case(rng)
+        expected = naive(text, pattern)
+        assert list(search(text, pattern, algorithm=algorithm)) == expected, (text, pattern)
+        assert list(search(text.encode(), pattern.encode(), algorithm=algorithm)) == expected
+        assert list(search(text, pattern, all=False, algorithm=algorithm)) == expected[:1]
+
+
+@pytest.mark.parametrize("algorithm", SEQUENCE_ALGORITHMS)
+@pytest.mark.parametrize("kind", ["list", "array", "numpy"])
+def test_token_sequences_match_naive(algorithm, kind):
+    convert = {"list": list, "array": lambda codes: array('i', codes), "numpy": np.array}[kind]
+    rng = random.Random(410)
+    for _ in range(300):
+        text, pattern = random_case(rng)
+        codes, pattern_codes = convert([ord(ch) for ch in text]), convert([ord(ch) for ch in pattern])
+        assert list(search(codes, pattern_codes, algorithm=algorithm)) == naive(text, pattern), (text, pattern)
+
+
+def test_auto_choice_matches_naive():
+    rng = random.Random(4100)
+    for _ in range(300):
+        text, pattern = random_case(rng)
+        tokens = [ord(ch) for ch in text]
+        assert list(search(text, pattern)) == naive(text, pattern)
+        assert list(search(tokens, [ord(ch) for ch in pattern])) == naive(text, pattern)
+
+
+def test_mmap_text(tmp_path):
+    path = tmp_path / "text.bin"
+    path.write_bytes(b"abracadabra" * 100)
+    with open(path, "rb") as fileobj, mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as text:
+        assert choose_algorithm(text, b"abra") == "find"
+        assert list(search(text, b"abra")) == naive(b"abracadabra" * 100, b"abra")
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        search("abc", "")
+    with pytest.raises(ValueError):
+        search("abc", "a", algorithm="grep")
+
+
+@pytest.mark.parametrize("make_text", [memoryview, lambda raw: array('B', raw)])
+def test_byte_buffers_agree_across_algorithms(make_text):
+    rng = random.Random(41000)
+    for _ in range(200):
+        text, pattern = random_case(rng)
+        raw, needle = text.encode(), pattern.encode()
+        for algorithm in SEQUENCE_ALGORITHMS:
+            assert list(search(make_text(raw), needle, algorithm=algorithm)) == naive(raw, needle), algorithm
+        assert list(search(make_text(raw), needle)) == naive(raw, needle)
+    with pytest.raises(ValueError):
+        search(make_text(b"abcabcab"), b"cab", algorithm="find")
@@ -0,0 +1,79 @@
+import random
+
+import numpy as np
+import pytest
+
+from suffix_array import SuffixArray, build_lcp_array, build_suffix_array
+
+
+def naive_lcp(text, sa):
+    lcp = [0] * len(sa)
+    for i in range(1, len(sa)):
+        a, b = text[sa[i - 1]:], text[sa[i]:]
+        while lcp[i] < min(len(a), len(b)) and a[lcp[i]] == b[lcp[i]]:
+            lcp[i] += 1
+    return lcp
+
+
+def random_texts(rng, count):
+    for _ in range(count):
+        text = "".join(rng.choices(rng.choice(["a", "ab", "abc", "абвгд"]), k=rng.randint(0, 60)))
+        yield text.encode() if rng.random() < 0.3 and text.isascii() else text
+
+
+def test_arrays_match_naive():
+    rng = random.Random(42)
+    for text in random_texts(rng, 400):
+        sa = build_suffix_array(text)
+        assert sa.tolist() == sorted(range(len(text)), key=lambda i: text[i:])
+        expected = naive_lcp(text, sa.tolist())
+        assert build_lcp_array(text, sa).tolist() == expected
+        assert SuffixArray(text).lcp.tolist() == expected
+
+
+def test_queries_match_naive():
+    rng = random.Random(420)
+    for text in random_texts(rng, 200):
+        index = SuffixArray(text)
+        for _ in range(5):
+            start = rng.randrange(len(text) + 1)
+            pattern = text[start:start + rng.randint(1, 4)]
+            if not pattern:
+                continue
+            expected = [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+            assert index.find_all(pattern) == expected
+            assert index.count(pattern) == len(expected)
+        if len(text) > 1:
+            repeated = index.longest_repeated_substring()
+            assert not repeated or index.count(repeated) >= 2
+
+
+
+@pytest.mark.parametrize("text", ["", "abc", b"abc"])
+def test_empty_pattern_rejected(text):
+    index = SuffixArray(text)
+    empty = text[:0]
+    # count, contains и find_all одинаково отвергают пустой образец
+    for query in (index.count, index.contains, index.find_all):
+        with pytest.raises(ValueError):
+            query(empty)
+
+
+def test_periodic_text_lcp():
+    text = b"ab" * 2000
+    sa = build_suffix_array(text)
+    assert int(np.max(build_lcp_array(text, sa))) == len(text) - 2
+
+
+@pytest.mark.parametrize("text", ["abcababdabaabaabca", b"mississippi"])
+def test_save_and_load(tmp_path, text):
+    path = tmp_path / "index.sax"
+    original = SuffixArray(text)
+    original.save(str(path))
+    loaded = SuffixArray.load(str(path))
+    try:
+        assert loaded.sa.tolist() == original.sa.tolist()
+        assert loaded.lcp.tolist() == original.lcp.tolist()
+        assert loaded.longest_repeated_substring() == original.longest_repeated_substring()
+    finally:
+        loaded.close()
@@ -0,0 +1,61 @@
+import math
+import random
+
+import pytest
+
+from Lab9 import tsp_with_path
+from tsp_heuristics import tsp_heuristic
+
+
+def random_symmetric(rng, n):
+    dist = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            dist[i][j] = dist[j][i] = rng.randint(1, 100)
+    return dist
+
+
+def tour_length(dist, path):
+    return sum(dist[a][b] for a, b in zip(path, path[1:]))
+
+
+def check_path(path, n, start):
+    assert path[0] == path[-1] == start
+    assert sorted(path[:-1]) == list(range(n))
+
+
+def test_tiny_instances_are_exact():
+    rng = random.Random(47)
+    for _ in range(200):
+        n = rng.randint(1, 4)
+        dist = random_symmetric(rng, n)
+        start = rng.randrange(n)
+        length, path = tsp_heuristic(dist, start, time_limit=0.01)
+        check_path(path, n, start)
+        assert length == tour_length(dist, path) == tsp_with_path(dist, start)[0]
+
+
+def test_small_euclidean_instances_near_optimal():
+    rng = random.Random(470)
+    for _ in range(10):
+        n = rng.randint(5, 10)
+        cities = [(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(n)]
+        dist = [[round(math.dist(a, b)) for b in cities] for a in cities]
+        length, path = tsp_heuristic(dist, 0, time_limit=0.05)
+        check_path(path, n, 0)
+        assert length == tour_length(dist, path)
+        assert length <= 1.05 * tsp_with_path(dist, 0)[0]
+
+
+def test_coordinates_and_restarts():
+    rng = random.Random(4700)
+    points = [(rng.random(), rng.random()) for _ in range(200)]
+    length, path = tsp_heuristic(coords=points, start=3, time_limit=0.2, restarts=2, processes=2)
+    check_path(path, len(points), 3)
+    assert length == pytest.approx(sum(math.dist(points[a], points[b]) for a, b in zip(path, path[1:])))
+    assert length < 0.9 * math.sqrt(len(points))  # Оптимум ≈ 0.7124 · sqrt(n)
+
+
+def test_asymmetric_matrix_rejected():
+    with pytest.raises(ValueError):
+        tsp_heuristic([[0, 1, 2], [2, 0, 1], [1, 1, 0]])
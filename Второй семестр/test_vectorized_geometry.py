@@ -0,0 +1,111 @@
+import random
+
+import numpy as np
+import pytest
+
+import Lab2
+import vectorized_geometry as vg
+
+
+def random_point(rng, scale):
+    # Целые координаты на малой сетке дают много касаний, параллельных и совпадающих концов
+    return (rng.randint(-4, 4) * scale, rng.randint(-4, 4) * scale)
+
+
+def same_point(actual, expected):
+    return actual == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("scale", [1, 0.25, 10 ** 6])
+def test_segments_intersection_matches_lab2(scale):
+    rng = random.Random(33)
+    segments1 = [(random_point(rng, scale), random_point(rng, scale)) for _ in range(2000)]
+    segments2 = [(random_point(rng, scale), random_point(rng, scale)) for _ in range(2000)]
+    points, valid = vg.segments_intersection(segments1, segments2)
+    for seg1, seg2, point, ok in zip(segments1, segments2, points.tolist(), valid):
+        expected = Lab2.segments_intersection(seg1, seg2)
+        assert bool(ok) == (expected is not None), (seg1, seg2)
+        if expected is not None:
+            assert same_point(tuple(point), expected)
+
+
+def test_lines_and_points_on_segments_match_lab2():
+    rng = random.Random(330)
+    pairs = [(random_point(rng, 1), random_point(rng, 1)) for _ in range(1000)]
+    lines = vg.points_to_lines([p for p, _ in pairs], [q for _, q in pairs])
+    assert lines.tolist() == [list(Lab2.points_to_line(p, q)) for p, q in pairs]
+
+    query = [random_point(rng, 1) for _ in range(1000)]
+    points, valid = vg.lines_intersection(lines, vg.points_to_lines(query, query[::-1]))
+    for line, p, q, point, ok in zip(lines.tolist(), query, query[::-1], points.tolist(), valid):
+        expected = Lab2.line_intersection(tuple(line), Lab2.points_to_line(p, q))
+        assert bool(ok) == (expected is not None)
+        if expected is not None:
+            assert same_point(tuple(point), expected)
+
+    on_segment = vg.points_on_segments(query, pairs)
+    assert on_segment.tolist() == [Lab2.is_point_on_segment(p, s) for p, s in zip(query, pairs)]
+
+
+def flat(points):
+    return [c for point in sorted(map(tuple, np.asarray(points).tolist())) for c in point]
+
+
+@pytest.mark.parametrize("scale", [1, 10 ** 6])
+def test_circles_match_lab2(scale):
+    rng = random.Random(3300)
+    u = lambda low, high: rng.uniform(low, high) * scale
+    for _ in range(2000):
+        line = Lab2.points_to_line((u(-5, 5), u(-5, 5)), (u(-5, 5), u(-5, 5)))
+        circle1 = ((u(-5, 5), u(-5, 5)), u(0.1, 5))
+        circle2 = ((u(-5, 5), u(-5, 5)), u(0.1, 5))
+
+        points, count = vg.line_circle_intersection(line, *circle1)
+        expected = Lab2.line_circle_intersection(line, circle1)
+        assert count == len(expected)
+        assert flat(points[:count]) == pytest.approx(flat(expected), abs=1e-9 * scale)
+
+        points, count = vg.circles_intersection(*circle1, *circle2)
+        expected = Lab2.circles_intersection(circle1, circle2)
+        assert count == len(expected)
+        assert flat(points[:count]) == pytest.approx(flat(expected), abs=1e-9 * scale)
+
+
+@pytest.mark.parametrize("scale", [1, 10 ** 6])
+def test_triangles_match_lab2(scale):
+    rng = random.Random(33000)
+    triangles = [tuple(random_point(rng, scale) for _ in range(3)) for _ in range(2000)]
+    query = [random_point(rng, scale) for _ in range(2000)]
+    assert vg.triangle_areas(triangles).tolist() == [Lab2.triangle_area(*t) for t in triangles]
+    assert vg.triangles_exist(triangles).tolist() == [Lab2.triangle_exists(t) for t in triangles]
+    assert (vg.points_inside_triangles(query, triangles).tolist() ==
+            [Lab2.is_point_inside_triangle(p, t) for p, t in zip(query, triangles)])
+    assert vg.distance(query, [t[0] for t in triangles]).tolist() == pytest.approx(
+        [Lab2.distance(p, t[0]) for p, t in zip(query, triangles)])
+
+
+def test_touching_segments_at_large_scale():
+    # Конец второго отрезка лежит на первом; как и в Lab2, погрешность растёт с координатами
+    rng = np.random.default_rng(330000)
+    a, b, q = (rng.uniform(-1, 1, size=(500, 2)) * 1e6 for _ in range(3))
+    t = rng.uniform(0.1, 0.9, size=(500, 1))
+    p = a + t * (b - a)
+    _, valid = vg.segments_intersection(np.stack([a, b], axis=1), np.stack([p, q], axis=1))
+    assert valid.all()
+
+
+def test_near_tangent_lines_at_large_scale_match_lab2():
+    # Касательные, построенные во float около 10^6: число точек решает точный предикат Lab2
+    rng = np.random.default_rng(3300000)
+    n = 20000
+    centers = 1e6 + rng.uniform(-1000, 1000, size=(n, 2))
+    radii = rng.uniform(1, 1000, size=n)
+    angle = rng.uniform(0, 2 * np.pi, size=n)
+    touch = centers + radii[:, None] * np.stack([np.cos(angle), np.sin(angle)], axis=-1)
+    lines = vg.points_to_lines(touch, touch + np.stack([-np.sin(angle), np.cos(angle)], axis=-1))
+
+    points, count = vg.line_circle_intersection(lines, centers, radii)
+    for line, center, radius, found, k in zip(lines.tolist(), centers.tolist(), radii.tolist(), points, count):
+        expected = Lab2.line_circle_intersection(tuple(line), (tuple(center), radius))
+        assert k == len(expected)
+        assert flat(found[:k]) == pytest.approx(flat(expected), rel=1e-12)
@@ -0,0 +1,438 @@
+import math
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Lab2 import Point
+from spatial_index import UniformGrid, point_box
+
+# Улучшения меньше EPS не применяются — защита от зацикливания на погрешностях округления
+EPS = 1e-9
+# Длина окна «сегментного» двойного моста: возмущение локально и дёшево даже при n = 10^5
+KICK_WINDOW = 50
+
+
+class Instance:
+    """
+    Задача коммивояжёра: симметричная матрица расстояний (как в Lab9.tsp_with_path)
+    или координаты городов.
+
+    Для координат расстояния евклидовы и считаются на лету — матрица n × n не строится,
+    поэтому поддерживаются десятки и сотни тысяч городов.
+    """
+
+    def __init__(self, dist: Optional[Sequence[Sequence[float]]] = None,
+                 coords: Optional[Sequence[Point]] = None):
+        if (dist is None) == (coords is None):
+            raise ValueError("Pass either dist or coords")
+        if dist is not None:
+            self.matrix = [list(row) for row in dist]
+            square = np.asarray(self.matrix, dtype=float)
+            if not np.allclose(square, square.T):
+                # Ходы 2-opt разворачивают участки тура — их стоимость верна только при d(i, j) = d(j, i)
+                raise ValueError("Distance matrix must be symmetric")
+            self.xs = self.ys = None
+            self.n = len(self.matrix)
+        else:
+            self.matrix = None
+            self.xs = [float(x) for x, _ in coords]
+            self.ys = [float(y) for _, y in coords]
+            self.n = len(self.xs)
+
+    def distance_function(self) -> Callable[[int, int], float]:
+        """
+        Функция расстояния d(i, j) без обращений к атрибутам в горячем цикле.
+        """
+        if self.matrix is not None:
+            matrix = self.matrix
+            return lambda i, j: matrix[i][j]
+        xs, ys, hypot = self.xs, self.ys, math.hypot
+        return lambda i, j: hypot(xs[i] - xs[j], ys[i] - ys[j])
+
+    def neighbor_lists(self, k: int) -> List[List[int]]:
+        """
+        k ближайших соседей каждого города по возрастанию расстояния.
+
+        Для матрицы — argpartition по строкам; для координат — поиск по кольцам клеток
+        равномерной сетки из spatial_index (O(k) клеток на город вместо O(n)).
+        """
+        n = self.n
+        k = min(k, n - 1)
+        if k <= 0:
+            return [[] for _ in range(n)]
+        if self.matrix is not None:
+            matrix = np.array(self.matrix, dtype=float)
+            np.fill_diagonal(matrix, np.inf)
+            nearest = np.argpartition(matrix, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(matrix, nearest, axis=1), axis=1)
+            return np.take_along_axis(nearest, order, axis=1).tolist()
+
+        xs, ys, hypot = self.xs, self.ys, math.hypot
+        grid = UniformGrid([point_box((x, y)) for x, y in zip(xs, ys)])
+        measure = lambda i, pt: hypot(xs[i] - pt[0], ys[i] - pt[1])
+        neighbors = []
+        for city in range(n):
+            found = grid.nearest((xs[city], ys[city]), k + 1, item_distance=measure)
+            neighbors.append([i for _, i in found if i != city][:k])
+        return neighbors
+
+
+def nearest_neighbor_tour(instance: Instance, neighbors: List[List[int]], start: int = 0) -> List[int]:
+    """
+    Конструктивная эвристика «ближайший сосед».
+
+    Следующий город — первый непосещённый в списке соседей (списки отсортированы, так что
+    это и есть ближайший); только если все соседи посещены, просматриваются все оставшиеся.
+    """
+    n = instance.n
+    d = instance.distance_function()
+    visited = bytearray(n)
+    unvisited = list(range(n))  # Удаление за O(1): обмен с последним
+    where = list(range(n))
+
+    def remove(city: int) -> None:
+        i, last = where[city], unvisited[-1]
+        unvisited[i], where[last] = last, i
+        unvisited.pop()
+        visited[city] = 1
+
+    tour = [start]
+    remove(start)
+    current = start
+    while unvisited:
+        following = next((c for c in neighbors[current] if not visited[c]), -1)
+        if following < 0:
+            following = min(unvisited, key=lambda c: d(current, c))
+        remove(following)
+        tour.append(following)
+        current = following
+    return tour
+
+
+def space_filling_tour(instance: Instance, bits: int = 16) -> List[int]:
+    """
+    Конструктивная эвристика для координат: порядок городов вдоль кривой Гильберта, O(n log n).
+
+    Близкие на кривой города близки и на плоскости, поэтому тур получается в среднем
+    на 25% длиннее оптимального — хорошая стартовая точка для локального поиска.
+    """
+    x = np.asarray(instance.xs)
+    y = np.asarray(instance.ys)
+    side = 1 << bits
+    span = max(np.ptp(x), np.ptp(y)) or 1.0
+    xi = ((x - x.min()) / span * (side - 1)).astype(np.int64)
+    yi = ((y - y.min()) / span * (side - 1)).astype(np.int64)
+
+    index = np.zeros(len(x), dtype=np.int64)
+    s = side // 2
+    while s > 0:
+        rx = (xi & s) > 0
+        ry = (yi & s) > 0
+        index += s * s * ((3 * rx) ^ ry)
+        # Поворот четверти, чтобы кривая в ней шла в стандартной ориентации
+        flip = ~ry & rx
+        xi = np.where(flip, side - 1 - xi, xi)
+        yi = np.where(flip, side - 1 - yi, yi)
+        xi, yi = np.where(~ry, yi, xi), np.where(~ry, xi, yi)
+        s //= 2
+    return np.argsort(index, kind='stable').tolist()
+
+
+class _Tour:
+    """
+    Тур в виде массива городов и обратного массива позиций.
+
+    Ход 2-opt — разворот участка; разворачивается более короткая из двух частей цикла,
+    поэтому ход стоит O(min(L, n - L)). Ходы задаются рёбрами, а не направлением обхода.
+    """
+
+    def __init__(self, order: List[int], d: Callable[[int, int], float], neighbors: List[List[int]]):
+        self.tour = list(order)
+        self.n = len(order)
+        self.pos = [0] * self.n
+        for i, city in enumerate(order):
+            self.pos[city] = i
+        self.d = d
+        self.neighbors = neighbors
+        self.length = sum(d(order[i - 1], order[i]) for i in range(self.n))
+        self.queue = deque()
+        self.active = bytearray(self.n)
+
+    def succ(self, city: int) -> int:
+        i = self.pos[city] + 1
+        return self.tour[i if i < self.n else 0]
+
+    def pred(self, city: int) -> int:
+        return self.tour[self.pos[city] - 1]
+
+    def _reverse(self, i: int, j: int) -> None:
+        """
+        Разворачивает участок позиций от i до j включительно (по циклу).
+        """
+        n, tour, pos = self.n, self.tour, self.pos
+        length = (j - i) % n + 1
+        if 2 * length > n:  # Развернуть дополнение — тот же цикл
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = tour[i], tour[j]
+            tour[i], tour[j] = b, a
+            pos[b], pos[a] = i, j
+            i = i + 1 if i + 1 < n else 0
+            j = j - 1 if j > 0 else n - 1
+
+    def move(self, a: int, b: int, c: int, e: int) -> None:
+        """
+        Ход 2-opt: рёбра {a, b} и {c, e} заменяются на {a, c} и {b, e},
+        где в одном из направлений обхода тур читается как a b ... c e.
+        """
+        if self.succ(a) == b:
+            self._reverse(self.pos[b], self.pos[c])
+        else:
+            self._reverse(self.pos[c], self.pos[b])
+
+    def touch(self, *cities: int) -> None:
+        """
+        Снимает «не смотреть» с концов изменённых рёбер — они снова попадут в очередь.
+        """
+        for city in cities:
+            if not self.active[city]:
+                self.active[city] = 1
+                self.queue.append(city)
+
+    def two_opt(self, a: int) -> bool:
+        """
+        Лучший первый найденный ход 2-opt с участием ребра города a.
+
+        Перебираются только соседи c из списка a и только пока новое ребро (a, c)
+        короче удаляемого (a, b) — иначе выигрыша быть не может.
+        """
+        d = self.d
+        for forward in (True, False):
+            b = self.succ(a) if forward else self.pred(a)
+            dab = d(a, b)
+            for c in self.neighbors[a]:
+                dac = d(a, c)
+                if dac >= dab - EPS:
+                    break
+                e = self.succ(c) if forward else self.pred(c)
+                if c == b or e == a:
+                    continue
+                delta = dac + d(b, e) - dab - d(c, e)
+                if delta < -EPS:
+                    self.move(a, b, c, e)
+                    self.length += delta
+                    self.touch(a, b, c, e)
+                    return True
+        return False
+
+    def or_opt(self, s1: int) -> bool:
+        """
+        Ход Or-opt: участок из 1–3 городов, начинающийся с s1, переносится между соседним
+        городом c из списка одного из концов участка и его соседом по туру (в любой ориентации).
+
+        Перенос выполняется двумя-тремя ходами 2-opt:
+        p s1..sk nx .. c e -> p c .. nx sk..s1 e -> p nx .. c sk..s1 e [-> p nx .. c s1..sk e].
+        """
+        d, n, pos = self.d, self.n, self.pos
+        for k in (1, 2, 3):
+            if k + 3 > n:
+                break
+            sk = s1
+            for _ in range(k - 1):
+                sk = self.succ(sk)
+            p, nx = self.pred(s1), self.succ(sk)
+            removed = d(p, s1) + d(sk, nx) - d(p, nx)
+            if removed <= EPS:
+                continue
+            base = pos[s1]
+
+            for end in (s1, sk):
+                for x in self.neighbors[end]:
+                    if d(end, x) >= removed - EPS:
+                        break
+                    if (pos[x] - base) % n < k:
+                        continue  # x внутри участка
+                    for c, e in ((x, self.succ(x)), (self.pred(x), x)):
+                        if (pos[c] - base) % n < k or (pos[e] - base) % n < k:
+                            continue
+                        dce = d(c, e)
+                        reversed_cost = d(c, sk) + d(s1, e) - dce
+                        forward_cost = d(c, s1) + d(sk, e) - dce
+                        added = min(reversed_cost, forward_cost)
+                        if added < removed - EPS:
+                            self.move(p, s1, c, e)
+                            if c != nx:
+                                self.move(p, c, nx, sk)
+                            if forward_cost < reversed_cost and s1 != sk:
+                                self.move(c, sk, s1, e)
+                            self.length += added - removed
+                            self.touch(p, nx, s1, sk, c, e)
+                            return True
+        return False
+
+    def improve(self, deadline: float) -> bool:
+        """
+        Локальный поиск 2-opt + Or-opt с битами «не смотреть» до локального минимума.
+
+        Возвращает:
+            bool: False, если поиск прерван по времени.
+        """
+        queue, active = self.queue, self.active
+        checks = 0
+        while queue:
+            a = queue.popleft()
+            active[a] = 0
+            if not self.two_opt(a):
+                self.or_opt(a)
+            checks += 1
+            if checks & 255 == 0 and time.perf_counter() > deadline:
+                return False
+        return True
+
+    def kick(self, rng: random.Random) -> None:
+        """
+        Сегментный двойной мост: A B C D -> A C B D внутри окна KICK_WINDOW позиций.
+
+        Такое возмущение нельзя отменить одним ходом 2-opt, а локальный поиск
+        после него запускается только от шести затронутых городов.
+        """
+        n, tour, pos, d = self.n, self.tour, self.pos, self.d
+        a = rng.randrange(n - 3)
+        b, c = sorted(rng.sample(range(a + 1, a + min(KICK_WINDOW, n - 1 - a) + 1), 2))
+        after = tour[(c + 1) % n]
+        first, middle = tour[a + 1:b + 1], tour[b + 1:c + 1]
+        self.length += (d(tour[a], middle[0]) + d(middle[-1], first[0]) + d(first[-1], after)
+                        - d(tour[a], first[0]) - d(first[-1], middle[0]) - d(middle[-1], after))
+        tour[a + 1:c + 1] = middle + first
+        for i in range(a + 1, c + 1):
+            pos[tour[i]] = i
+        self.touch(tour[a], first[0], first[-1], middle[0], middle[-1], after)
+
+
+def _exact_small(instance: Instance) -> List[int]:
+    """
+    Оптимальный тур перебором для n < 5: туров не больше 3! = 6, а двойной мост
+    и Or-opt на таком числе городов не определены.
+    """
+    d, n = instance.distance_function(), instance.n
+    return min(([0, *rest] for rest in permutations(range(1, n))),
+               key=lambda tour: sum(d(tour[i - 1], tour[i]) for i in range(n)))
+
+
+def _run(task: tuple) -> Tuple[float, List[int]]:
+    """
+    Один запуск: построение тура, локальный поиск, затем итерированный локальный поиск
+    (возмущение + поиск, откат при ухудшении) до истечения времени.
+    """
+    instance, neighbors, construction, time_limit, seed = task
+    deadline = time.perf_counter() + time_limit
+    rng = random.Random(seed)
+    n = instance.n
+
+    if construction == "space_filling":
+        order = space_filling_tour(instance)
+    else:
+        order = nearest_neighbor_tour(instance, neighbors, rng.randrange(n) if seed else 0)
+
+    tour = _Tour(order, instance.distance_function(), neighbors)
+    tour.touch(*order)
+    tour.improve(deadline)
+    best = (tour.length, tour.tour[:], tour.pos[:])
+
+    while time.perf_counter() < deadline:
+        tour.kick(rng)
+        tour.improve(deadline)
+        if tour.length < best[0] - EPS:
+            best = (tour.length, tour.tour[:], tour.pos[:])
+        else:
+            tour.length = best[0]
+            tour.tour[:] = best[1]
+            tour.pos[:] = best[2]
+            for city in tour.queue:
+                tour.active[city] = 0
+            tour.queue.clear()
+    return best[0], best[1]
+
+
+def tsp_heuristic(dist: Optional[Sequence[Sequence[float]]] = None, start: int = 0, *,
+                  coords: Optional[Sequence[Point]] = None, time_limit: float = 1.0,
+                  restarts: int = 1, processes: Optional[int] = None, neighbors: int = 10,
+                  construction: str = "auto", seed: int = 0) -> Tuple[float, List[int]]:
+    """
+    Приближённое решение задачи коммивояжёра для сотен — сотен тысяч городов.
+
+    Алгоритм:
+    - начальный тур — «ближайший сосед» или (для координат и больших n) кривая Гильберта;
+    - локальный поиск 2-opt и Or-opt по спискам k ближайших соседей с битами «не смотреть»;
+    - пока не истекло time_limit секунд — итерированный локальный поиск с двойным мостом;
+    - restarts > 1: независимые запуски с разными зёрнами в пуле процессов, берётся лучший.
+
+    Аргументы:
+        dist: Матрица расстояний n × n (как в Lab9.tsp_with_path) — или вместо неё coords.
+        start (int): Город, с которого начинается и которым заканчивается маршрут.
+        coords: Координаты городов (евклидовы расстояния).
+        time_limit (float): Время одного запуска в секундах (после построения списков соседей).
+        restarts (int): Число независимых запусков.
+        processes (Optional[int]): Размер пула (по умолчанию — число ядер).
+        neighbors (int): Длина списков соседей.
+        construction (str): "nearest", "space_filling" или "auto".
+        seed (int): Зерно первого запуска; запуск r использует seed + r.
+
+    Возвращает:
+        Tuple[float, List[int]]: Длина маршрута и города в порядке обхода
+        (включая возврат в начальный город), как у tsp_with_path.
+    """
+    instance = Instance(dist, coords)
+    n = instance.n
+    if n == 0:
+        return 0, []
+    if construction == "auto":
+        construction = "space_filling" if coords is not None and n > 5000 else "nearest"
+
+    if n < 5:
+        order = _exact_small(instance)
+    else:
+        lists = instance.neighbor_lists(neighbors)
+        tasks = [(instance, lists, construction, time_limit, seed + r) for r in range(restarts)]
+        if restarts > 1:
+            with ProcessPoolExecutor(processes) as pool:
+                results = list(pool.map(_run, tasks))
+        else:
+            results = [_run(tasks[0])]
+        _, order = min(results, key=lambda result: result[0])
+
+    # Поворачиваем тур к начальному городу и пересчитываем длину без накопленной погрешности
+    i = order.index(start)
+    path = order[i:] + order[:i] + [start]
+    d = instance.distance_function()
+    return sum(d(path[j], path[j + 1]) for j in range(n)), path
+
+
+if __name__ == "__main__":
+    from Lab9 import tsp_with_path
+
+    # Разрыв с точным решением Хелда–Карпа на малых задачах
+    rng = random.Random(1)
+    gaps = []
+    for _ in range(20):
+        n = rng.randint(6, 12)
+        cities = [(rng.randint(0, 100), rng.randint(0, 100)) for _ in range(n)]
+        dist = [[round(math.dist(a, b)) for b in cities] for a in cities]
+        exact, _ = tsp_with_path(dist, 0)
+        approx, path = tsp_heuristic(dist, 0, time_limit=0.05)
+        gaps.append((approx - exact) / exact)
+    print(f"Optimality gap on 20 small instances: mean {100 * sum(gaps) / len(gaps):.2f}%, "
+          f"max {100 * max(gaps):.2f}%")
+
+    points = [(rng.random(), rng.random()) for _ in range(10_000)]
+    start = time.perf_counter()
+    length, path = tsp_heuristic(coords=points, time_limit=5.0)
+    print(f"10000 random points: length {length:.2f} "
+          f"(≈ {0.7124 * math.sqrt(len(points)):.2f} expected for an optimal tour), "
+          f"{time.perf_counter() - start:.1f} s")
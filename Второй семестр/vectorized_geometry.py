@@ -0,0 +1,232 @@
+import numpy as np
+
+from Lab2 import EPSILON, UNCERTAINTY, circle_line_discriminant_sign
+
+# Векторизованные аналоги функций Lab2. Вместо одного кортежа принимают массивы:
+# точки формы (N, 2), прямые (N, 3), отрезки (N, 2, 2), треугольники (N, 3, 2),
+# окружности — центры (N, 2) и радиусы (N,). Аргументы согласуются по правилам
+# broadcasting NumPy, поэтому одну фигуру-запрос можно передать без размножения
+# и проверить сразу против миллионов кандидатов.
+# Там, где результата может не быть, возвращается пара (значения, маска допустимости);
+# значения в невалидных позициях равны NaN. Погрешности те же, что в Lab2: для прямых
+# и отрезков, касания окружностей и точки в треугольнике — масштабированные по величине
+# координат (scaled_uncertainty), касание прямой и окружности — точный знак дискриминанта
+# (circle_line_discriminant_sign).
+
+
+def _scaled_uncertainty(*values) -> np.ndarray:
+    """
+    Поэлементный аналог scaled_uncertainty из Lab2.
+    """
+    return UNCERTAINTY * np.maximum(1.0, np.max(np.abs(np.broadcast_arrays(*values)), axis=0))
+
+
+def points_to_lines(p1, p2) -> np.ndarray:
+    """
+    Преобразует пары точек в уравнения прямых Ax + By + C = 0.
+
+    Возвращает:
+        np.ndarray: Массив (..., 3) с коэффициентами (A, B, C).
+    """
+    p1, p2 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    x1, y1 = p1[..., 0], p1[..., 1]
+    x2, y2 = p2[..., 0], p2[..., 1]
+    return np.stack(np.broadcast_arrays(y2 - y1, x1 - x2, x2 * y1 - x1 * y2), axis=-1)
+
+
+def lines_intersection(lines1, lines2) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Находит точки пересечения пар прямых.
+
+    Возвращает:
+        tuple[np.ndarray, np.ndarray]: Точки (..., 2) и маска; параллельные и совпадающие
+        прямые (|det| меньше масштабированной погрешности) помечаются False.
+    """
+    lines1, lines2 = np.asarray(lines1, dtype=float), np.asarray(lines2, dtype=float)
+    A1, B1, C1 = lines1[..., 0], lines1[..., 1], lines1[..., 2]
+    A2, B2, C2 = lines2[..., 0], lines2[..., 1], lines2[..., 2]
+
+    det = A1 * B2 - A2 * B1
+    valid = np.abs(det) >= _scaled_uncertainty(A1 * B2, A2 * B1)
+    safe_det = np.where(valid, det, 1.0)
+    x = np.where(valid, (B1 * C2 - B2 * C1) / safe_det, np.nan)
+    y = np.where(valid, (A2 * C1 - A1 * C2) / safe_det, np.nan)
+    return np.stack([x, y], axis=-1), valid
+
+
+def _within_box(points, segments) -> np.ndarray:
+    """
+    Лежат ли точки в ограничивающем прямоугольнике отрезков (как is_point_on_segment).
+    """
+    x, y = points[..., 0], points[..., 1]
+    x1, y1 = segments[..., 0, 0], segments[..., 0, 1]
+    x2, y2 = segments[..., 1, 0], segments[..., 1, 1]
+    eps = _scaled_uncertainty(x1, y1, x2, y2)
+    return ((np.minimum(x1, x2) - eps <= x) & (x <= np.maximum(x1, x2) + eps) &
+            (np.minimum(y1, y2) - eps <= y) & (y <= np.maximum(y1, y2) + eps))
+
+
+def points_on_segments(points, segments) -> np.ndarray:
+    """
+    Векторизованный is_point_on_segment: проверка попадания в прямоугольник отрезка.
+    """
+    return _within_box(np.asarray(points, dtype=float), np.asarray(segments, dtype=float))
+
+
+def segments_intersection(segments1, segments2) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Находит точки пересечения пар отрезков.
+
+    Возвращает:
+        tuple[np.ndarray, np.ndarray]: Точки (..., 2) и маска пересечения.
+    """
+    segments1, segments2 = np.asarray(segments1, dtype=float), np.asarray(segments2, dtype=float)
+    lines1 = points_to_lines(segments1[..., 0, :], segments1[..., 1, :])
+    lines2 = points_to_lines(segments2[..., 0, :], segments2[..., 1, :])
+    points, valid = lines_intersection(lines1, lines2)
+    valid &= _within_box(points, segments1) & _within_box(points, segments2)
+    points[~valid] = np.nan
+    return points, valid
+
+
+def line_circle_intersection(lines, centers, radii) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Находит точки пересечения прямых и окружностей.
+
+    Число точек определяется так же, как в circle_line_discriminant_sign из Lab2: знак
+    R²(A² + B²) - (A·cx + B·cy + C)² считается векторно вместе с оценкой ошибки,
+    а строки, где значение ближе к нулю, чем ошибка (почти касание), пересчитываются
+    точным скалярным предикатом. Точки — те же формулы, что в line_circle_intersection.
+
+    Возвращает:
+        tuple[np.ndarray, np.ndarray]: Точки (..., 2, 2) и число точек (..., ) — 0, 1 или 2.
+    """
+    lines = np.asarray(lines, dtype=float)
+    centers, radii = np.asarray(centers, dtype=float), np.asarray(radii, dtype=float)
+    A, B, C, cx, cy, R = np.broadcast_arrays(lines[..., 0], lines[..., 1], lines[..., 2],
+                                             centers[..., 0], centers[..., 1], radii)
+
+    norm2 = A * A + B * B
+    s = A * cx + B * cy + C
+    disc = R * R * norm2 - s * s
+    magnitude = np.abs(A * cx) + np.abs(B * cy) + np.abs(C)
+    error = 16 * EPSILON * (R * R * norm2 + magnitude * magnitude)
+
+    sign = np.where(disc > error, 1, np.where(disc < -error, -1, 0))
+    for row in np.argwhere((np.abs(disc) <= error) & (norm2 > 0)):
+        index = tuple(row)
+        line = (A[index].item(), B[index].item(), C[index].item())
+        circle = ((cx[index].item(), cy[index].item()), R[index].item())
+        sign[index] = circle_line_discriminant_sign(line, circle)
+    count = np.where(norm2 == 0, 0, sign + 1)
+
+    # Основание перпендикуляра из центра и сдвиг вдоль прямой
+    safe_norm2 = np.where(norm2 > 0, norm2, 1.0)
+    fx = cx - A * s / safe_norm2
+    fy = cy - B * s / safe_norm2
+    h = np.where(count == 2, np.sqrt(np.clip(disc, 0, None)) / safe_norm2, 0.0)
+
+    first = np.stack([fx - B * h, fy + A * h], axis=-1)
+    second = np.stack([fx + B * h, fy - A * h], axis=-1)
+    points = np.stack([first, second], axis=-2)
+    points[count == 0] = np.nan
+    points[count == 1, 1] = np.nan
+    return points, count
+
+
+def circles_intersection(centers1, radii1, centers2, radii2) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Находит точки пересечения пар окружностей (как circles_intersection из Lab2).
+
+    Концентрические окружности считаются непересекающимися.
+
+    Возвращает:
+        tuple[np.ndarray, np.ndarray]: Точки (..., 2, 2) и число точек (..., ) — 0, 1 или 2.
+    """
+    centers1, centers2 = np.asarray(centers1, dtype=float), np.asarray(centers2, dtype=float)
+    r1, r2 = np.asarray(radii1, dtype=float), np.asarray(radii2, dtype=float)
+    x1, y1 = centers1[..., 0], centers1[..., 1]
+    dx, dy = centers2[..., 0] - x1, centers2[..., 1] - y1
+    d = np.hypot(dx, dy)
+
+    eps = _scaled_uncertainty(x1, y1, centers2[..., 0], centers2[..., 1], r1, r2)
+    valid = (d <= r1 + r2 + eps) & (d >= np.abs(r1 - r2) - eps) & (d > 0)
+    tangent = valid & ((np.abs(d - r1 - r2) <= eps) | (np.abs(d - np.abs(r1 - r2)) <= eps))
+    count = np.where(tangent, 1, np.where(valid, 2, 0))
+
+    safe_d = np.where(d > 0, d, 1.0)
+    a = (r1 ** 2 - r2 ** 2 + d ** 2) / (2 * safe_d)
+    h = np.sqrt(np.clip(r1 ** 2 - a ** 2, 0, None))
+    xm = x1 + a * dx / safe_d
+    ym = y1 + a * dy / safe_d
+
+    first = np.stack([xm + h * dy / safe_d, ym - h * dx / safe_d], axis=-1)
+    second = np.stack([xm - h * dy / safe_d, ym + h * dx / safe_d], axis=-1)
+    points = np.stack([first, second], axis=-2)
+    points[count == 0] = np.nan
+    points[count == 1, 1] = np.nan
+    return points, count
+
+
+def distance(points1, points2) -> np.ndarray:
+    """
+    Евклидовы расстояния между парами точек.
+    """
+    points1, points2 = np.asarray(points1, dtype=float), np.asarray(points2, dtype=float)
+    return np.hypot(points2[..., 0] - points1[..., 0], points2[..., 1] - points1[..., 1])
+
+
+def _area(a, b, c) -> np.ndarray:
+    """
+    Площади треугольников по массивам вершин a, b, c.
+    """
+    x1, y1 = a[..., 0], a[..., 1]
+    x2, y2 = b[..., 0], b[..., 1]
+    x3, y3 = c[..., 0], c[..., 1]
+    return np.abs(x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2)) / 2.0
+
+
+def triangle_areas(triangles) -> np.ndarray:
+    """
+    Площади треугольников формы (..., 3, 2).
+    """
+    triangles = np.asarray(triangles, dtype=float)
+    return _area(triangles[..., 0, :], triangles[..., 1, :], triangles[..., 2, :])
+
+
+def triangles_exist(triangles) -> np.ndarray:
+    """
+    Маска невырожденных треугольников.
+    """
+    return triangle_areas(triangles) > 0
+
+
+def points_inside_triangles(points, triangles) -> np.ndarray:
+    """
+    Векторизованный is_point_inside_triangle: тот же метод суммы площадей и та же погрешность.
+    """
+    points, triangles = np.asarray(points, dtype=float), np.asarray(triangles, dtype=float)
+    a, b, c = triangles[..., 0, :], triangles[..., 1, :], triangles[..., 2, :]
+    total_area = _area(a, b, c)
+    sub_areas = _area(points, a, b) + _area(points, b, c) + _area(points, c, a)
+    return np.abs(total_area - sub_areas) < _scaled_uncertainty(sub_areas)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 10 ** 6
+
+    # Один треугольник-запрос против миллиона точек
+    triangle = np.array([[0, 0], [1, 0], [0, 1]])
+    candidates = rng.random((n, 2))
+    start = time.perf_counter()
+    inside = points_inside_triangles(candidates, triangle)
+    print(f"{inside.sum()} of {n} points inside the triangle ({time.perf_counter() - start:.3f} s)")
+
+    # Одна окружность против миллиона окружностей
+    centers, radii = rng.random((n, 2)) * 10, rng.random(n)
+    start = time.perf_counter()
+    points, count = circles_intersection([5, 5], 1.0, centers, radii)
+    print(f"{(count > 0).sum()} circles intersect the query ({time.perf_counter() - start:.3f} s)")
@@ -0,0 +1,233 @@
+import re
+import struct
+from array import array
+from typing import BinaryIO, Optional, Union
+
+# Компактное представление дерева «структурой массивов»: вместо объекта TreeNode на
+# каждый узел храним три параллельных массива int64 — значение, индекс левого и индекс
+# правого потомка (-1, если потомка нет). Узел занимает 24 байта вместо ~250 у TreeNode.
+
+NO_CHILD = -1
+_HEADER = struct.Struct('<4sqq')  # Сигнатура, количество узлов, индекс корня
+_MAGIC = b'ATR1'
+_TOKEN = re.compile(r'-?\d+|[()]')  # Числа и скобки; запятые и пробелы пропускаем
+
+
+class ArrayTree:
+    """
+    Двоичное дерево в виде трёх параллельных массивов values/left/right.
+
+    Массивы могут быть как array('q'), так и memoryview над внешним буфером
+    (например, над разделяемой памятью) — тогда данные не копируются.
+    """
+
+    def __init__(self, values=None, left=None, right=None, root: int = NO_CHILD):
+        self.values = values if values is not None else array('q')
+        self.left = left if left is not None else array('q')
+        self.right = right if right is not None else array('q')
+        self.root = root
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add_node(self, value: int) -> int:
+        """
+        Добавляет узел без потомков и возвращает его индекс.
+        """
+        self.values.append(value)
+        self.left.append(NO_CHILD)
+        self.right.append(NO_CHILD)
+        return len(self.values) - 1
+
+    def to_bytes(self) -> bytearray:
+        """
+        Упаковывает дерево в один буфер: заголовок и три массива подряд.
+        """
+        n = len(self.values)
+        buffer = bytearray(_HEADER.size + 3 * 8 * n)
+        _HEADER.pack_into(buffer, 0, _MAGIC, n, self.root)
+        view = memoryview(buffer)[_HEADER.size:].cast('q')
+        view[0:n] = memoryview(self.values)
+        view[n:2 * n] = memoryview(self.left)
+        view[2 * n:3 * n] = memoryview(self.right)
+        view.release()
+        return buffer
+
+    def dump(self, fileobj: BinaryIO) -> None:
+        """
+        Записывает дерево в файл одной операцией write.
+        """
+        fileobj.write(self.to_bytes())
+
+    @classmethod
+    def from_buffer(cls, buffer: Union[bytes, bytearray, memoryview]) -> 'ArrayTree':
+        """
+        Создаёт дерево поверх готового буфера без копирования данных.
+
+        Массивы дерева становятся memoryview над buffer, поэтому буфер должен жить
+        дольше дерева (для SharedMemory — вызывайте release() перед shm.close()).
+        """
+        magic, n, root = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError("Buffer does not contain an ArrayTree")
+        data = memoryview(buffer)[_HEADER.size:_HEADER.size + 3 * 8 * n].cast('q')
+        return cls(data[0:n], data[n:2 * n], data[2 * n:3 * n], root)
+
+    @classmethod
+    def load(cls, fileobj: BinaryIO) -> 'ArrayTree':
+        """
+        Читает дерево, записанное методом dump.
+        """
+        return cls.from_buffer(fileobj.read())
+
+    def to_shared_memory(self, name: Optional[str] = None):
+        """
+        Копирует дерево в multiprocessing.shared_memory.SharedMemory.
+
+        Рабочий процесс подключается к памяти по имени и вызывает
+        ArrayTree.from_buffer(shm.buf) — узлы при этом не копируются и не пиклятся.
+        """
+        from multiprocessing import shared_memory
+
+        data = self.to_bytes()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        shm.buf[:len(data)] = data
+        return shm
+
+    def release(self) -> None:
+        """
+        Освобождает memoryview, полученные из from_buffer (для array ничего не делает).
+        """
+        for field in (self.values, self.left, self.right):
+            if isinstance(field, memoryview):
+                field.release()
+
+    def pre_order(self) -> array:
+        """
+        Прямой обход. Возвращает массив индексов узлов.
+        """
+        left, right = self.left, self.right
+        order = array('q')
+        stack = [self.root] if self.root != NO_CHILD else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if right[node] != NO_CHILD:
+                stack.append(right[node])
+            if left[node] != NO_CHILD:
+                stack.append(left[node])
+        return order
+
+    def in_order(self) -> array:
+        """
+        Центрированный обход. Возвращает массив индексов узлов.
+        """
+        left, right = self.left, self.right
+        order = array('q')
+        stack = []
+        node = self.root
+        while node != NO_CHILD or stack:
+            while node != NO_CHILD:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            order.append(node)
+            node = right[node]
+        return order
+
+    def post_order(self) -> array:
+        """
+        Концевой обход. Возвращает массив индексов узлов.
+
+        Строится как обратный обход «корень -> правый -> левый».
+        """
+        left, right = self.left, self.right
+        order = array('q')
+        stack = [self.root] if self.root != NO_CHILD else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if left[node] != NO_CHILD:
+                stack.append(left[node])
+            if right[node] != NO_CHILD:
+                stack.append(right[node])
+        order.reverse()
+        return order
+
+    def level_order(self) -> array:
+        """
+        Обход по уровням. Возвращает массив индексов узлов.
+
+        Обрабатывает уровень целиком: следующий уровень собирается из массивов
+        left/right текущего, без очереди по одному узлу.
+        """
+        left, right = self.left, self.right
+        order = array('q')
+        level = [self.root] if self.root != NO_CHILD else []
+        while level:
+            order.extend(level)
+            level = [child for node in level for child in (left[node], right[node]) if child != NO_CHILD]
+        return order
+
+    def values_at(self, indices: array) -> array:
+        """
+        Возвращает значения узлов по массиву индексов (например, результату обхода).
+        """
+        values = self.values
+        return array('q', [values[i] for i in indices])
+
+
+def parse(expression: str) -> ArrayTree:
+    """
+    Разбирает линейно-скобочную запись сразу в ArrayTree, без промежуточных TreeNode.
+
+    Формат тот же, что у construct_tree из 15_lab.py: «8 (4 (2 (1, 3), 6 (5,7)), 12 (10(9,11)))».
+    Первый потомок в скобках становится левым, второй — правым.
+    Стек хранит только цепочку открытых родителей, поэтому его глубина равна высоте дерева.
+    """
+    tree = ArrayTree()
+    parents = []  # Узлы, чьи скобки сейчас открыты
+    last = NO_CHILD  # Последний прочитанный узел — кандидат в родители для «(»
+    left, right = tree.left, tree.right
+
+    for token in _TOKEN.findall(expression):
+        if token == '(':
+            if last == NO_CHILD:
+                raise ValueError("Wrong bracket notation string!")
+            parents.append(last)
+        elif token == ')':
+            if not parents:
+                raise ValueError("Wrong bracket notation string!")
+            last = parents.pop()
+        else:
+            node = tree.add_node(int(token))
+            if parents:
+                parent = parents[-1]
+                if left[parent] == NO_CHILD:
+                    left[parent] = node
+                elif right[parent] == NO_CHILD:
+                    right[parent] = node
+                else:
+                    raise ValueError("Wrong bracket notation string!")
+            elif tree.root == NO_CHILD:
+                tree.root = node
+            else:
+                raise ValueError("Wrong bracket notation string!")
+            last = node
+
+    if parents:
+        raise ValueError("Wrong bracket notation string!")
+    return tree
+
+
+if __name__ == "__main__":
+    expression = "8 (4 (2 (1, 3), 6 (5,7)), 12 ( 10(9,11)))"
+    tree = parse(expression)
+
+    print("Прямой:", *tree.values_at(tree.pre_order()))
+    print("Центарьный:", *tree.values_at(tree.in_order()))
+    print("Концевой:", *tree.values_at(tree.post_order()))
+    print("По уровням:", *tree.values_at(tree.level_order()))
+
+    copy = ArrayTree.from_buffer(tree.to_bytes())
+    print("После сериализации:", *copy.values_at(copy.in_order()))
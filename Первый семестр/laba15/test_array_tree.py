@@ -0,0 +1,87 @@
+import io
+import random
+
+import pytest
+
+from array_tree import ArrayTree, parse
+
+
+def random_tree(rng, depth):
+    # В скобочной записи правый потомок возможен только вместе с левым
+    if depth == 0 or rng.random() < 0.3:
+        return (rng.randint(-99, 99), None, None)
+    left = random_tree(rng, depth - 1)
+    right = random_tree(rng, depth - 1) if rng.random() < 0.7 else None
+    return (rng.randint(-99, 99), left, right)
+
+
+def to_string(node):
+    value, left, right = node
+    if left is None:
+        return str(value)
+    children = to_string(left) + (", " + to_string(right) if right else "")
+    return f"{value} ({children})"
+
+
+def recursive(node, order):
+    if node is None:
+        return []
+    value, left, right = node
+    left, right = recursive(left, order), recursive(right, order)
+    if order == "pre":
+        return [value] + left + right
+    if order == "in":
+        return left + [value] + right
+    return left + right + [value]
+
+
+def by_levels(root):
+    level, result = [root], []
+    while level:
+        result += [node[0] for node in level]
+        level = [child for node in level for child in node[1:] if child]
+    return result
+
+
+def traversals(tree):
+    return [list(tree.values_at(order())) for order in (tree.pre_order, tree.in_order, tree.post_order, tree.level_order)]
+
+
+def test_parse_and_traversals_match_recursive_definitions():
+    rng = random.Random(27)
+    for _ in range(300):
+        root = random_tree(rng, rng.randint(0, 7))
+        tree = parse(to_string(root))
+        assert len(tree) == len(recursive(root, "pre"))
+        assert traversals(tree) == [recursive(root, "pre"), recursive(root, "in"),
+                                    recursive(root, "post"), by_levels(root)]
+
+
+def test_serialization_round_trip():
+    rng = random.Random(270)
+    for _ in range(50):
+        tree = parse(to_string(random_tree(rng, 6)))
+        copy = ArrayTree.from_buffer(tree.to_bytes())
+        assert copy.root == tree.root and traversals(copy) == traversals(tree)
+
+        fileobj = io.BytesIO()
+        tree.dump(fileobj)
+        fileobj.seek(0)
+        assert traversals(ArrayTree.load(fileobj)) == traversals(tree)
+
+
+def test_empty_tree():
+    tree = ArrayTree()
+    assert traversals(tree) == [[], [], [], []]
+    assert traversals(ArrayTree.from_buffer(tree.to_bytes())) == [[], [], [], []]
+
+
+@pytest.mark.parametrize("expression", ["(1)", "1 (2", "1 2", "1 (2, 3, 4)", "1 (2))"])
+def test_malformed_expression(expression):
+    with pytest.raises(ValueError):
+        parse(expression)
+
+
+def test_bad_buffer():
+    with pytest.raises(ValueError):
+        ArrayTree.from_buffer(b"not a tree" * 4)
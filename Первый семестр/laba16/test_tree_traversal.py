@@ -0,0 +1,83 @@
+import random
+
+from tree_traversal import in_order, level_order, morris_in_order, morris_pre_order, post_order, pre_order
+
+
+class Node:
+    def __init__(self, val):
+        self.val = val
+        self.left = None
+        self.right = None
+
+
+def random_tree(rng, n):
+    nodes = [Node(i) for i in range(n)]
+    for i in range(1, n):
+        parent = nodes[rng.randrange(i)]
+        while True:
+            side = rng.choice(("left", "right"))
+            if getattr(parent, side) is None:
+                setattr(parent, side, nodes[i])
+                break
+            parent = getattr(parent, side)
+    return nodes[0] if nodes else None
+
+
+def recursive(node, order):
+    if node is None:
+        return []
+    left, right = recursive(node.left, order), recursive(node.right, order)
+    if order == "pre":
+        return [node.val] + left + right
+    if order == "in":
+        return left + [node.val] + right
+    return left + right + [node.val]
+
+
+def by_levels(root):
+    level, result = [root] if root else [], []
+    while level:
+        result += [node.val for node in level]
+        level = [child for node in level for child in (node.left, node.right) if child]
+    return result
+
+
+def shape(node):
+    return None if node is None else (node.val, shape(node.left), shape(node.right))
+
+
+def values(iterator):
+    return [node.val for node in iterator]
+
+
+def test_traversals_match_recursive_definitions():
+    rng = random.Random(26)
+    for _ in range(300):
+        root = random_tree(rng, rng.randint(0, 30))
+        before = shape(root)
+        assert values(pre_order(root)) == values(morris_pre_order(root)) == recursive(root, "pre")
+        assert values(in_order(root)) == values(morris_in_order(root)) == recursive(root, "in")
+        assert values(post_order(root)) == recursive(root, "post")
+        assert values(level_order(root)) == by_levels(root)
+        assert shape(root) == before
+
+
+def test_morris_restores_tree_when_closed_early():
+    rng = random.Random(260)
+    for _ in range(100):
+        root = random_tree(rng, rng.randint(1, 30))
+        before = shape(root)
+        for traversal in (morris_pre_order, morris_in_order):
+            iterator = traversal(root)
+            for _ in range(rng.randint(0, 5)):
+                next(iterator, None)
+            iterator.close()
+            assert shape(root) == before
+
+
+def test_deep_tree_does_not_hit_recursion_limit():
+    root = current = Node(0)
+    for i in range(1, 100_000):
+        current.left = Node(i)
+        current = current.left
+    assert sum(1 for _ in post_order(root)) == 100_000
@@ -0,0 +1,207 @@
+from collections import deque
+from typing import Iterator, Optional, Any
+
+# Итераторы обхода работают с любыми узлами, у которых есть атрибуты left и right:
+# и с TreeNode из laba15 (значение в .value), и с Node из laba16 (значение в .val).
+# Генераторы возвращают сами узлы, а не значения, поэтому не зависят от имени поля.
+
+
+def pre_order(root: Optional[Any]) -> Iterator[Any]:
+    """
+    Прямой обход (корень -> левый -> правый) без рекурсии.
+
+    Вместо queue.LifoQueue используется обычный список: append/pop не берут блокировку.
+    Память: O(h), где h — высота дерева.
+    """
+    stack = []
+    current = root
+    while current is not None or stack:
+        while current is not None:
+            yield current
+            if current.right is not None:  # Правого потомка откладываем на потом
+                stack.append(current.right)
+            current = current.left
+        if stack:
+            current = stack.pop()
+
+
+def in_order(root: Optional[Any]) -> Iterator[Any]:
+    """
+    Центрированный обход (левый -> корень -> правый) без рекурсии.
+
+    Память: O(h).
+    """
+    stack = []
+    current = root
+    while current is not None or stack:
+        while current is not None:  # Спускаемся до самого левого узла
+            stack.append(current)
+            current = current.left
+        current = stack.pop()
+        yield current
+        current = current.right
+
+
+def post_order(root: Optional[Any]) -> Iterator[Any]:
+    """
+    Концевой обход (левый -> правый -> корень) без рекурсии.
+
+    Хранит последний выданный узел, чтобы понять, пройдено ли уже правое поддерево.
+    Память: O(h).
+    """
+    stack = []
+    current = root
+    last_visited = None
+    while current is not None or stack:
+        while current is not None:
+            stack.append(current)
+            current = current.left
+        top = stack[-1]
+        if top.right is not None and top.right is not last_visited:
+            current = top.right  # Сначала обходим правое поддерево
+        else:
+            last_visited = stack.pop()
+            yield last_visited
+
+
+def level_order(root: Optional[Any]) -> Iterator[Any]:
+    """
+    Обход в ширину (по уровням слева направо).
+
+    Память: O(w), где w — максимальная ширина уровня.
+    """
+    if root is None:
+        return
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left is not None:
+            queue.append(node.left)
+        if node.right is not None:
+            queue.append(node.right)
+
+
+def _morris(root: Optional[Any], pre: bool) -> Iterator[Any]:
+    """
+    Общая часть прямого и центрированного обходов Морриса.
+
+    Во время обхода дерево временно «прошивается»: правый указатель крайнего правого
+    узла левого поддерева ссылается на текущий узел. Если генератор закрыт досрочно,
+    обход доводится до конца без выдачи узлов, чтобы вернуть дерево в исходный вид.
+    """
+    current = root
+    try:
+        while current is not None:
+            if current.left is None:
+                yield current
+                current = current.right
+                continue
+
+            # Ищем предшественника текущего узла в центрированном порядке
+            predecessor = current.left
+            while predecessor.right is not None and predecessor.right is not current:
+                predecessor = predecessor.right
+
+            if predecessor.right is None:
+                if pre:
+                    yield current
+                predecessor.right = current  # Прошиваем дерево
+                current = current.left
+            else:
+                predecessor.right = None  # Снимаем прошивку
+                if not pre:
+                    yield current
+                current = current.right
+    finally:
+        # Досрочное закрытие: проходим остаток дерева молча, снимая все прошивки
+        while current is not None:
+            if current.left is None:
+                current = current.right
+                continue
+            predecessor = current.left
+            while predecessor.right is not None and predecessor.right is not current:
+                predecessor = predecessor.right
+            if predecessor.right is None:
+                predecessor.right = current
+                current = current.left
+            else:
+                predecessor.right = None
+                current = current.right
+
+
+def morris_pre_order(root: Optional[Any]) -> Iterator[Any]:
+    """
+    Прямой обход Морриса: O(1) дополнительной памяти.
+
+    Дерево временно изменяется, поэтому его нельзя читать из других потоков во время обхода.
+    """
+    return _morris(root, pre=True)
+
+
+def morris_in_order(root: Optional[Any]) -> Iterator[Any]:
+    """
+    Центрированный обход Морриса: O(1) дополнительной памяти.
+
+    Дерево временно изменяется, поэтому его нельзя читать из других потоков во время обхода.
+    """
+    return _morris(root, pre=False)
+
+
+if __name__ == "__main__":
+    # Сравнение с исходными реализациями из 15_lab.py и 16_Lab.py
+    import contextlib
+    import importlib.util
+    import os
+    import sys
+    import time
+
+    def load(path: str, name: str):
+        """
+        Загружает модуль по пути (имена файлов лабораторных начинаются с цифры).
+        """
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            spec.loader.exec_module(module)  # 15_lab.py печатает пример при импорте
+        return module
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    lab15 = load(os.path.join(here, '..', 'laba15', '15_lab.py'), 'lab15')
+    lab16 = load(os.path.join(here, '16_Lab.py'), 'lab16')
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+
+    # Полное двоичное дерево: высота log n, поэтому рекурсивные версии не упираются в лимит
+    nodes = [lab16.Node(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    root = nodes[0]
+    for node in nodes:
+        node.value = node.val  # Для функций из 15_lab.py
+    del nodes
+
+    def bench(name: str, func) -> None:
+        start = time.perf_counter()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            func()
+        print(f"{name:<32} {time.perf_counter() - start:8.3f} s")
+
+    def drain(iterator: Iterator[Any]) -> None:
+        for _ in iterator:
+            pass
+
+    print(f"Tree size: {n}")
+    bench("15_lab pre_order_traversal", lambda: lab15.pre_order_traversal(root))
+    bench("15_lab in_order_traversal", lambda: lab15.in_order_traversal(root))
+    bench("15_lab post_order_traversal", lambda: lab15.post_order_traversal(root))
+    bench("16_Lab traverseNonRecursive", root.traverseNonRecursive)
+    bench("pre_order", lambda: drain(pre_order(root)))
+    bench("in_order", lambda: drain(in_order(root)))
+    bench("post_order", lambda: drain(post_order(root)))
+    bench("level_order", lambda: drain(level_order(root)))
+    bench("morris_pre_order", lambda: drain(morris_pre_order(root)))
+    bench("morris_in_order", lambda: drain(morris_in_order(root)))
@@ -1,3 +1,6 @@
+import re
+import sys
+
 class Node: # Класс представляет узел бинарного дерева
     def __init__(self, data):
         self.data = data # Хранит данные узла
@@ -84,15 +87,94 @@ def print_tree(root):
 
 # Вывод конструкции дерева
 def print_tree_format(root):
-    if not root:
-        return
-    print(root.data, end=" ")
-    if root.left or root.right:
-        print("(", end=" ")
-        print_tree_format(root.left)
-        print(", ", end=" ")
-        print_tree_format(root.right)
-        print(")", end=" ")
+    sys.stdout.write(dumps(root))
+
+# Части линейно-скобочной записи по порядку, без рекурсии.
+# Вместо узлов в стек кладём и готовые строки-разделители, чтобы вывести их в нужный момент
+def _bracket_parts(root):
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if item is None:
+            continue
+        if isinstance(item, str):
+            yield item
+            continue
+        yield f"{item.data} "
+        if item.left or item.right:
+            stack.append(") ")
+            stack.append(item.right)
+            stack.append(",  ")
+            stack.append(item.left)
+            stack.append("( ")
+
+# Дерево в виде строки (тот же формат, что печатал print_tree_format)
+def dumps(root):
+    return "".join(_bracket_parts(root))
+
+# Запись дерева в файл: части собираются в пачки, чтобы не делать write на каждый узел
+def dump(root, fileobj, batch_size=65536):
+    batch = []
+    for part in _bracket_parts(root):
+        batch.append(part)
+        if len(batch) >= batch_size:
+            fileobj.write("".join(batch))
+            batch.clear()
+    if batch:
+        fileobj.write("".join(batch))
+
+# Чтение дерева из линейно-скобочной записи сразу в узлы BST (без insert для каждого числа).
+# Для каждого открытого родителя храним, какого потомка заполняем, и допустимые границы,
+# чтобы проверить свойство дерева поиска: слева меньше, справа больше или равно
+def loads(string):
+    root = None
+    last = None  # Последний прочитанный узел
+    stack = []  # [узел, заполняем правого?, нижняя граница, верхняя граница]
+    for token in re.findall(r"-?\d+|[(),]", string):
+        if token == "(":
+            if last is None:
+                raise ValueError("Некорректная линейно-скобочная запись")
+            if stack and stack[-1][1]:
+                low, high = stack[-1][0].data, stack[-1][3]
+            elif stack:
+                low, high = stack[-1][2], stack[-1][0].data
+            else:
+                low, high = None, None
+            stack.append([last, False, low, high])
+            last = None
+        elif token == ",":
+            if not stack or stack[-1][1]:
+                raise ValueError("Некорректная линейно-скобочная запись")
+            stack[-1][1] = True
+            last = None
+        elif token == ")":
+            if not stack:
+                raise ValueError("Некорректная линейно-скобочная запись")
+            last = stack.pop()[0]
+        else:
+            node = Node(int(token))
+            if not stack:
+                if root is not None:
+                    raise ValueError("Некорректная линейно-скобочная запись")
+                root = node
+            else:
+                parent, is_right, low, high = stack[-1]
+                if (parent.right if is_right else parent.left) is not None:
+                    raise ValueError("Некорректная линейно-скобочная запись")
+                if is_right:
+                    low = parent.data
+                else:
+                    high = parent.data
+                if (low is not None and node.data < low) or (high is not None and node.data >= high):
+                    raise ValueError(f"Число {node.data} нарушает порядок дерева поиска")
+                if is_right:
+                    parent.right = node
+                else:
+                    parent.left = node
+            last = node
+    if stack:
+        raise ValueError("Некорректная линейно-скобочная запись")
+    return root
 
 #  Само дерево
 def main():
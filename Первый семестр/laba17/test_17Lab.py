@@ -0,0 +1,76 @@
+import importlib.util
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+# Имя файла с пробелом и скобками, поэтому модуль загружаем по пути
+_spec = importlib.util.spec_from_file_location("lab17", Path(__file__).with_name("17Lab (1).py"))
+lab = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(lab)
+
+
+def build(values):
+    root = None
+    for value in values:
+        root = lab.insert(root, value)
+    return root
+
+
+def shape(node):
+    return None if node is None else (node.data, shape(node.left), shape(node.right))
+
+
+def sorted_values(node):
+    return [] if node is None else sorted_values(node.left) + [node.data] + sorted_values(node.right)
+
+
+def test_dumps_loads_round_trip():
+    rng = random.Random(28)
+    for _ in range(300):
+        root = build([rng.randint(-50, 50) for _ in range(rng.randint(0, 40))])
+        text = lab.dumps(root)
+        assert shape(lab.loads(text)) == shape(root)
+
+        fileobj = io.StringIO()
+        lab.dump(root, fileobj, batch_size=rng.randint(1, 5))
+        assert fileobj.getvalue() == text
+
+
+def test_insert_delete_search_against_sorted_list():
+    rng = random.Random(280)
+    for _ in range(100):
+        values = [rng.randint(0, 30) for _ in range(rng.randint(0, 30))]
+        root = build(values)
+        for _ in range(10):
+            key = rng.randint(0, 30)
+            node, path = lab.search(root, key)
+            assert (node is not None) == (key in values)
+            if node is not None:
+                assert path[-1] == key
+            if key in values:
+                root = lab.delete(root, key)
+                values.remove(key)
+            assert sorted_values(root) == sorted(values)
+
+
+def test_inorder_prints_sorted_values(capsys):
+    values = random.Random(2800).sample(range(1000), 50)
+    lab.inorder(build(values))
+    assert capsys.readouterr().out.split() == [str(value) for value in sorted(values)]
+
+
+def test_deep_tree_round_trip():
+    # Вырожденное дерево-цепочка; insert рекурсивный, поэтому собираем его вручную
+    root = node = lab.Node(0)
+    for value in range(1, 5000):
+        node.right = lab.Node(value)
+        node = node.right
+    assert lab.dumps(lab.loads(lab.dumps(root))) == lab.dumps(root)
+
+
+@pytest.mark.parametrize("text", ["5 ( 7 ,  ) ", "5 ( ,  3 ) ", "5 ( 3 ( ,  6 ) ,  ) ", "5 5", "5 ( 3", "( 5 )", "5 ) "])
+def test_loads_rejects_bad_input(text):
+    with pytest.raises(ValueError):
+        lab.loads(text)